@@ -30,11 +30,21 @@ class MQTTConfig:
     topic_ai_analysis: str = "modax/ai/analysis"
     topic_control_commands: str = "modax/control/commands"
 
+    # AI analysis publish batching (1 = publish every message immediately)
+    publish_batch_size: int = int(os.getenv("MQTT_PUBLISH_BATCH_SIZE", "1"))
+    publish_flush_ms: int = int(os.getenv("MQTT_PUBLISH_FLUSH_MS", "100"))
+
     def validate(self) -> List[str]:
         """Validate MQTT configuration"""
         errors = []
         if self.broker_port < 1 or self.broker_port > 65535:
             errors.append(f"Invalid MQTT_BROKER_PORT: {self.broker_port} (must be 1-65535)")
+        if self.publish_batch_size < 1:
+            errors.append(
+                f"Invalid MQTT_PUBLISH_BATCH_SIZE: {self.publish_batch_size} (must be >= 1)"
+            )
+        if self.publish_flush_ms < 1:
+            errors.append(f"Invalid MQTT_PUBLISH_FLUSH_MS: {self.publish_flush_ms} (must be >= 1)")
         if self.use_tls and not self.ca_certs:
             errors.append("MQTT_USE_TLS is enabled but MQTT_CA_CERTS is not set")
         return errors
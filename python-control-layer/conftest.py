@@ -0,0 +1,47 @@
+"""Shared pytest configuration for Control Layer tests"""
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+# Optional faster event loop for async tests (not available on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def pytest_configure(config):
+    """Register markers used by the suite"""
+    # Provided by pytest-xdist; registered here so runs without it stay quiet
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run all tests of the group on the same xdist worker"
+    )
+
+
+if UVLOOP_AVAILABLE:
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run pytest-asyncio tests on uvloop instead of the default selector loop"""
+        return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def eager_tasks():
+    """
+    Start tasks eagerly on the module's shared event loop (Python 3.12+)
+
+    For modules whose tests run with pytest.mark.asyncio(loop_scope="module").
+    Coroutines that finish without suspending complete inside create_task
+    instead of taking a trip through the ready queue. On older Pythons the
+    loop keeps its default task factory.
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    loop = asyncio.get_running_loop()
+    previous = loop.get_task_factory()
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+    yield
+    loop.set_task_factory(previous)
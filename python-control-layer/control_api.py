@@ -372,7 +372,7 @@ async def get_device_data(
         device_id=latest.device_id,
         timestamp=latest.timestamp,
         motor_currents=latest.motor_currents,
-        vibration=latest.vibration,
+        vibration=dict(latest.vibration),
         temperatures=latest.temperatures,
         safety_status=safety_dict
     )
@@ -401,7 +401,7 @@ async def get_device_history(
             {
                 "timestamp": r.timestamp,
                 "motor_currents": r.motor_currents,
-                "vibration": r.vibration,
+                "vibration": dict(r.vibration),
                 "temperatures": r.temperatures
             } for r in readings
         ]
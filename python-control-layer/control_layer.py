@@ -136,7 +136,7 @@ class ControlLayer:
             raise RuntimeError("Cannot send command: system not in safe state")
 
         command = {
-            "timestamp": int(time.time() * 1000),
+            "timestamp": time.time_ns() // 1_000_000,
             "command_type": command_type,
             "parameters": parameters
         }
@@ -1,63 +1,205 @@
 """Data Aggregator - Collects and aggregates sensor data from field layer"""
-import json
+import logging
+import math
 import time
 from collections import deque
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Union
 import numpy as np
 
+from json_utils import loads
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Vibration axes in column order of the vibration buffer
+VIBRATION_KEYS = ('x', 'y', 'z', 'magnitude')
+
+
+def _window_stats_numpy(rows: np.ndarray):
+    """Per-column mean, population std and max of a (samples, columns) window"""
+    return rows.mean(axis=0, dtype=np.float64), rows.std(axis=0, dtype=np.float64), rows.max(axis=0)
+
+
+def _window_stats_loop(rows: np.ndarray):
+    """Loop form of _window_stats_numpy, compiled with numba when available
+
+    Accumulates in float64 and propagates NaN into the max like numpy.
+    """
+    n, width = rows.shape
+    mean = np.zeros(width, dtype=np.float64)
+    m2 = np.zeros(width, dtype=np.float64)
+    maximum = rows[0].copy()
+    for i in range(n):
+        for j in range(width):
+            value = rows[i, j]
+            mean[j] += value
+            if value > maximum[j] or value != value:
+                maximum[j] = value
+    mean /= n
+    for i in range(n):
+        for j in range(width):
+            delta = rows[i, j] - mean[j]
+            m2[j] += delta * delta
+    return mean, np.sqrt(m2 / n), maximum
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: readings may carry NaN, which fastmath assumes away
+    _window_stats = njit(cache=True)(_window_stats_loop)
+else:
+    _window_stats = _window_stats_numpy
+
+
+class Vibration(Mapping):
+    """
+    Vibration sample of one reading (x, y, z, magnitude).
+
+    A slotted, read-only replacement for the per-reading dict that still
+    supports dict-style access such as vibration['magnitude'] and .get().
+    """
+
+    __slots__ = ('x', 'y', 'z', 'magnitude')
+
+    def __init__(self, x: float, y: float, z: float, magnitude: float):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.magnitude = magnitude
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> 'Vibration':
+        """Create from a payload dict; magnitude is derived from x, y, z if absent"""
+        x, y, z = data['x'], data['y'], data['z']
+        magnitude = data.get('magnitude')
+        if magnitude is None:
+            magnitude = math.sqrt(x * x + y * y + z * z)
+        return cls(x, y, z, magnitude)
+
+    def __getitem__(self, key: str) -> float:
+        if key not in VIBRATION_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(VIBRATION_KEYS)
+
+    def __len__(self) -> int:
+        return len(VIBRATION_KEYS)
+
+    def __repr__(self):
+        return (f"Vibration(x={self.x}, y={self.y}, z={self.z}, "
+                f"magnitude={self.magnitude})")
+
 
 @dataclass
 class SensorReading:
     """Individual sensor reading"""
+    # Hand-written rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('timestamp', 'device_id', 'motor_currents', 'vibration', 'temperatures')
+
     timestamp: float
     device_id: str
     motor_currents: List[float]
-    vibration: Dict[str, float]
+    vibration: Mapping[str, float]  # Vibration from from_json, or a plain dict
     temperatures: List[float]
 
     @classmethod
-    def from_json(cls, data: str) -> 'SensorReading':
-        """Create from JSON string"""
-        obj = json.loads(data)
+    def from_json(cls, data: Union[bytes, str]) -> 'SensorReading':
+        """Create from JSON string or raw payload bytes"""
+        obj = loads(data)
+        # Positional in field order: this runs once per inbound MQTT sample
         return cls(
-            timestamp=obj['timestamp'],
-            device_id=obj['device_id'],
-            motor_currents=obj['motor_currents'],
-            vibration=obj['vibration'],
-            temperatures=obj['temperatures']
+            obj['timestamp'],
+            obj['device_id'],
+            obj['motor_currents'],
+            Vibration.from_dict(obj['vibration']),
+            obj['temperatures']
         )
 
 
-@dataclass
+# SafetyStatus flag bits
+SAFETY_EMERGENCY_STOP = 1 << 0
+SAFETY_DOOR_CLOSED = 1 << 1
+SAFETY_OVERLOAD = 1 << 2
+SAFETY_TEMP_OK = 1 << 3
+SAFETY_FLAGS_MASK = (SAFETY_EMERGENCY_STOP | SAFETY_DOOR_CLOSED
+                     | SAFETY_OVERLOAD | SAFETY_TEMP_OK)
+# Flag pattern of a safe device: door closed and temperature ok only
+SAFETY_SAFE_PATTERN = SAFETY_DOOR_CLOSED | SAFETY_TEMP_OK
+
+
 class SafetyStatus:
-    """Safety system status"""
-    timestamp: float
-    device_id: str
-    emergency_stop: bool
-    door_closed: bool
-    overload_detected: bool
-    temperature_ok: bool
+    """
+    Safety system status
+
+    The four safety conditions are packed into one integer bitmask
+    (SAFETY_* bits), so is_safe() is a single mask comparison. The
+    conditions stay readable as boolean attributes.
+    """
+    __slots__ = ('timestamp', 'device_id', 'flags')
+
+    def __init__(self, timestamp: float, device_id: str, emergency_stop: bool,
+                 door_closed: bool, overload_detected: bool, temperature_ok: bool):
+        self.timestamp = timestamp
+        self.device_id = device_id
+        self.flags = ((SAFETY_EMERGENCY_STOP if emergency_stop else 0)
+                      | (SAFETY_DOOR_CLOSED if door_closed else 0)
+                      | (SAFETY_OVERLOAD if overload_detected else 0)
+                      | (SAFETY_TEMP_OK if temperature_ok else 0))
+
+    @property
+    def emergency_stop(self) -> bool:
+        return bool(self.flags & SAFETY_EMERGENCY_STOP)
+
+    @property
+    def door_closed(self) -> bool:
+        return bool(self.flags & SAFETY_DOOR_CLOSED)
+
+    @property
+    def overload_detected(self) -> bool:
+        return bool(self.flags & SAFETY_OVERLOAD)
+
+    @property
+    def temperature_ok(self) -> bool:
+        return bool(self.flags & SAFETY_TEMP_OK)
 
     @classmethod
-    def from_json(cls, data: str) -> 'SafetyStatus':
-        """Create from JSON string"""
-        obj = json.loads(data)
+    def from_json(cls, data: Union[bytes, str]) -> 'SafetyStatus':
+        """Create from JSON string or raw payload bytes"""
+        obj = loads(data)
+        # Positional in parameter order, as for SensorReading.from_json
         return cls(
-            timestamp=obj['timestamp'],
-            device_id=obj['device_id'],
-            emergency_stop=obj['emergency_stop'],
-            door_closed=obj['door_closed'],
-            overload_detected=obj['overload_detected'],
-            temperature_ok=obj['temperature_ok']
+            obj['timestamp'],
+            obj['device_id'],
+            obj['emergency_stop'],
+            obj['door_closed'],
+            obj['overload_detected'],
+            obj['temperature_ok']
         )
 
     def is_safe(self) -> bool:
         """Check if system is in safe state"""
-        return (not self.emergency_stop
-                and self.door_closed
-                and not self.overload_detected
-                and self.temperature_ok)
+        return (self.flags & SAFETY_FLAGS_MASK) == SAFETY_SAFE_PATTERN
+
+    def __eq__(self, other):
+        if not isinstance(other, SafetyStatus):
+            return NotImplemented
+        return (self.timestamp, self.device_id, self.flags) == \
+            (other.timestamp, other.device_id, other.flags)
+
+    def __repr__(self):
+        return (f"SafetyStatus(timestamp={self.timestamp!r}, device_id={self.device_id!r}, "
+                f"emergency_stop={self.emergency_stop}, door_closed={self.door_closed}, "
+                f"overload_detected={self.overload_detected}, "
+                f"temperature_ok={self.temperature_ok})")
 
 
 @dataclass
@@ -85,6 +227,181 @@ class AggregatedData:
     sample_count: int = 0
 
 
+def _to_aggregated(device_id: str, start_ms: float, end_ms: float, mean: np.ndarray,
+                   std: np.ndarray, maximum: np.ndarray, sample_count: int,
+                   num_motors: int) -> AggregatedData:
+    """Split row-order statistics back into currents, vibration, temperatures"""
+    vib_end = num_motors + len(VIBRATION_KEYS)
+    mean, std, maximum = mean.tolist(), std.tolist(), maximum.tolist()
+
+    return AggregatedData(
+        device_id=device_id,
+        time_window_start=float(start_ms) / 1000.0,
+        time_window_end=float(end_ms) / 1000.0,
+        current_mean=mean[:num_motors],
+        current_std=std[:num_motors],
+        current_max=maximum[:num_motors],
+        vibration_mean=dict(zip(VIBRATION_KEYS, mean[num_motors:vib_end])),
+        vibration_std=dict(zip(VIBRATION_KEYS, std[num_motors:vib_end])),
+        vibration_max=dict(zip(VIBRATION_KEYS, maximum[num_motors:vib_end])),
+        temperature_mean=mean[vib_end:],
+        temperature_max=maximum[vib_end:],
+        sample_count=sample_count
+    )
+
+
+class _SensorColumns:
+    """
+    Ring buffer of one device's readings stored column-wise
+
+    Each field is a preallocated array with one row per slot, so window
+    statistics are single vectorized reductions over the selected rows.
+
+    For the aggregator's default window the newest ``window`` readings are
+    also tracked with running sums and sums of squares of every value, so
+    mean and standard deviation of that window cost O(1) per reading
+    instead of a rescan. The running window assumes readings arrive in
+    timestamp order, as device telemetry does.
+
+    NaN and infinite values are kept out of the sums, since subtracting
+    them again would leave NaN behind for good. Instead each column counts
+    its non-finite values in the window and is rescanned while that count
+    is non-zero.
+    """
+    __slots__ = ('timestamps', 'currents', 'vibration', 'temperatures', 'head', 'count',
+                 'window', 'sum', 'sumsq', 'nonfinite')
+
+    def __init__(self, capacity: int, num_motors: int, num_temps: int):
+        self.timestamps = np.empty(capacity, dtype=np.float64)  # ms
+        self.currents = np.empty((capacity, num_motors), dtype=np.float32)
+        self.vibration = np.empty((capacity, len(VIBRATION_KEYS)), dtype=np.float32)
+        self.temperatures = np.empty((capacity, num_temps), dtype=np.float32)
+        self.head = 0  # Next slot to write
+        self.count = 0
+
+        # Running sums over the newest `window` readings, one entry per value
+        # in row order: currents, vibration axes, temperatures
+        width = num_motors + len(VIBRATION_KEYS) + num_temps
+        self.window = 0
+        self.sum = np.zeros(width, dtype=np.float64)
+        self.sumsq = np.zeros(width, dtype=np.float64)
+        self.nonfinite = np.zeros(width, dtype=np.int64)
+
+    def fits(self, reading: SensorReading) -> bool:
+        """Check the reading has this buffer's motor and temperature counts"""
+        return (len(reading.motor_currents) == self.currents.shape[1]
+                and len(reading.temperatures) == self.temperatures.shape[1])
+
+    def append(self, reading: SensorReading):
+        """Write a reading into the next slot, overwriting the oldest when full"""
+        # Convert every field before writing, so a malformed reading cannot
+        # leave the slot of the oldest reading half overwritten
+        vib = reading.vibration
+        if type(vib) is Vibration:
+            vibration = (vib.x, vib.y, vib.z, vib.magnitude)
+        else:
+            vibration = [vib[key] for key in VIBRATION_KEYS]
+        currents = np.asarray(reading.motor_currents, dtype=np.float32)
+        temperatures = np.asarray(reading.temperatures, dtype=np.float32)
+        timestamp = float(reading.timestamp)
+
+        capacity = len(self.timestamps)
+        if self.window == capacity:
+            # The slot about to be overwritten is still in the running window
+            self._drop_from_window()
+
+        i = self.head
+        self.vibration[i] = vibration
+        self.currents[i] = currents
+        self.temperatures[i] = temperatures
+        self.timestamps[i] = timestamp
+
+        self.head = (i + 1) % capacity
+        if self.count < capacity:
+            self.count += 1
+
+        row = self._finite_row(i)
+        self.sum += row
+        self.sumsq += row * row
+        self.window += 1
+
+    def evict_before(self, cutoff_ms: float):
+        """Drop the oldest readings while they are older than cutoff_ms"""
+        capacity = len(self.timestamps)
+        while self.count and self.timestamps[(self.head - self.count) % capacity] < cutoff_ms:
+            if self.window == self.count:
+                self._drop_from_window()
+            self.count -= 1
+
+    def advance_window(self, cutoff_ms: float) -> int:
+        """
+        Remove readings older than cutoff_ms from the running window
+
+        Returns:
+            Number of readings left in the running window
+        """
+        capacity = len(self.timestamps)
+        while self.window and self.timestamps[(self.head - self.window) % capacity] < cutoff_ms:
+            self._drop_from_window()
+        return self.window
+
+    def _drop_from_window(self):
+        """Subtract the oldest reading of the running window from the sums"""
+        if self.window == 1:
+            # Restart from exact zeros so rounding error cannot accumulate
+            self.sum.fill(0.0)
+            self.sumsq.fill(0.0)
+            self.nonfinite.fill(0)
+        else:
+            row = self._finite_row((self.head - self.window) % len(self.timestamps), -1)
+            self.sum -= row
+            self.sumsq -= row * row
+        self.window -= 1
+
+    def _finite_row(self, slot: int, sign: int = 1) -> np.ndarray:
+        """
+        Values of a slot with non-finite entries zeroed for the running sums
+
+        Args:
+            slot: Slot index to read
+            sign: +1 when the row enters the window, -1 when it leaves
+
+        Returns:
+            The row as float64, with NaN and infinities replaced by 0
+        """
+        row = self.rows(slot).astype(np.float64)
+        finite = np.isfinite(row)
+        if finite.all():
+            return row
+        self.nonfinite += sign * ~finite
+        return np.where(finite, row, 0.0)
+
+    def window_mean_std(self):
+        """Mean and population standard deviation of the running window"""
+        mean = self.sum / self.window
+        variance = np.maximum(self.sumsq / self.window - mean * mean, 0.0)
+        std = np.sqrt(variance)
+        poisoned = np.flatnonzero(self.nonfinite)
+        if len(poisoned):
+            # Columns holding NaN/inf fall back to a rescan of the window
+            rows = self.rows(self.slots(self.window))[:, poisoned]
+            mean[poisoned] = rows.mean(axis=0, dtype=np.float64)
+            std[poisoned] = rows.std(axis=0, dtype=np.float64)
+        return mean, std
+
+    def rows(self, slots) -> np.ndarray:
+        """All values of the given slot(s) in row order"""
+        return np.concatenate(
+            (self.currents[slots], self.vibration[slots], self.temperatures[slots]), axis=-1
+        )
+
+    def slots(self, count: Optional[int] = None) -> np.ndarray:
+        """Slot indices of the newest count readings (default all), oldest first"""
+        if count is None:
+            count = self.count
+        return np.arange(self.head - count, self.head) % len(self.timestamps)
+
+
 class DataAggregator:
     """Aggregates sensor data for AI analysis"""
 
@@ -96,6 +413,9 @@ class DataAggregator:
         self.sensor_data: Dict[str, deque] = {}
         self.safety_status: Dict[str, SafetyStatus] = {}
 
+        # Column-wise copies of the same readings for aggregation
+        self._columns: Dict[str, _SensorColumns] = {}
+
     def add_sensor_reading(self, reading: SensorReading):
         """Add a new sensor reading"""
         device_id = reading.device_id
@@ -104,10 +424,30 @@ class DataAggregator:
             self.sensor_data[device_id] = deque(maxlen=self.max_points)
 
         self.sensor_data[device_id].append(reading)
+        self._append_columns(reading)
 
         # Remove old data outside the window
         self._cleanup_old_data(device_id)
 
+    def _append_columns(self, reading: SensorReading):
+        """Store a reading in its device's column buffer"""
+        columns = self._columns.get(reading.device_id)
+        if columns is None or not columns.fits(reading):
+            if columns is not None:
+                logger.warning(
+                    f"Sensor layout of {reading.device_id} changed, "
+                    f"restarting aggregation buffer"
+                )
+            columns = _SensorColumns(
+                self.max_points, len(reading.motor_currents), len(reading.temperatures)
+            )
+            self._columns[reading.device_id] = columns
+
+        try:
+            columns.append(reading)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping malformed reading from {reading.device_id}: {e}")
+
     def update_safety_status(self, status: SafetyStatus):
         """Update safety status for a device"""
         self.safety_status[status.device_id] = status
@@ -120,7 +460,16 @@ class DataAggregator:
         """Check if all devices are in safe state"""
         if not self.safety_status:
             return False
-        return all(status.is_safe() for status in self.safety_status.values())
+
+        # Safe only if every device has door/temperature bits set (AND over
+        # all flags) and no device has estop/overload set (OR over all flags)
+        all_set = SAFETY_FLAGS_MASK
+        any_set = 0
+        for status in self.safety_status.values():
+            all_set &= status.flags
+            any_set |= status.flags
+        return ((all_set & SAFETY_SAFE_PATTERN) == SAFETY_SAFE_PATTERN
+                and not any_set & (SAFETY_EMERGENCY_STOP | SAFETY_OVERLOAD))
 
     def aggregate_for_ai(self, device_id: str,
                          window_seconds: Optional[int] = None) -> Optional[AggregatedData]:
@@ -129,103 +478,125 @@ class DataAggregator:
         Returns statistical summaries suitable for ML models.
 
         Performance optimizations:
-        - Uses numpy array operations for vectorized computation
-        - Pre-allocates arrays for better memory efficiency
-        - Single-pass data extraction
+        - Readings are kept column-wise in a preallocated ring buffer
+        - For the default window, mean and std come from running sums
+          maintained on insert and eviction (O(1) per reading)
+        - Other windows are selected with one mask over the timestamp column
+          and reduced in one kernel (numba-compiled when installed)
         """
-        if device_id not in self.sensor_data or not self.sensor_data[device_id]:
+        columns = self._columns.get(device_id)
+        if columns is None or not columns.count:
+            return None
+
+        # Validate dimensions to prevent empty reductions
+        num_motors = columns.currents.shape[1]
+        num_temps = columns.temperatures.shape[1]
+        if num_motors <= 0 or num_temps <= 0:
             return None
 
         window = window_seconds or self.window_size
-        current_time = time.time()
-        cutoff_time = current_time - window
+        cutoff_ms = time.time_ns() // 1_000_000 - window * 1000
+
+        if window == self.window_size:
+            slots = columns.slots(columns.advance_window(cutoff_ms))
+            if not len(slots):
+                return None
+            mean, std = columns.window_mean_std()
+            maximum = columns.rows(slots).max(axis=0)
+        else:
+            # Filter data within time window, oldest first
+            slots = columns.slots()
+            slots = slots[columns.timestamps[slots] >= cutoff_ms]
+            if not len(slots):
+                return None
+            mean, std, maximum = _window_stats(columns.rows(slots))
+
+        return _to_aggregated(
+            device_id, columns.timestamps[slots[0]], columns.timestamps[slots[-1]],
+            mean, std, maximum, len(slots), num_motors
+        )
 
-        # Filter data within time window
-        recent_data = [r for r in self.sensor_data[device_id]
-                       if r.timestamp / 1000.0 >= cutoff_time]  # Convert ms to seconds
+    def aggregate_buckets(self, device_id: str, bucket_seconds: float = 1.0,
+                          window_seconds: Optional[int] = None) -> List[AggregatedData]:
+        """
+        Aggregate recent sensor data into consecutive time buckets.
 
-        if not recent_data:
-            return None
+        Buckets start at the oldest reading in the window and are
+        bucket_seconds wide; empty buckets are omitted. All buckets are
+        reduced together with np.add.reduceat / np.maximum.reduceat.
 
-        # Pre-determine array dimensions for efficiency
-        num_samples = len(recent_data)
-        num_motors = len(recent_data[0].motor_currents)
-        num_temps = len(recent_data[0].temperatures)
+        Args:
+            device_id: Device to aggregate
+            bucket_seconds: Width of each bucket
+            window_seconds: Time window to cover (default: window size)
 
-        # Validate dimensions before allocation to prevent errors
-        if num_samples <= 0 or num_motors <= 0 or num_temps <= 0:
-            return None
+        Returns:
+            One AggregatedData per non-empty bucket, oldest first
+        """
+        columns = self._columns.get(device_id)
+        if columns is None or not columns.count or bucket_seconds <= 0:
+            return []
 
-        # Pre-allocate numpy arrays for better performance
-        currents_array = np.zeros((num_samples, num_motors), dtype=np.float32)
-        vibrations_array = np.zeros((num_samples, 4), dtype=np.float32)  # x, y, z, magnitude
-        temperatures_array = np.zeros((num_samples, num_temps), dtype=np.float32)
-
-        # Single-pass data extraction into pre-allocated arrays
-        for i, reading in enumerate(recent_data):
-            currents_array[i] = reading.motor_currents
-            vibrations_array[i] = [
-                reading.vibration['x'],
-                reading.vibration['y'],
-                reading.vibration['z'],
-                reading.vibration['magnitude']
-            ]
-            temperatures_array[i] = reading.temperatures
-
-        # Calculate statistics using vectorized numpy operations
-        aggregated = AggregatedData(
-            device_id=device_id,
-            time_window_start=recent_data[0].timestamp / 1000.0,
-            time_window_end=recent_data[-1].timestamp / 1000.0,
-            sample_count=num_samples
-        )
+        num_motors = columns.currents.shape[1]
+        if num_motors <= 0 or columns.temperatures.shape[1] <= 0:
+            return []
 
-        # Current statistics - vectorized computation
-        aggregated.current_mean = currents_array.mean(axis=0).tolist()
-        aggregated.current_std = currents_array.std(axis=0).tolist()
-        aggregated.current_max = currents_array.max(axis=0).tolist()
-
-        # Vibration statistics - vectorized computation
-        vib_keys = ['x', 'y', 'z', 'magnitude']
-        aggregated.vibration_mean = {
-            key: float(vibrations_array[:, i].mean())
-            for i, key in enumerate(vib_keys)
-        }
-        aggregated.vibration_std = {
-            key: float(vibrations_array[:, i].std())
-            for i, key in enumerate(vib_keys)
-        }
-        aggregated.vibration_max = {
-            key: float(vibrations_array[:, i].max())
-            for i, key in enumerate(vib_keys)
-        }
-
-        # Temperature statistics - vectorized computation
-        aggregated.temperature_mean = temperatures_array.mean(axis=0).tolist()
-        aggregated.temperature_max = temperatures_array.max(axis=0).tolist()
-
-        return aggregated
+        window = window_seconds or self.window_size
+        cutoff_ms = time.time_ns() // 1_000_000 - window * 1000
+        slots = columns.slots()
+        slots = slots[columns.timestamps[slots] >= cutoff_ms]
+        if not len(slots):
+            return []
+
+        timestamps = columns.timestamps[slots]
+        rows = columns.rows(slots).astype(np.float64)
+
+        # Bucket index per reading; a bucket starts wherever the index changes
+        bucket_ids = (timestamps - timestamps[0]) // (bucket_seconds * 1000.0)
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(bucket_ids)) + 1))
+        ends = np.append(starts[1:], len(slots)) - 1
+        counts = (ends - starts + 1)[:, None]
+
+        mean = np.add.reduceat(rows, starts, axis=0) / counts
+        sumsq = np.add.reduceat(rows * rows, starts, axis=0) / counts
+        std = np.sqrt(np.maximum(sumsq - mean * mean, 0.0))
+        maximum = np.maximum.reduceat(rows, starts, axis=0)
+
+        return [
+            _to_aggregated(device_id, timestamps[first], timestamps[last],
+                           mean[i], std[i], maximum[i], int(last - first + 1), num_motors)
+            for i, (first, last) in enumerate(zip(starts, ends))
+        ]
 
     def get_recent_readings(self, device_id: str, count: int = 100) -> List[SensorReading]:
         """Get most recent N readings for a device"""
-        if device_id not in self.sensor_data:
+        data = self.sensor_data.get(device_id)
+        if data is None:
             return []
+        if count <= 0:
+            return list(data)[-count:]
 
-        data = list(self.sensor_data[device_id])
-        return data[-count:]
+        # Walk only the newest count entries instead of copying the buffer
+        recent = list(islice(reversed(data), count))
+        recent.reverse()
+        return recent
 
     def _cleanup_old_data(self, device_id: str):
         """Remove data outside the time window"""
         if device_id not in self.sensor_data:
             return
 
-        current_time = time.time()
-        cutoff_time = current_time - (self.window_size * 10)  # Keep 10x window for history
+        # Keep 10x window for history; compared in ms like the timestamps
+        cutoff_ms = time.time_ns() // 1_000_000 - self.window_size * 10_000
 
         data = self.sensor_data[device_id]
-        while data and data[0].timestamp / 1000.0 < cutoff_time:
+        while data and data[0].timestamp < cutoff_ms:
             data.popleft()
 
+        columns = self._columns.get(device_id)
+        if columns is not None:
+            columns.evict_before(cutoff_ms)
+
     def get_device_ids(self) -> List[str]:
         """Get all known device IDs"""
         return list(self.sensor_data.keys())
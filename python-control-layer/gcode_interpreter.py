@@ -1,14 +1,114 @@
 """G-code Interpreter - Executes G-code programs with control flow support"""
 import logging
-from typing import Dict, List, Optional, Tuple
+import sys
+from collections import deque
+from collections.abc import Mapping, MutableMapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
 from gcode_parser import GCodeParser, GCodeCommand
 
 logger = logging.getLogger(__name__)
 
+# Numeric macro variables #0..#9999 live in a dense array
+NUMERIC_VARIABLE_SLOTS = 10000
+
+# Opcodes precompiled per program line for execute_program
+OP_NEXT = 0  # Plain command or label, continue with the next line
+OP_GOTO = 1  # Jump to a resolved label
+OP_GOSUB = 2  # Push return address and jump
+OP_MACRO = 3  # Macro call (G65/G66, O-code)
+OP_RETURN = 4  # M99 return from subroutine
+OP_END = 5  # M02/M30 program end
+OP_GENERIC = 6  # Anything else, executed through the generic path
+
+END_M_CODES = ('M02', 'M30')
+
+# Outcome of one executed line: keep going, stop, or stop after recording it
+FLOW_CONTINUE = 0
+FLOW_STOP = 1
+FLOW_END = 2
+
+# Most recent executed lines kept in the execution log
+EXECUTION_LOG_SIZE = 10000
+
+
+class MacroVariables(MutableMapping):
+    """Macro variable store keyed by names like '#100' or '#A'
+
+    Numeric variables are kept in a fixed float64 array indexed by their
+    number; named ones fall back to a dict.
+    """
+
+    __slots__ = ('_values', '_defined', '_named')
+
+    def __init__(self):
+        self._values = np.zeros(NUMERIC_VARIABLE_SLOTS, dtype=np.float64)
+        self._defined = np.zeros(NUMERIC_VARIABLE_SLOTS, dtype=bool)
+        self._named: Dict[str, float] = {}
+
+    @staticmethod
+    def _slot(name: str) -> Optional[int]:
+        """Return the array slot for a numeric variable name, else None"""
+        number = name[1:]
+        if name[:1] == '#' and number.isdigit():
+            index = int(number)
+            if index < NUMERIC_VARIABLE_SLOTS:
+                return index
+        return None
+
+    def __getitem__(self, name: str) -> float:
+        index = self._slot(name)
+        if index is None:
+            return self._named[name]
+        if not self._defined[index]:
+            raise KeyError(name)
+        return float(self._values[index])
+
+    def __setitem__(self, name: str, value: float):
+        index = self._slot(name)
+        if index is None:
+            self._named[name] = value
+        else:
+            self._values[index] = value
+            self._defined[index] = True
+
+    def __delitem__(self, name: str):
+        index = self._slot(name)
+        if index is None:
+            del self._named[name]
+        elif self._defined[index]:
+            self._defined[index] = False
+            self._values[index] = 0.0
+        else:
+            raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in np.flatnonzero(self._defined):
+            yield f"#{index}"
+        yield from self._named
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._defined)) + len(self._named)
+
+    def clear(self):
+        """Remove all variables"""
+        self._values.fill(0.0)
+        self._defined.fill(False)
+        self._named.clear()
+
 
 class InterpreterState:
     """Maintains interpreter execution state"""
 
+    __slots__ = (
+        'current_line', 'call_stack', 'variables', 'labels',
+        'execution_count', 'max_execution_count',
+    )
+
     def __init__(self):
         """
         Initialize interpreter state
@@ -18,7 +118,7 @@ class InterpreterState:
         """
         self.current_line: int = 0
         self.call_stack: List[int] = []  # For GOSUB/RETURN
-        self.variables: Dict[str, float] = {}  # Macro variables
+        self.variables = MacroVariables()  # Macro variables
         self.labels: Dict[str, int] = {}  # Label name -> line number
         self.execution_count: int = 0
         self.max_execution_count: int = 100000  # Prevent infinite loops
@@ -32,6 +132,77 @@ class InterpreterState:
         self.execution_count = 0
 
 
+@dataclass(frozen=True)
+class CompiledProgram:
+    """Parsed program with resolved labels and opcodes, shared across runs"""
+    # Hand-written rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('commands', 'ops', 'op_args', 'labels')
+
+    commands: Tuple[GCodeCommand, ...]
+    ops: np.ndarray  # read-only np.int8 opcode per command
+    op_args: Tuple[int, ...]  # jump target per command, -1 if none/unresolved
+    labels: Mapping[str, int]  # label name -> command index
+
+
+def _build_labels(program: Sequence[GCodeCommand]) -> Dict[str, int]:
+    """Build a table of all labels in a program
+
+    Built once per compile so GOTO/GOSUB resolve with a single dict lookup.
+    Label names are interned, as are jump targets in the parser.
+    """
+    labels: Dict[str, int] = {}
+
+    for idx, cmd in enumerate(program):
+        if cmd.is_label():
+            labels[sys.intern(cmd.label)] = idx
+            logger.debug(f"Label '{cmd.label}' at line {idx}")
+
+        # Also recognize N-numbers as labels
+        if cmd.n_number is not None:
+            label_name = sys.intern(f"N{cmd.n_number}")
+            labels[label_name] = idx
+            logger.debug(f"N-number '{label_name}' at line {idx}")
+
+    return labels
+
+
+def _compile_ops(program: Sequence[GCodeCommand],
+                 labels: Mapping[str, int]) -> Tuple[np.ndarray, List[int]]:
+    """Precompile a program into opcodes and jump targets
+
+    Jump targets are resolved against labels; -1 marks a target that does
+    not exist.
+    """
+    ops = np.empty(len(program), dtype=np.int8)
+    args = [-1] * len(program)
+
+    for idx, cmd in enumerate(program):
+        is_return = 'M99' in cmd.m_codes
+        is_end = any(m in cmd.m_codes for m in END_M_CODES)
+
+        if cmd.is_control_flow():
+            if is_return or is_end:
+                ops[idx] = OP_GENERIC
+            elif cmd.goto_target:
+                ops[idx] = OP_GOTO
+                args[idx] = labels.get(cmd.goto_target, -1)
+            else:
+                ops[idx] = OP_GOSUB
+                args[idx] = labels.get(cmd.gosub_target, -1)
+        elif cmd.is_macro_call():
+            ops[idx] = OP_GENERIC if is_return or is_end else OP_MACRO
+        elif is_return and is_end:
+            ops[idx] = OP_GENERIC
+        elif is_return:
+            ops[idx] = OP_RETURN
+        elif is_end:
+            ops[idx] = OP_END
+        else:
+            ops[idx] = OP_NEXT
+
+    return ops, args
+
+
 class GCodeInterpreter:
     """Interprets and executes G-code programs with control flow"""
 
@@ -44,10 +215,50 @@ class GCodeInterpreter:
         self.parser = GCodeParser()
         self.state = InterpreterState()
         self.program: List[GCodeCommand] = []
-        self.execution_log: List[str] = []
+        # (line index, command) pairs, formatted on demand by get_execution_log
+        self.execution_log: Deque[Tuple[int, GCodeCommand]] = deque(maxlen=EXECUTION_LOG_SIZE)
+
+        # Per-line opcodes and jump targets, rebuilt with the label table
+        self._ops = np.empty(0, dtype=np.int8)
+        self._op_args: Sequence[int] = ()
 
         logger.info("G-code Interpreter initialized")
 
+    def compile(self, program_text: str) -> CompiledProgram:
+        """Parse a program and resolve its labels and opcodes once
+
+        The result is read-only and can be run any number of times with
+        execute().
+
+        Args:
+            program_text: Complete G-code program as string
+
+        Returns:
+            Compiled program
+        """
+        commands = self.parser.parse_program(program_text)
+        labels = _build_labels(commands)
+        ops, op_args = _compile_ops(commands, labels)
+        ops.flags.writeable = False
+        return CompiledProgram(
+            commands=tuple(commands),
+            ops=ops,
+            op_args=tuple(op_args),
+            labels=MappingProxyType(labels),
+        )
+
+    def load_compiled(self, compiled: CompiledProgram):
+        """Make a compiled program current and reset the interpreter state
+
+        Args:
+            compiled: Program returned by compile()
+        """
+        self.program = list(compiled.commands)
+        self.state.reset()
+        self.state.labels.update(compiled.labels)
+        self._ops = compiled.ops
+        self._op_args = compiled.op_args
+
     def load_program(self, program_text: str) -> bool:
         """Load and preprocess a G-code program
 
@@ -58,34 +269,41 @@ class GCodeInterpreter:
             True if program loaded successfully
         """
         try:
-            self.program = self.parser.parse_program(program_text)
-            self.state.reset()
-
-            # Build label table
-            self._build_label_table()
+            self.load_compiled(self.compile(program_text))
 
             logger.info(f"Program loaded: {len(self.program)} commands, "
-                       f"{len(self.state.labels)} labels")
+                        f"{len(self.state.labels)} labels")
             return True
 
         except Exception as e:
             logger.error(f"Failed to load program: {e}")
             return False
 
+    def execute(self, compiled: CompiledProgram, max_commands: int = 10000) -> List[GCodeCommand]:
+        """Run a compiled program from the start with fresh state
+
+        The compiled program is not modified, so it can be reused for the
+        next workpiece without parsing again.
+
+        Args:
+            compiled: Program returned by compile()
+            max_commands: Maximum number of commands to execute
+
+        Returns:
+            List of executed commands
+        """
+        self.load_compiled(compiled)
+        self.execution_log.clear()
+        return self.execute_program(max_commands)
+
     def _build_label_table(self):
-        """Build a table of all labels in the program"""
+        """Rebuild the label table for the loaded program"""
         self.state.labels.clear()
+        self.state.labels.update(_build_labels(self.program))
 
-        for idx, cmd in enumerate(self.program):
-            if cmd.is_label():
-                self.state.labels[cmd.label] = idx
-                logger.debug(f"Label '{cmd.label}' at line {idx}")
-
-            # Also recognize N-numbers as labels
-            if cmd.n_number is not None:
-                label_name = f"N{cmd.n_number}"
-                self.state.labels[label_name] = idx
-                logger.debug(f"N-number '{label_name}' at line {idx}")
+    def _compile_program(self):
+        """Precompile the loaded program against the current label table"""
+        self._ops, self._op_args = _compile_ops(self.program, self.state.labels)
 
     def execute_next_command(self) -> Tuple[Optional[GCodeCommand], bool]:
         """Execute the next command in the program
@@ -110,10 +328,13 @@ class GCodeInterpreter:
         cmd = self.program[self.state.current_line]
 
         # Log execution
-        log_msg = f"Line {self.state.current_line}: {cmd.raw_line}"
-        self.execution_log.append(log_msg)
-        logger.debug(log_msg)
+        self.execution_log.append((self.state.current_line, cmd))
+        logger.debug("Line %d: %s", self.state.current_line, cmd.raw_line)
+
+        return self._dispatch(cmd)
 
+    def _dispatch(self, cmd: GCodeCommand) -> Tuple[GCodeCommand, bool]:
+        """Execute the command at the current line"""
         # Handle control flow
         if cmd.is_control_flow():
             return self._handle_control_flow(cmd)
@@ -137,26 +358,29 @@ class GCodeInterpreter:
         # GOTO - Jump to label
         if cmd.goto_target:
             target = cmd.goto_target
-            if target not in self.state.labels:
+            try:
+                self.state.current_line = self.state.labels[target]
+            except KeyError:
                 logger.error(f"GOTO target '{target}' not found")
                 return cmd, False
 
-            self.state.current_line = self.state.labels[target]
-            logger.debug(f"GOTO {target} -> line {self.state.current_line}")
+            logger.debug("GOTO %s -> line %d", target, self.state.current_line)
             return cmd, True
 
         # GOSUB - Call subroutine
         if cmd.gosub_target:
             target = cmd.gosub_target
-            if target not in self.state.labels:
+            try:
+                jump_line = self.state.labels[target]
+            except KeyError:
                 logger.error(f"GOSUB target '{target}' not found")
                 return cmd, False
 
             # Push return address onto call stack
             self.state.call_stack.append(self.state.current_line + 1)
-            self.state.current_line = self.state.labels[target]
-            logger.debug(f"GOSUB {target} -> line {self.state.current_line}, "
-                        f"return to {self.state.call_stack[-1]}")
+            self.state.current_line = jump_line
+            logger.debug("GOSUB %s -> line %d, return to %d",
+                         target, jump_line, self.state.call_stack[-1])
             return cmd, True
 
         return cmd, True
@@ -201,29 +425,112 @@ class GCodeInterpreter:
             List of executed commands
         """
         executed_commands = []
+        if len(self._ops) != len(self.program):
+            self._compile_program()
+
+        state = self.state
+        program = self.program
+        ops = self._ops.tolist()
+        op_args = self._op_args
+        execution_log = self.execution_log
+        end_line = len(program)
 
         while len(executed_commands) < max_commands:
-            cmd, should_continue = self.execute_next_command()
+            # Check execution limit
+            state.execution_count += 1
+            if state.execution_count > state.max_execution_count:
+                logger.error("Maximum execution count exceeded - possible infinite loop")
+                break
 
-            if cmd is None or not should_continue:
+            pc = state.current_line
+            if pc >= end_line:
+                logger.info("Program execution complete")
                 break
 
-            # Check for M99 (return from subroutine)
-            if 'M99' in cmd.m_codes:
-                if not self.handle_return():
+            cmd = program[pc]
+            execution_log.append((pc, cmd))
+            logger.debug("Line %d: %s", pc, cmd.raw_line)
+
+            op = ops[pc]
+            if op == OP_NEXT:
+                # Most lines are plain commands, keep them off the call path
+                state.current_line = pc + 1
+            else:
+                cmd, flow = self._execute_op(op, pc, cmd, op_args[pc])
+                if flow != FLOW_CONTINUE:
+                    if flow == FLOW_END:
+                        executed_commands.append(cmd)
                     break
 
-            # Check for program end (M02, M30)
-            if any(m in cmd.m_codes for m in ['M02', 'M30']):
-                logger.info(f"Program end: {cmd.m_codes}")
-                executed_commands.append(cmd)
-                break
-
             executed_commands.append(cmd)
 
         logger.info(f"Executed {len(executed_commands)} commands")
         return executed_commands
 
+    def _execute_op(self, op: int, pc: int, cmd: GCodeCommand,
+                    target: int) -> Tuple[GCodeCommand, int]:
+        """Execute one control-flow or generic line of execute_program
+
+        Args:
+            op: Precompiled opcode of the line (anything but OP_NEXT)
+            pc: Index of the line
+            cmd: Command on the line
+            target: Resolved jump target, -1 if none/unresolved
+
+        Returns:
+            Tuple of (executed command, FLOW_* outcome)
+        """
+        state = self.state
+        if op == OP_GOTO:
+            if target < 0:
+                logger.error(f"GOTO target '{cmd.goto_target}' not found")
+                return cmd, FLOW_STOP
+            state.current_line = target
+        elif op == OP_GOSUB:
+            if target < 0:
+                logger.error(f"GOSUB target '{cmd.gosub_target}' not found")
+                return cmd, FLOW_STOP
+            state.call_stack.append(pc + 1)
+            state.current_line = target
+        elif op == OP_MACRO:
+            self._handle_macro_call(cmd)
+        elif op == OP_RETURN:
+            state.current_line = pc + 1
+            if not self.handle_return():
+                return cmd, FLOW_STOP
+        elif op == OP_END:
+            state.current_line = pc + 1
+            logger.info(f"Program end: {cmd.m_codes}")
+            return cmd, FLOW_END
+        else:
+            return self._execute_generic(cmd)
+        return cmd, FLOW_CONTINUE
+
+    def _execute_generic(self, cmd: GCodeCommand) -> Tuple[GCodeCommand, int]:
+        """Execute a line through the generic dispatch path
+
+        Args:
+            cmd: Command to execute
+
+        Returns:
+            Tuple of (executed command, FLOW_* outcome)
+        """
+        cmd, should_continue = self._dispatch(cmd)
+        if not should_continue:
+            return cmd, FLOW_STOP
+
+        # Check for M99 (return from subroutine)
+        if 'M99' in cmd.m_codes:
+            if not self.handle_return():
+                return cmd, FLOW_STOP
+
+        # Check for program end (M02, M30)
+        if any(m in cmd.m_codes for m in END_M_CODES):
+            logger.info(f"Program end: {cmd.m_codes}")
+            return cmd, FLOW_END
+
+        return cmd, FLOW_CONTINUE
+
     def get_variable(self, var_name: str) -> Optional[float]:
         """Get value of a variable"""
         return self.state.variables.get(var_name)
@@ -234,11 +541,16 @@ class GCodeInterpreter:
         logger.debug(f"Variable {var_name} = {value}")
 
     def get_execution_log(self) -> List[str]:
-        """Get the execution log"""
-        return self.execution_log.copy()
+        """Get the execution log
+
+        Returns:
+            Formatted entries for the most recent executed lines
+        """
+        return [f"Line {line}: {cmd.raw_line}" for line, cmd in self.execution_log]
 
     def reset(self):
         """Reset interpreter state"""
         self.state.reset()
         self.execution_log.clear()
+        self._compile_program()
         logger.info("Interpreter reset")
@@ -1,11 +1,33 @@
 """G-code Parser - Parses and interprets CNC G-code commands"""
+import functools
 import re
+import sys
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from enum import Enum
+from types import MappingProxyType
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct line texts kept by the parse cache
+PARSE_CACHE_SIZE = 4096
+
+# G-code groups checked by GCodeParser.validate_command
+_MOTION_CODES = frozenset(('G00', 'G0', 'G01', 'G1', 'G02', 'G2', 'G03', 'G3'))
+_ARC_CODES = frozenset(('G02', 'G2', 'G03', 'G3'))
+
+# Precompiled patterns used by GCodeParser.parse_line
+_GOTO_RE = re.compile(r'GOTO\s+(\w+)')
+_GOSUB_RE = re.compile(r'GOSUB\s+(\w+)')
+_LABEL_RE = re.compile(r'^:?([A-Z][A-Z0-9_]*):?\s*$')
+_CODE_PREFIX_RE = re.compile(r'^[GMNO]\d')
+_O_CODE_RE = re.compile(r'^O(\d+)\s*$')
+_N_RE = re.compile(r'N(\d+)')
+_WORD_RE = re.compile(r'([A-Z])([+-]?\d*\.?\d+)')
+_INT_RE = re.compile(r'\d+')
+
 
 class GCodeType(Enum):
     """G-code types"""
@@ -27,6 +49,12 @@ class GCodeType(Enum):
 class GCodeCommand:
     """Represents a parsed G-code command"""
 
+    __slots__ = (
+        'line_number', 'raw_line', 'comment', 'g_codes', 'm_codes', 'parameters',
+        'n_number', 'tool_number', 'label', 'goto_target', 'gosub_target',
+        'macro_call', 'macro_params',
+    )
+
     def __init__(self, line_number: int, raw_line: str):
         self.line_number = line_number
         self.raw_line = raw_line.strip()
@@ -109,11 +137,247 @@ class GCodeCommand:
         return f"GCodeCommand({', '.join(parts)})"
 
 
+def _parse_command(line: str) -> Optional[GCodeCommand]:
+    """Parse a single stripped line of G-code into a template command"""
+    cmd = GCodeCommand(0, line)
+
+    # Remove comments (both styles: parentheses and semicolon)
+    start = line.find('(')
+    if start >= 0:
+        end = line.find(')', start + 1)
+        if end >= 0:
+            cmd.comment = line[start + 1:end].strip()
+        line = line[:start]
+    else:
+        start = line.find(';')
+        if start >= 0:
+            cmd.comment = line[start + 1:].strip()
+            line = line[:start]
+
+    # Remove whitespace
+    line = line.strip().upper()
+
+    # Empty line or comment-only line
+    if not line:
+        return None
+
+    # Check for GOTO (control flow)
+    if 'GOTO' in line:
+        goto_match = _GOTO_RE.search(line)
+        if goto_match:
+            cmd.goto_target = sys.intern(goto_match.group(1))
+            logger.debug(f"GOTO detected: target={cmd.goto_target}")
+
+    # Check for GOSUB (subroutine call)
+    if 'GOSUB' in line:
+        gosub_match = _GOSUB_RE.search(line)
+        if gosub_match:
+            cmd.gosub_target = sys.intern(gosub_match.group(1))
+            logger.debug(f"GOSUB detected: target={cmd.gosub_target}")
+
+    # Check for labels (e.g., :LABEL or NLABEL) - must be standalone
+    # Exclude G-codes, M-codes, O-codes, and N-numbers
+    label_match = _LABEL_RE.match(line)
+    if label_match:
+        label = label_match.group(1)
+        # Exclude if it starts with G, M, O, or N followed by digits
+        if not _CODE_PREFIX_RE.match(label):
+            cmd.label = sys.intern(label)
+            logger.debug(f"Label detected: {cmd.label}")
+            return cmd
+
+    # Check for O-code (macro/program number) - must be standalone
+    o_match = _O_CODE_RE.match(line)
+    if o_match:
+        cmd.macro_call = f"O{o_match.group(1)}"
+        logger.debug(f"O-code detected: {cmd.macro_call}")
+        return cmd
+
+    # Parse line number (N)
+    if 'N' in line:
+        n_match = _N_RE.search(line)
+        if n_match:
+            cmd.n_number = int(n_match.group(1))
+            line = _N_RE.sub('', line)
+
+    # Single pass over the address words: G/M codes, tool number and
+    # the remaining parameters (X, Y, Z, A, B, C, I, J, K, R, P, Q, F, S, ...)
+    parameters = cmd.parameters
+    macro_number = None
+    for letter, text in _WORD_RE.findall(line):
+        if letter == 'G':
+            if not text[0].isdigit():
+                continue
+            # Normalize: G0 -> G00, G1 -> G01, etc. (but not G54.1)
+            cmd.g_codes.append(f"G0{text}" if len(text) == 1 else f"G{text}")
+        elif letter == 'M':
+            if not text[0].isdigit():
+                continue
+            m_num = int(_INT_RE.match(text).group())
+            # Normalize: M3 -> M03, M21 stays M21, etc.
+            cmd.m_codes.append(f"M{m_num:02d}" if m_num < 10 else f"M{m_num}")
+        elif letter == 'T':
+            if cmd.tool_number is None and text[0].isdigit():
+                cmd.tool_number = int(_INT_RE.match(text).group())
+        elif letter != 'N':
+            if letter == 'P' and macro_number is None and text[0].isdigit():
+                macro_number = _INT_RE.match(text).group()
+            parameters[letter] = float(text)
+
+    # Check for macro calls (G65/G66): P is the macro number and the
+    # remaining words become the macro arguments
+    if macro_number is not None and ('G65' in cmd.g_codes or 'G66' in cmd.g_codes):
+        cmd.macro_call = f"O{macro_number}"
+        cmd.macro_params.update(parameters)
+
+    return cmd
+
+
+class _ParsedTokens(NamedTuple):
+    """Immutable parse result of one G-code line, shared by the line cache"""
+    comment: str
+    g_codes: Tuple[str, ...]
+    m_codes: Tuple[str, ...]
+    parameters: Tuple[Tuple[str, float], ...]
+    n_number: Optional[int]
+    tool_number: Optional[int]
+    label: Optional[str]
+    goto_target: Optional[str]
+    gosub_target: Optional[str]
+    macro_call: Optional[str]
+    macro_params: Tuple[Tuple[str, float], ...]
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_line_cached(line: str) -> Optional[_ParsedTokens]:
+    """Parse a stripped G-code line, memoized by its text
+
+    Args:
+        line: Line text with surrounding whitespace removed
+
+    Returns:
+        Parsed tokens or None for empty and comment-only lines
+    """
+    cmd = _parse_command(line)
+    if cmd is None:
+        return None
+    return _ParsedTokens(
+        cmd.comment,
+        tuple(cmd.g_codes),
+        tuple(cmd.m_codes),
+        tuple(cmd.parameters.items()),
+        cmd.n_number,
+        cmd.tool_number,
+        cmd.label,
+        cmd.goto_target,
+        cmd.gosub_target,
+        cmd.macro_call,
+        tuple(cmd.macro_params.items()),
+    )
+
+
+def _build_command(tokens: _ParsedTokens, line_number: int, line: str) -> GCodeCommand:
+    """Create a fresh GCodeCommand from cached tokens"""
+    cmd = GCodeCommand(line_number, line)
+    cmd.comment = tokens.comment
+    cmd.g_codes = list(tokens.g_codes)
+    cmd.m_codes = list(tokens.m_codes)
+    cmd.parameters = dict(tokens.parameters)
+    cmd.n_number = tokens.n_number
+    cmd.tool_number = tokens.tool_number
+    cmd.label = tokens.label
+    cmd.goto_target = tokens.goto_target
+    cmd.gosub_target = tokens.gosub_target
+    cmd.macro_call = tokens.macro_call
+    cmd.macro_params = dict(tokens.macro_params)
+    return cmd
+
+
+# Motion G-code -> motion column value in GCodeProgram
+_MOTION_MODES = {'G00': 0, 'G0': 0, 'G01': 1, 'G1': 1, 'G02': 2, 'G2': 2, 'G03': 3, 'G3': 3}
+_AXIS_LETTERS = frozenset('XYZABCUVW')
+
+
+class GCodeProgram:
+    """
+    Column-wise view of a parsed program for whole-program analysis.
+
+    Word values are stored as one float64 array per address letter in
+    PROGRAM_COLUMNS, NaN where a command does not set the word. motion
+    holds the motion mode of each command (0-3 for G00-G03, -1 if none).
+    The parsed GCodeCommand objects stay available by index.
+    """
+
+    PROGRAM_COLUMNS = ('X', 'Y', 'Z', 'F', 'S', 'I', 'J', 'K', 'R')
+
+    def __init__(self, commands: List[GCodeCommand]):
+        self.commands = commands
+        count = len(commands)
+        self.line_numbers = np.empty(count, dtype=np.int64)
+        self.motion = np.full(count, -1, dtype=np.int8)
+        self.motion_count = np.zeros(count, dtype=np.int8)  # motion words per line
+        self.arc = np.zeros(count, dtype=bool)  # G02/G03 present
+        self.has_coordinates = np.zeros(count, dtype=bool)  # any axis word
+        self.columns: Dict[str, np.ndarray] = {
+            letter: np.full(count, np.nan) for letter in self.PROGRAM_COLUMNS
+        }
+
+        columns = self.columns
+        for i, cmd in enumerate(commands):
+            self.line_numbers[i] = cmd.line_number
+            for g_code in cmd.g_codes:
+                mode = _MOTION_MODES.get(g_code)
+                if mode is not None:
+                    self.motion[i] = mode
+                    self.motion_count[i] += 1
+                    if mode >= 2:
+                        self.arc[i] = True
+            for letter, value in cmd.parameters.items():
+                if letter in _AXIS_LETTERS:
+                    self.has_coordinates[i] = True
+                column = columns.get(letter)
+                if column is not None:
+                    column[i] = value
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.columns['X']
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.columns['Y']
+
+    @property
+    def z(self) -> np.ndarray:
+        return self.columns['Z']
+
+    @property
+    def f(self) -> np.ndarray:
+        return self.columns['F']
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def __getitem__(self, index: int) -> GCodeCommand:
+        return self.commands[index]
+
+    def bounding_box(self) -> Dict[str, Tuple[float, float]]:
+        """Programmed coordinate range per axis (axes never set are omitted)"""
+        box = {}
+        for axis in ('X', 'Y', 'Z'):
+            column = self.columns[axis]
+            if not np.isnan(column).all():
+                box[axis] = (float(np.nanmin(column)), float(np.nanmax(column)))
+        return box
+
+
 class GCodeParser:
     """Parser for G-code programs"""
 
+    # Code tables are shared by all parser instances and read-only
+
     # G-code command definitions
-    G_CODE_DEFS = {
+    G_CODE_DEFS = MappingProxyType({
         # Motion commands
         'G00': ('Rapid positioning', GCodeType.MOTION),
         'G0': ('Rapid positioning', GCodeType.MOTION),
@@ -253,10 +517,10 @@ class GCodeParser:
         'G47': ('Engraving', GCodeType.OTHER),
         'G71': ('Turning roughing cycle (radial)', GCodeType.CYCLE),
         'G72': ('Turning roughing cycle (facing)', GCodeType.CYCLE),
-    }
+    })
 
     # M-code command definitions
-    M_CODE_DEFS = {
+    M_CODE_DEFS = MappingProxyType({
         # Program control
         'M00': 'Program stop',
         'M01': 'Optional stop',
@@ -324,130 +588,57 @@ class GCodeParser:
 
         # Haas-specific codes
         'M130': 'Media player control',
-    }
+    })
+
+    # G-code -> description, flattened so a lookup is a single dict.get
+    G_CODE_DESCRIPTIONS = MappingProxyType(
+        {code: definition[0] for code, definition in G_CODE_DEFS.items()}
+    )
+
+    # Manufacturer-specific G-codes -> manufacturer
+    MANUFACTURER_G_CODES = MappingProxyType({
+        # Siemens Sinumerik codes
+        'G05': "Siemens Sinumerik",
+        'G107': "Siemens Sinumerik",
+        # Heidenhain TNC codes
+        'G05.1': "Heidenhain TNC",
+        # Fanuc extended codes
+        'G54.1': "Fanuc (Macro B)",
+        'G65': "Fanuc (Macro B)",
+        'G66': "Fanuc (Macro B)",
+        'G67': "Fanuc (Macro B)",
+        # Haas codes
+        'G47': "Haas",
+        'G71': "Haas",
+        'G72': "Haas",
+        # Okuma OSP codes: add specific Okuma codes here
+    })
+
+    FOREIGN_MACHINE_CODES = (
+        "Siemens Sinumerik (G05, G107, CYCLE)",
+        "Heidenhain TNC (G05.1, CYCL DEF)",
+        "Fanuc Macro B (G65/G66, #variables)",
+        "Haas (G47, G71/G72, M130)",
+        "Okuma OSP (VC variables, CALL OO)",
+        "Mazak Mazatrol (M200+ series)",
+        "Estlcam (hobbyist/desktop CNC)",
+    )
 
     def __init__(self):
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
     def parse_line(self, line: str, line_number: int) -> Optional[GCodeCommand]:
-        """Parse a single line of G-code"""
-        cmd = GCodeCommand(line_number, line)
-
-        # Remove comments (both styles: parentheses and semicolon)
-        if '(' in line:
-            parts = line.split('(', 1)
-            line = parts[0]
-            if ')' in parts[1]:
-                cmd.comment = parts[1].split(')', 1)[0].strip()
-        elif ';' in line:
-            parts = line.split(';', 1)
-            line = parts[0]
-            cmd.comment = parts[1].strip()
-
-        # Remove whitespace
-        line = line.strip().upper()
-
-        # Empty line or comment-only line
-        if not line:
-            return None
-
-        # Check for GOTO (control flow)
-        if 'GOTO' in line:
-            goto_match = re.search(r'GOTO\s+(\w+)', line)
-            if goto_match:
-                cmd.goto_target = goto_match.group(1)
-                logger.debug(f"GOTO detected: target={cmd.goto_target}")
-
-        # Check for GOSUB (subroutine call)
-        if 'GOSUB' in line:
-            gosub_match = re.search(r'GOSUB\s+(\w+)', line)
-            if gosub_match:
-                cmd.gosub_target = gosub_match.group(1)
-                logger.debug(f"GOSUB detected: target={cmd.gosub_target}")
-
-        # Check for labels (e.g., :LABEL or NLABEL) - must be standalone
-        # Exclude G-codes, M-codes, O-codes, and N-numbers
-        label_match = re.match(r'^:?([A-Z][A-Z0-9_]*):?\s*$', line)
-        if label_match:
-            label = label_match.group(1)
-            # Exclude if it starts with G, M, O, or N followed by digits
-            if not re.match(r'^[GMNO]\d', label):
-                cmd.label = label
-                logger.debug(f"Label detected: {cmd.label}")
-                return cmd
-
-        # Check for O-code (macro/program number) - must be standalone
-        o_match = re.match(r'^O(\d+)\s*$', line)
-        if o_match:
-            cmd.macro_call = f"O{o_match.group(1)}"
-            logger.debug(f"O-code detected: {cmd.macro_call}")
-            return cmd
-
-        # Parse line number (N)
-        n_match = re.search(r'N(\d+)', line)
-        if n_match:
-            cmd.n_number = int(n_match.group(1))
-            line = re.sub(r'N\d+', '', line)
-
-        # Parse G-codes (including decimal forms like G54.1)
-        g_matches = re.finditer(r'G(\d+\.?\d*)', line)
-        for match in g_matches:
-            g_num = match.group(1)
-            g_code = f"G{g_num}"
-            # Normalize: G0 -> G00, G1 -> G01, etc. (but not G54.1)
-            if '.' not in g_num and len(g_num) == 1:
-                g_code = f"G0{g_num}"
-            cmd.g_codes.append(g_code)
-
-            # Check for extended work coordinate system (G54.1 Pxx)
-            if g_code == 'G54.1':
-                p_match = re.search(r'P(\d+)', line)
-                if p_match:
-                    cmd.parameters['P'] = float(p_match.group(1))
-
-        # Parse M-codes
-        m_matches = re.finditer(r'M(\d+)', line)
-        for match in m_matches:
-            m_num = int(match.group(1))
-            # Normalize: M3 -> M03, M21 stays M21, etc.
-            if m_num < 10:
-                m_code = f"M{m_num:02d}"
-            else:
-                m_code = f"M{m_num}"
-            cmd.m_codes.append(m_code)
-
-        # Parse tool number (T)
-        t_match = re.search(r'T(\d+)', line)
-        if t_match:
-            cmd.tool_number = int(t_match.group(1))
-
-        # Check for macro calls (G65/G66)
-        if 'G65' in cmd.g_codes or 'G66' in cmd.g_codes:
-            # P parameter in G65/G66 is the macro number
-            p_match = re.search(r'P(\d+)', line)
-            if p_match:
-                cmd.macro_call = f"O{p_match.group(1)}"
-
-        # Parse parameters (X, Y, Z, A, B, C, I, J, K, R, P, Q, F, S, etc.)
-        param_pattern = r'([A-Z])([+-]?\d*\.?\d+)'
-        param_matches = re.finditer(param_pattern, line)
-
-        for match in param_matches:
-            letter = match.group(1)
-            value = float(match.group(2))
-
-            # Skip G, M, N, T which are already parsed
-            if letter in ['G', 'M', 'N', 'T']:
-                continue
-
-            cmd.parameters[letter] = value
+        """Parse a single line of G-code
 
-            # For macro calls, also store in macro_params
-            if cmd.macro_call and letter not in ['G', 'M', 'N', 'T']:
-                cmd.macro_params[letter] = value
-
-        return cmd
+        Identical lines share one cached parse; each call still returns a
+        fresh GCodeCommand carrying its own line number.
+        """
+        line = line.strip()
+        tokens = _parse_line_cached(line)
+        if tokens is None:
+            return None
+        return _build_command(tokens, line_number, line)
 
     def parse_program(self, program: str) -> List[GCodeCommand]:
         """Parse a complete G-code program"""
@@ -455,21 +646,62 @@ class GCodeParser:
         self.warnings.clear()
 
         lines = program.split('\n')
-        commands: List[GCodeCommand] = []
+        commands: List[GCodeCommand] = [None] * len(lines)
+        count = 0
 
         for line_num, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line:
+                continue
             try:
-                cmd = self.parse_line(line, line_num)
-                if cmd:
-                    commands.append(cmd)
+                tokens = _parse_line_cached(line)
             except Exception as e:
                 error_msg = f"Line {line_num}: Parse error - {str(e)}"
                 self.errors.append(error_msg)
                 logger.error(error_msg)
+                continue
+            if tokens is not None:
+                commands[count] = _build_command(tokens, line_num, line)
+                count += 1
 
+        del commands[count:]
         logger.info(f"Parsed {len(commands)} commands from {len(lines)} lines")
         return commands
 
+    def parse_program_columns(self, program: str) -> GCodeProgram:
+        """Parse a complete G-code program into a column-wise GCodeProgram"""
+        return GCodeProgram(self.parse_program(program))
+
+    def validate_program(self, program: GCodeProgram) -> List[Tuple[int, List[str]]]:
+        """Validate every command of a column-wise program
+
+        The motion and arc rules are evaluated as array masks over the whole
+        program; only flagged commands go through validate_command for
+        their error messages.
+
+        Returns:
+            (command index, errors) for each invalid command, in program order
+        """
+        if not len(program):
+            return []
+
+        columns = program.columns
+        has_arc_center = ~(np.isnan(columns['I']) & np.isnan(columns['J'])
+                           & np.isnan(columns['K']) & np.isnan(columns['R']))
+        flagged = ((program.motion_count > 1)
+                   | ((program.motion_count > 0) & ~program.has_coordinates)
+                   | (program.arc & ~has_arc_center))
+
+        g_defs, m_defs = self.G_CODE_DEFS, self.M_CODE_DEFS
+        unknown = np.fromiter(
+            (any(g not in g_defs for g in cmd.g_codes) or any(m not in m_defs for m in cmd.m_codes)
+             for cmd in program.commands),
+            dtype=bool, count=len(program)
+        )
+
+        return [(int(i), self.validate_command(program[i])[1])
+                for i in np.flatnonzero(flagged | unknown)]
+
     def validate_command(self, cmd: GCodeCommand) -> Tuple[bool, List[str]]:
         """Validate a parsed command"""
         errors = []
@@ -485,7 +717,7 @@ class GCodeParser:
                 errors.append(f"Unknown M-code: {m_code}")
 
         # Check for conflicting G-codes
-        motion_codes = [g for g in cmd.g_codes if g in ['G00', 'G0', 'G01', 'G1', 'G02', 'G2', 'G03', 'G3']]
+        motion_codes = [g for g in cmd.g_codes if g in _MOTION_CODES]
         if len(motion_codes) > 1:
             errors.append(f"Multiple motion commands in one line: {motion_codes}")
 
@@ -495,7 +727,7 @@ class GCodeParser:
                 errors.append("Motion command without coordinate parameters")
 
         # Check circular interpolation parameters
-        if any(g in cmd.g_codes for g in ['G02', 'G2', 'G03', 'G3']):
+        if any(g in _ARC_CODES for g in cmd.g_codes):
             # Need either I,J,K or R parameter
             has_ijk = any(p in cmd.parameters for p in ['I', 'J', 'K'])
             has_r = 'R' in cmd.parameters
@@ -506,14 +738,13 @@ class GCodeParser:
 
     def get_g_code_description(self, g_code: str) -> str:
         """Get description for a G-code"""
-        if g_code in self.G_CODE_DEFS:
-            return self.G_CODE_DEFS[g_code][0]
-        return "Unknown G-code"
+        return self.G_CODE_DESCRIPTIONS.get(g_code, "Unknown G-code")
 
     def get_m_code_description(self, m_code: str) -> str:
         """Get description for an M-code"""
-        if m_code in self.M_CODE_DEFS:
-            return self.M_CODE_DEFS[m_code]
+        description = self.M_CODE_DEFS.get(m_code)
+        if description is not None:
+            return description
 
         # Handle user-defined M-codes
         m_num = int(m_code[1:])
@@ -530,41 +761,11 @@ class GCodeParser:
         Returns:
             Tuple of (is_specific, manufacturer_name)
         """
-        # Siemens Sinumerik codes
-        siemens_codes = ['G05', 'G107']
-        if g_code in siemens_codes:
-            return True, "Siemens Sinumerik"
-
-        # Heidenhain TNC codes
-        heidenhain_codes = ['G05.1']
-        if g_code in heidenhain_codes:
-            return True, "Heidenhain TNC"
-
-        # Fanuc extended codes
-        fanuc_codes = ['G54.1', 'G65', 'G66', 'G67']
-        if g_code in fanuc_codes:
-            return True, "Fanuc (Macro B)"
-
-        # Haas codes
-        haas_codes = ['G47', 'G71', 'G72']
-        if g_code in haas_codes:
-            return True, "Haas"
-
-        # Okuma OSP codes
-        okuma_codes = []  # Add specific Okuma codes here
-        if g_code in okuma_codes:
-            return True, "Okuma OSP"
-
+        manufacturer = self.MANUFACTURER_G_CODES.get(g_code)
+        if manufacturer is not None:
+            return True, manufacturer
         return False, ""
 
     def supports_foreign_machine_codes(self) -> List[str]:
         """Return list of supported foreign machine code systems"""
-        return [
-            "Siemens Sinumerik (G05, G107, CYCLE)",
-            "Heidenhain TNC (G05.1, CYCL DEF)",
-            "Fanuc Macro B (G65/G66, #variables)",
-            "Haas (G47, G71/G72, M130)",
-            "Okuma OSP (VC variables, CALL OO)",
-            "Mazak Mazatrol (M200+ series)",
-            "Estlcam (hobbyist/desktop CNC)"
-        ]
+        return list(self.FOREIGN_MACHINE_CODES)
@@ -0,0 +1,53 @@
+"""JSON helpers shared by the MQTT, aggregation and audit paths
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both paths produce the same compact output, so what goes on the
+wire or into the audit log does not depend on which one is available.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON
+
+    Args:
+        obj: JSON-serializable object; non-string dict keys are allowed
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson rejects (e.g. >64-bit ints) go through stdlib json
+            pass
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document
+
+    Args:
+        data: JSON as raw bytes or str
+
+    Returns:
+        Parsed object
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Input orjson rejects but stdlib json accepts (e.g. NaN literals);
+            # genuinely malformed payloads raise from json below
+            pass
+    return json.loads(data)
@@ -1,11 +1,12 @@
 """MQTT Handler - Manages communication with field layer and AI layer"""
-import json
 import logging
 import ssl
-from typing import Callable, Optional
+import threading
+from typing import Callable, Dict, List, Optional, Union
 import paho.mqtt.client as mqtt
 from config import MQTTConfig
 from data_aggregator import SensorReading, SafetyStatus
+from json_utils import dumps, loads
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,58 @@ MQTT_RECONNECT_DELAY_MAX = 60  # Maximum reconnection delay in seconds
 MQTT_RECONNECT_BACKOFF_MULTIPLIER = 2  # Exponential backoff multiplier
 
 
+class PublishBatcher:
+    """
+    Coalesces payloads per topic into one publish.
+
+    Buffered payloads go out as a single JSON array once max_messages are
+    queued for a topic or flush_interval seconds after the first one,
+    whichever comes first.
+    """
+
+    def __init__(self, publish: Callable[[str, bytes], None],
+                 max_messages: int, flush_interval: float):
+        self._publish = publish
+        self.max_messages = max_messages
+        self.flush_interval = flush_interval
+        self._buffers: Dict[str, List[bytes]] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def add(self, topic: str, payload: bytes):
+        """Queue a JSON payload for topic"""
+        with self._lock:
+            buffer = self._buffers.setdefault(topic, [])
+            buffer.append(payload)
+            if len(buffer) >= self.max_messages:
+                batch = self._buffers.pop(topic)
+            else:
+                batch = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.flush_interval, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        if batch is not None:
+            self._publish(topic, self._frame(batch))
+
+    def flush(self):
+        """Publish everything that is buffered"""
+        with self._lock:
+            buffers, self._buffers = self._buffers, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        for topic, batch in buffers.items():
+            self._publish(topic, self._frame(batch))
+
+    @staticmethod
+    def _frame(batch: List[bytes]) -> bytes:
+        """Join JSON payloads into one JSON array"""
+        return b'[' + b','.join(batch) + b']'
+
+
 class MQTTHandler:
     """Handles MQTT communication for the control layer"""
 
@@ -31,6 +84,21 @@ class MQTTHandler:
         self._reconnect_delay = MQTT_RECONNECT_DELAY_MIN
         self._is_connected = False
 
+        # Optional batching of AI analysis publishes
+        self._batcher: Optional[PublishBatcher] = None
+        if config.publish_batch_size > 1:
+            self._batcher = PublishBatcher(
+                self._publish_batch, config.publish_batch_size,
+                config.publish_flush_ms / 1000.0
+            )
+
+        # Topic -> handler table so _on_message dispatches with one lookup
+        self._dispatch: Dict[str, Callable[[Union[bytes, str]], None]] = {
+            config.topic_sensor_data: self._handle_sensor_data,
+            config.topic_safety: self._handle_safety_status,
+            config.topic_ai_analysis: self._handle_ai_analysis,
+        }
+
         # Setup client
         self.client.on_connect = self._on_connect
         self.client.on_message = self._on_message
@@ -82,9 +150,8 @@ class MQTTHandler:
         """Connect to MQTT broker"""
         try:
             logger.info(
-                f"Connecting to MQTT broker at {
-                    self.config.broker_host}:{
-                    self.config.broker_port}")
+                f"Connecting to MQTT broker at "
+                f"{self.config.broker_host}:{self.config.broker_port}")
             self.client.connect(self.config.broker_host, self.config.broker_port, 60)
             self.client.loop_start()
         except Exception as e:
@@ -93,24 +160,41 @@ class MQTTHandler:
 
     def disconnect(self):
         """Disconnect from MQTT broker"""
+        self.flush()
         self.client.loop_stop()
         self.client.disconnect()
 
     def publish_ai_analysis(self, analysis: dict):
         """Publish AI analysis results to HMI"""
         try:
-            payload = json.dumps(analysis)
+            payload = dumps(analysis)
+            if self._batcher is not None:
+                self._batcher.add(self.config.topic_ai_analysis, payload)
+                return
             self.client.publish(self.config.topic_ai_analysis, payload, qos=1)
-            logger.debug(f"Published AI analysis: {payload}")
+            logger.debug("Published AI analysis: %s", payload)
         except Exception as e:
             logger.error(f"Failed to publish AI analysis: {e}")
 
+    def flush(self):
+        """Publish any batched messages immediately"""
+        if self._batcher is not None:
+            self._batcher.flush()
+
+    def _publish_batch(self, topic: str, payload: bytes):
+        """Publish a framed batch from the batcher"""
+        try:
+            self.client.publish(topic, payload, qos=1)
+            logger.debug("Published batch on %s (%d bytes)", topic, len(payload))
+        except Exception as e:
+            logger.error(f"Failed to publish batch on {topic}: {e}")
+
     def publish_control_command(self, command: dict):
         """Publish control command"""
         try:
-            payload = json.dumps(command)
+            payload = dumps(command)
             self.client.publish(self.config.topic_control_commands, payload, qos=1)
-            logger.info(f"Published control command: {payload}")
+            logger.info("Published control command: %s", command)
         except Exception as e:
             logger.error(f"Failed to publish control command: {e}")
 
@@ -154,23 +238,21 @@ class MQTTHandler:
         """Callback when message received"""
         try:
             topic = msg.topic
-            payload = msg.payload.decode('utf-8')
+            # Raw bytes go straight to the JSON parsers, no str decode step
+            payload = msg.payload
 
-            logger.debug(f"Received message on topic {topic}: {payload}")
+            logger.debug("Received message on topic %s: %s", topic, payload)
 
-            if topic == self.config.topic_sensor_data:
-                self._handle_sensor_data(payload)
-            elif topic == self.config.topic_safety:
-                self._handle_safety_status(payload)
-            elif topic == self.config.topic_ai_analysis:
-                self._handle_ai_analysis(payload)
+            handler = self._dispatch.get(topic)
+            if handler is not None:
+                handler(payload)
             else:
                 logger.warning(f"Received message on unknown topic: {topic}")
 
         except Exception as e:
             logger.error(f"Error processing message: {e}")
 
-    def _handle_sensor_data(self, payload: str):
+    def _handle_sensor_data(self, payload: Union[bytes, str]):
         """Handle incoming sensor data"""
         try:
             reading = SensorReading.from_json(payload)
@@ -179,7 +261,7 @@ class MQTTHandler:
         except Exception as e:
             logger.error(f"Error parsing sensor data: {e}")
 
-    def _handle_safety_status(self, payload: str):
+    def _handle_safety_status(self, payload: Union[bytes, str]):
         """Handle incoming safety status"""
         try:
             status = SafetyStatus.from_json(payload)
@@ -197,11 +279,18 @@ class MQTTHandler:
         except Exception as e:
             logger.error(f"Error parsing safety status: {e}")
 
-    def _handle_ai_analysis(self, payload: str):
-        """Handle incoming AI analysis (from AI layer or external)"""
+    def _handle_ai_analysis(self, payload: Union[bytes, str]):
+        """
+        Handle incoming AI analysis (from AI layer or external)
+
+        A JSON array payload is a batch from PublishBatcher; each analysis in
+        it is delivered to the callback separately, in order.
+        """
         try:
-            analysis = json.loads(payload)
+            parsed = loads(payload)
             if self.on_ai_analysis:
-                self.on_ai_analysis(analysis)
+                analyses = parsed if isinstance(parsed, list) else (parsed,)
+                for analysis in analyses:
+                    self.on_ai_analysis(analysis)
         except Exception as e:
             logger.error(f"Error parsing AI analysis: {e}")
@@ -2,8 +2,10 @@
 Network Scanner Module for MODAX
 Provides network discovery and device detection capabilities
 """
+import functools
 import socket
 import ipaddress
+import operator
 from typing import List, Dict, Optional, Tuple
 import asyncio
 import logging
@@ -11,6 +13,95 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Ports probed to decide whether a host is alive (includes Modbus and OPC UA)
+HOST_PROBE_PORTS = [80, 443, 22, 23, 8000, 8001, 502, 44818]
+
+# Well-known ports checked by scan_common_ports, with display names
+COMMON_PORTS = {
+    20: "FTP Data",
+    21: "FTP Control",
+    22: "SSH",
+    23: "Telnet",
+    25: "SMTP",
+    53: "DNS",
+    80: "HTTP",
+    110: "POP3",
+    143: "IMAP",
+    443: "HTTPS",
+    502: "Modbus TCP",
+    1883: "MQTT",
+    3306: "MySQL",
+    5432: "PostgreSQL",
+    8000: "HTTP Alt (Control Layer)",
+    8001: "HTTP Alt (AI Layer)",
+    8080: "HTTP Proxy",
+    8883: "MQTT TLS",
+    4840: "OPC UA",
+    44818: "OPC UA Discovery"
+}
+
+# Device classification rules in priority order: (device type, ports, require all ports)
+_DEVICE_TYPE_PORTS = [
+    ("Modbus Device", (502,), False),
+    ("OPC UA Device", (44818, 4840), False),
+    ("MODAX Control System", (8000, 8001), True),
+    ("MODAX Control Layer", (8000,), False),
+    ("MODAX AI Layer", (8001,), False),
+    ("Web Server", (80, 443), False),
+    ("SSH Device", (22,), False),
+    ("Telnet Device", (23,), False),
+]
+
+# One bit per port that appears in a rule, so a device's open ports fold into a small int
+_RULE_PORTS = dict.fromkeys(p for _, ports, _ in _DEVICE_TYPE_PORTS for p in ports)
+_PORT_BITS = {port: 1 << bit for bit, port in enumerate(_RULE_PORTS)}
+
+_DEVICE_TYPE_RULES = [
+    (name, functools.reduce(operator.or_, (_PORT_BITS[p] for p in ports)), require_all)
+    for name, ports, require_all in _DEVICE_TYPE_PORTS
+]
+
+# Upper bound on simultaneous connection attempts per scan (file descriptors)
+SCAN_CONCURRENCY = 256
+
+# Upper bound on reverse DNS lookups in flight at once
+RESOLVE_CONCURRENCY = 64
+
+
+def _service_name(port: int) -> str:
+    """Look up a port in the system services database"""
+    try:
+        return socket.getservbyport(port)
+    except Exception:
+        return f"Unknown (Port {port})"
+
+
+# Service names of the ports the scanner probes, resolved once at import
+_PORT_SERVICES = {port: _service_name(port) for port in (*COMMON_PORTS, *HOST_PROBE_PORTS)}
+
+
+@functools.lru_cache(maxsize=1024)
+def _lookup_service(port: int) -> str:
+    """Resolve any other port via the services database, once per port"""
+    return _service_name(port)
+
+
+async def _tcp_connect(host: str, port: int, timeout: float) -> bool:
+    """Return True if a TCP connection to host:port succeeds within timeout"""
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (asyncio.TimeoutError, OSError, OverflowError, ValueError):
+        # Out-of-range ports raise OverflowError/ValueError; report them closed
+        return False
+    writer.close()
+    return True
+
+
+async def _probe(semaphore: asyncio.Semaphore, host: str, port: int, timeout: float) -> bool:
+    """_tcp_connect limited by a shared semaphore"""
+    async with semaphore:
+        return await _tcp_connect(host, port, timeout)
+
 
 class NetworkDevice:
     """Represents a discovered network device"""
@@ -41,8 +132,9 @@ class NetworkDevice:
 class NetworkScanner:
     """Network scanner for device discovery"""
     
-    def __init__(self, timeout: float = 1.0):
+    def __init__(self, timeout: float = 1.0, max_concurrency: int = SCAN_CONCURRENCY):
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
         self.discovered_devices: List[NetworkDevice] = []
         
     async def ping_host(self, ip: str) -> bool:
@@ -50,24 +142,31 @@ class NetworkScanner:
         Check if a host is reachable using socket connection
         Returns True if host responds, False otherwise
         """
-        try:
-            # Try to connect to common ports
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
-            result = sock.connect_ex((ip, 80))
-            sock.close()
-            return result == 0
-        except Exception:
-            return False
+        return await _tcp_connect(ip, 80, self.timeout)
     
     async def resolve_hostname(self, ip: str) -> Optional[str]:
         """Resolve IP to hostname"""
+        # gethostbyaddr blocks, so run it in the default thread pool
+        loop = asyncio.get_running_loop()
         try:
-            hostname = socket.gethostbyaddr(ip)[0]
+            hostname = (await loop.run_in_executor(None, socket.gethostbyaddr, ip))[0]
             return hostname
         except Exception:
             return None
     
+    async def resolve_many(self, ips: List[str]) -> List[Optional[str]]:
+        """
+        Resolve several IPs to hostnames concurrently
+        Returns hostnames in the same order as ips (None where resolution failed)
+        """
+        semaphore = asyncio.Semaphore(RESOLVE_CONCURRENCY)
+
+        async def resolve(ip: str) -> Optional[str]:
+            async with semaphore:
+                return await self.resolve_hostname(ip)
+
+        return await asyncio.gather(*(resolve(ip) for ip in ips))
+
     async def scan_network_range(self, network: str) -> List[NetworkDevice]:
         """
         Scan a network range for active hosts
@@ -78,11 +177,12 @@ class NetworkScanner:
             logger.info(f"Scanning network {network} ({network_obj.num_addresses} addresses)")
             
             devices = []
+            semaphore = asyncio.Semaphore(self.max_concurrency)
             tasks = []
             
             # Create scan tasks for all hosts in range
             for ip in network_obj.hosts():
-                tasks.append(self._scan_host(str(ip)))
+                tasks.append(self._scan_host(str(ip), semaphore))
             
             # Execute scans concurrently
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -100,26 +200,20 @@ class NetworkScanner:
             logger.error(f"Error scanning network {network}: {e}")
             return []
     
-    async def _scan_host(self, ip: str) -> Optional[NetworkDevice]:
+    async def _scan_host(self, ip: str,
+                         semaphore: Optional[asyncio.Semaphore] = None) -> Optional[NetworkDevice]:
         """Scan a single host"""
         try:
-            # Try common ports to detect if host is alive
-            ports_to_check = [80, 443, 22, 23, 8000, 8001, 502, 44818]  # Include Modbus and OPC UA
-            is_alive = False
-            open_ports = []
-            
-            for port in ports_to_check:
-                # Create a new socket for each port check
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(self.timeout)
-                result = sock.connect_ex((ip, port))
-                sock.close()
-                
-                if result == 0:
-                    is_alive = True
-                    open_ports.append(port)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            # Try common ports concurrently to detect if host is alive
+            results = await asyncio.gather(
+                *(_probe(semaphore, ip, port, self.timeout) for port in HOST_PROBE_PORTS)
+            )
+            open_ports = [port for port, is_open in zip(HOST_PROBE_PORTS, results) if is_open]
             
-            if not is_alive:
+            if not open_ports:
                 return None
             
             # Resolve hostname
@@ -140,24 +234,14 @@ class NetworkScanner:
     
     def _identify_device_type(self, open_ports: List[int]) -> str:
         """Identify device type based on open ports"""
-        if 502 in open_ports:
-            return "Modbus Device"
-        elif 44818 in open_ports or 4840 in open_ports:
-            return "OPC UA Device"
-        elif 8000 in open_ports and 8001 in open_ports:
-            return "MODAX Control System"
-        elif 8000 in open_ports:
-            return "MODAX Control Layer"
-        elif 8001 in open_ports:
-            return "MODAX AI Layer"
-        elif 80 in open_ports or 443 in open_ports:
-            return "Web Server"
-        elif 22 in open_ports:
-            return "SSH Device"
-        elif 23 in open_ports:
-            return "Telnet Device"
-        else:
-            return "Unknown Device"
+        mask = 0
+        for port in open_ports:
+            mask |= _PORT_BITS.get(port, 0)
+        for name, rule_mask, require_all in _DEVICE_TYPE_RULES:
+            matched = mask & rule_mask
+            if (matched == rule_mask) if require_all else matched:
+                return name
+        return "Unknown Device"
     
     async def scan_subnet(self, interface: Optional[str] = None) -> List[NetworkDevice]:
         """
@@ -191,7 +275,8 @@ class NetworkScanner:
         hosts: List of IP addresses or hostnames
         """
         logger.info(f"Quick scanning {len(hosts)} hosts")
-        tasks = [self._scan_host(host) for host in hosts]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [self._scan_host(host, semaphore) for host in hosts]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         devices = []
@@ -206,19 +291,13 @@ class NetworkScanner:
 class PortScanner:
     """Port scanner for service detection"""
     
-    def __init__(self, timeout: float = 1.0):
+    def __init__(self, timeout: float = 1.0, max_concurrency: int = SCAN_CONCURRENCY):
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
         
     async def scan_port(self, host: str, port: int) -> bool:
         """Check if a specific port is open"""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
-            result = sock.connect_ex((host, port))
-            sock.close()
-            return result == 0
-        except Exception:
-            return False
+        return await _tcp_connect(host, port, self.timeout)
     
     async def scan_ports(self, host: str, ports: List[int]) -> Dict[int, bool]:
         """
@@ -226,7 +305,9 @@ class PortScanner:
         Returns dictionary of port -> is_open
         """
         logger.info(f"Scanning {len(ports)} ports on {host}")
-        tasks = [self.scan_port(host, port) for port in ports]
+        # Connects run concurrently on the event loop, bounded by max_concurrency
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [_probe(semaphore, host, port, self.timeout) for port in ports]
         results = await asyncio.gather(*tasks)
         
         port_status = {port: is_open for port, is_open in zip(ports, results)}
@@ -240,37 +321,15 @@ class PortScanner:
         Scan common ports and identify services
         Returns dictionary of port -> (is_open, service_name)
         """
-        common_ports = {
-            20: "FTP Data",
-            21: "FTP Control",
-            22: "SSH",
-            23: "Telnet",
-            25: "SMTP",
-            53: "DNS",
-            80: "HTTP",
-            110: "POP3",
-            143: "IMAP",
-            443: "HTTPS",
-            502: "Modbus TCP",
-            1883: "MQTT",
-            3306: "MySQL",
-            5432: "PostgreSQL",
-            8000: "HTTP Alt (Control Layer)",
-            8001: "HTTP Alt (AI Layer)",
-            8080: "HTTP Proxy",
-            8883: "MQTT TLS",
-            4840: "OPC UA",
-            44818: "OPC UA Discovery"
-        }
-        
         logger.info(f"Scanning common ports on {host}")
-        port_list = list(common_ports.keys())
-        tasks = [self.scan_port(host, port) for port in port_list]
+        port_list = list(COMMON_PORTS)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [_probe(semaphore, host, port, self.timeout) for port in port_list]
         results = await asyncio.gather(*tasks)
         
         services = {}
         for port, is_open in zip(port_list, results):
-            service_name = common_ports[port]
+            service_name = COMMON_PORTS[port]
             services[port] = (is_open, service_name)
         
         open_count = sum(1 for is_open, _ in services.values() if is_open)
@@ -293,9 +352,8 @@ class PortScanner:
         return open_ports
     
     def get_service_info(self, port: int) -> str:
-        """Get service information for a port number"""
-        try:
-            service = socket.getservbyport(port)
-            return service
-        except Exception:
-            return f"Unknown (Port {port})"
+        """Get the services database name for a port number"""
+        service = _PORT_SERVICES.get(port)
+        if service is None:
+            service = _lookup_service(port)
+        return service
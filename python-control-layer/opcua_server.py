@@ -12,6 +12,7 @@ from asyncua import Server, ua
 from asyncua.common.node import Node
 from datetime import datetime, timezone
 from typing import Dict, Optional, Any
+from urllib.parse import urlsplit
 
 logger = logging.getLogger(__name__)
 
@@ -277,7 +278,7 @@ class MODAXOpcUaServer:
 
         await self.server.start()
         self._running = True
-        logger.info(f"OPC UA Server started at {self.endpoint}")
+        logger.info(f"OPC UA Server started at {self.actual_endpoint}")
 
     async def stop(self):
         """Stop OPC UA server"""
@@ -293,6 +294,27 @@ class MODAXOpcUaServer:
         """Check if server is running"""
         return self._running
 
+    @property
+    def actual_endpoint(self) -> str:
+        """
+        Endpoint URL with the port the server is actually listening on
+
+        Differs from endpoint when the server was configured with port 0
+        and the OS picked a free port.
+
+        Returns:
+            Endpoint URL, or the configured endpoint if the server is not running
+        """
+        if not self._running:
+            return self.endpoint
+        try:
+            port = self.server.bserver._server.sockets[0].getsockname()[1]
+        except (AttributeError, IndexError):
+            # asyncua internals changed or no socket bound
+            return self.endpoint
+        parts = urlsplit(self.endpoint)
+        return parts._replace(netloc=f"{parts.hostname}:{port}").geturl()
+
 
 # Global OPC UA server instance
 _opcua_server: Optional[MODAXOpcUaServer] = None
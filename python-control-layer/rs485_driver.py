@@ -22,20 +22,95 @@ Compatible Devices:
 - Generic Modbus RTU devices
 """
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+import struct
+from typing import Optional, Dict, Any, List, Tuple
 from enum import IntEnum
 import threading
 
-try:
-    from pymodbus.client import ModbusSerialClient
-    MODBUS_AVAILABLE = True
-except ImportError:
-    MODBUS_AVAILABLE = False
-    logging.warning("Modbus support not available. Install with: pip install pymodbus pyserial")
-
 logger = logging.getLogger(__name__)
 
+# pymodbus and pyserial are imported on first use by _probe_modbus() and
+# _probe_serial(), so services that never touch a VFD skip their import cost
+MODBUS_AVAILABLE: Optional[bool] = None
+ModbusSerialClient: Any = None
+AsyncModbusSerialClient: Any = None
+SERIAL_AVAILABLE: Optional[bool] = None
+serial: Any = None
+# Exceptions that mean the link itself failed; extended by the probes
+TRANSPORT_ERRORS: Tuple[type, ...] = (OSError,)
+
+
+def _probe_modbus() -> bool:
+    """Import pymodbus once and report whether it is available"""
+    global MODBUS_AVAILABLE, ModbusSerialClient, AsyncModbusSerialClient, TRANSPORT_ERRORS
+    if MODBUS_AVAILABLE is None:
+        try:
+            from pymodbus.client import ModbusSerialClient as client_class
+            from pymodbus.client import AsyncModbusSerialClient as async_client_class
+            from pymodbus.exceptions import ConnectionException, ModbusIOException
+            ModbusSerialClient = client_class
+            AsyncModbusSerialClient = async_client_class
+            TRANSPORT_ERRORS += (ConnectionException, ModbusIOException)
+            MODBUS_AVAILABLE = True
+        except ImportError:
+            MODBUS_AVAILABLE = False
+            logger.warning(
+                "Modbus support not available. Install with: pip install pymodbus pyserial"
+            )
+    return MODBUS_AVAILABLE
+
+
+def _probe_serial() -> bool:
+    """Import pyserial once and report whether it is available"""
+    global SERIAL_AVAILABLE, serial, TRANSPORT_ERRORS
+    if SERIAL_AVAILABLE is None:
+        try:
+            import serial as serial_module
+            serial = serial_module
+            TRANSPORT_ERRORS += (serial.SerialException,)
+            SERIAL_AVAILABLE = True
+        except ImportError:
+            SERIAL_AVAILABLE = False
+    return SERIAL_AVAILABLE
+
+
+# Register blocks closer together than this are fetched in one Modbus read;
+# reading a few unused registers is cheaper than another serial round trip
+READ_MERGE_GAP = 10
+
+
+def _build_crc16_table() -> Tuple[int, ...]:
+    """Build the lookup table for CRC-16/MODBUS (reflected poly 0xA001)"""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+CRC16_TABLE = _build_crc16_table()
+
+
+def crc16_modbus(data: bytes) -> int:
+    """
+    Compute Modbus RTU CRC16
+
+    Args:
+        data: Frame bytes without CRC
+
+    Returns:
+        CRC value (transmitted low byte first)
+    """
+    crc = 0xFFFF
+    table = CRC16_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
 
 class VFDCommand(IntEnum):
     """VFD control commands"""
@@ -57,6 +132,17 @@ class VFDStatus(IntEnum):
     READY = 0x20
 
 
+# Status word bits as plain ints, avoids IntEnum lookups when decoding
+STATUS_MASKS = (
+    ('running', int(VFDStatus.RUNNING)),
+    ('forward', int(VFDStatus.FORWARD)),
+    ('reverse', int(VFDStatus.REVERSE)),
+    ('fault', int(VFDStatus.FAULT)),
+    ('at_speed', int(VFDStatus.AT_SPEED)),
+    ('ready', int(VFDStatus.READY)),
+)
+
+
 class RS485Config:
     """RS485 communication configuration"""
 
@@ -67,7 +153,11 @@ class RS485Config:
         bytesize: int = 8,
         parity: str = 'N',
         stopbits: int = 1,
-        timeout: float = 1.0
+        timeout: float = 1.0,
+        native_rtu: bool = False,
+        write_timeout: Optional[float] = None,
+        inter_byte_timeout: Optional[float] = None,
+        low_latency: bool = False
     ):
         self.port = port
         self.baudrate = baudrate
@@ -75,6 +165,19 @@ class RS485Config:
         self.parity = parity
         self.stopbits = stopbits
         self.timeout = timeout
+        # Use the built-in RTU framing instead of pymodbus (needs pyserial)
+        self.native_rtu = native_rtu
+        # Serial port tuning for fast poll loops (None = pyserial default)
+        self.write_timeout = write_timeout
+        self.inter_byte_timeout = inter_byte_timeout
+        # Ask the USB-serial driver for low latency (Linux, e.g. FTDI 16 ms -> 1 ms)
+        self.low_latency = low_latency
+
+    def settings(self) -> Tuple[Any, ...]:
+        """All serial settings, for comparing configs that share a port"""
+        return (self.port, self.baudrate, self.bytesize, self.parity, self.stopbits,
+                self.timeout, self.native_rtu, self.write_timeout,
+                self.inter_byte_timeout, self.low_latency)
 
 
 class VFDRegisterMap:
@@ -102,6 +205,188 @@ class VFDRegisterMap:
     MIN_FREQUENCY = 0x3005        # Minimum frequency (Hz * 100)
 
 
+class RTUResponse:
+    """Response of ModbusRTUClient, mirrors the pymodbus result API"""
+
+    __slots__ = ('registers', 'error')
+
+    def __init__(self, registers: Optional[List[int]] = None, error: Optional[str] = None):
+        self.registers = registers or []
+        self.error = error
+
+    def isError(self) -> bool:
+        return self.error is not None
+
+    def __str__(self) -> str:
+        return self.error or f"RTUResponse({self.registers})"
+
+
+class ModbusRTUClient:
+    """
+    Minimal Modbus RTU client for holding register access
+
+    Builds request frames with struct and a table-driven CRC16 and talks to
+    pyserial directly, avoiding the per-request object overhead of pymodbus.
+    Exposes the subset of the ModbusSerialClient API used by RS485Driver.
+    """
+
+    READ_HOLDING_REGISTERS = 0x03
+    WRITE_SINGLE_REGISTER = 0x06
+    WRITE_MULTIPLE_REGISTERS = 0x10
+    READ_WRITE_MULTIPLE_REGISTERS = 0x17
+
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = 9600,
+        bytesize: int = 8,
+        parity: str = 'N',
+        stopbits: int = 1,
+        timeout: float = 1.0
+    ):
+        self._settings = {
+            'port': port,
+            'baudrate': baudrate,
+            'bytesize': bytesize,
+            'parity': parity,
+            'stopbits': stopbits,
+            'timeout': timeout
+        }
+        self._serial: Any = None
+        self._flush_pending = False
+
+    @property
+    def socket(self) -> Any:
+        """Underlying pyserial port (same attribute name as pymodbus)"""
+        return self._serial
+
+    def connect(self) -> bool:
+        """Open the serial port"""
+        self._serial = serial.Serial(**self._settings)
+        return bool(self._serial.is_open)
+
+    def close(self) -> None:
+        """Close the serial port"""
+        if self._serial:
+            self._serial.close()
+            self._serial = None
+
+    def _transact(self, request: bytes, response_length: int) -> Any:
+        """
+        Send one request frame and read the response
+
+        Args:
+            request: Frame without CRC
+            response_length: Expected length of a normal response incl. CRC
+
+        Returns:
+            Response frame without CRC, or RTUResponse describing the error
+        """
+        crc = crc16_modbus(request)
+        adu = request + bytes((crc & 0xFF, crc >> 8))
+
+        port = self._serial
+        if self._flush_pending:
+            # Drop late bytes left over from a timed-out transaction; the
+            # input buffer is left alone on the healthy path
+            port.reset_input_buffer()
+            self._flush_pending = False
+
+        port.write(adu)
+
+        # Exception responses are 5 bytes, so read the header first
+        frame = port.read(5)
+        if len(frame) == 5 and not frame[1] & 0x80:
+            frame += port.read(response_length - 5)
+
+        if len(frame) < 5 or (len(frame) < response_length and not frame[1] & 0x80):
+            self._flush_pending = True
+            return RTUResponse(error=f"RTU timeout ({len(frame)}/{response_length} bytes)")
+
+        body, received_crc = frame[:-2], frame[-2] | (frame[-1] << 8)
+        if crc16_modbus(body) != received_crc:
+            self._flush_pending = True
+            return RTUResponse(error="RTU CRC mismatch")
+
+        if body[1] & 0x80:
+            return RTUResponse(error=f"Modbus exception code {body[2]}")
+
+        return body
+
+    def read_holding_registers(self, address: int, count: int, slave: int = 1) -> RTUResponse:
+        """Read holding registers (function code 3)"""
+        request = struct.pack('>BBHH', slave, self.READ_HOLDING_REGISTERS, address, count)
+        body = self._transact(request, 5 + 2 * count)
+        if isinstance(body, RTUResponse):
+            return body
+        return RTUResponse(list(struct.unpack_from(f'>{count}H', body, 3)))
+
+    def write_register(self, address: int, value: int, slave: int = 1) -> RTUResponse:
+        """Write single holding register (function code 6)"""
+        request = struct.pack('>BBHH', slave, self.WRITE_SINGLE_REGISTER, address, value)
+        body = self._transact(request, 8)
+        if isinstance(body, RTUResponse):
+            return body
+        return RTUResponse([value])
+
+    def write_registers(self, address: int, values: List[int], slave: int = 1) -> RTUResponse:
+        """Write multiple holding registers (function code 16)"""
+        request = struct.pack(
+            f'>BBHHB{len(values)}H',
+            slave, self.WRITE_MULTIPLE_REGISTERS,
+            address, len(values), 2 * len(values),
+            *values
+        )
+        body = self._transact(request, 8)
+        if isinstance(body, RTUResponse):
+            return body
+        return RTUResponse(list(values))
+
+    def readwrite_registers(
+        self,
+        read_address: int = 0,
+        read_count: int = 0,
+        write_address: int = 0,
+        values: Optional[List[int]] = None,
+        slave: int = 1
+    ) -> RTUResponse:
+        """Write then read holding registers in one frame (function code 23)"""
+        values = values or []
+        request = struct.pack(
+            f'>BBHHHHB{len(values)}H',
+            slave, self.READ_WRITE_MULTIPLE_REGISTERS,
+            read_address, read_count,
+            write_address, len(values), 2 * len(values),
+            *values
+        )
+        body = self._transact(request, 5 + 2 * read_count)
+        if isinstance(body, RTUResponse):
+            return body
+        return RTUResponse(list(struct.unpack_from(f'>{read_count}H', body, 3)))
+
+
+class SerialLink:
+    """
+    Modbus client, bus lock and connection state of one serial port
+
+    Several RS485Driver instances (one per slave ID on a multi-drop bus) can
+    share a link so they use a single client and never interleave frames.
+    """
+
+    def __init__(self, settings: Optional[Tuple[Any, ...]] = None) -> None:
+        self.client: Any = None
+        self.connected = False
+        self.lock = threading.RLock()
+        self.users = 0
+        # RS485Config.settings() of the driver that opened the link
+        self.settings = settings
+
+
+# Links handed out by create_rs485_driver, keyed by serial port
+_LINKS: Dict[str, SerialLink] = {}
+_LINKS_LOCK = threading.Lock()
+
+
 class RS485Driver:
     """
     RS485 driver for frequency converters and industrial devices
@@ -113,7 +398,8 @@ class RS485Driver:
         self,
         config: RS485Config,
         slave_id: int = 1,
-        register_map: Optional[VFDRegisterMap] = None
+        register_map: Optional[VFDRegisterMap] = None,
+        link: Optional[SerialLink] = None
     ):
         """
         Initialize RS485 driver
@@ -122,8 +408,10 @@ class RS485Driver:
             config: RS485 communication configuration
             slave_id: Modbus slave ID (1-247)
             register_map: Custom register map (None = use default)
+            link: Serial link shared with other drivers on the same port
+                (None = private link)
         """
-        if not MODBUS_AVAILABLE:
+        if not _probe_modbus():
             logger.warning("Modbus not available - running in stub mode")
             self._enabled = False
             return
@@ -132,9 +420,8 @@ class RS485Driver:
         self._config = config
         self._slave_id = slave_id
         self._register_map = register_map or VFDRegisterMap()
-        self._client: Optional[ModbusSerialClient] = None
-        self._lock = threading.Lock()
-        self._connected = False
+        self._link = link or SerialLink()
+        self._released = False
 
         # Statistics
         self._stats = {
@@ -144,13 +431,43 @@ class RS485Driver:
             'last_error': None
         }
 
-        # Connect to device
-        self._connect()
+        # Connect to device unless another driver already opened the link
+        with self._lock:
+            self._link.users += 1
+            if not self._connected:
+                self._connect()
+
+    @property
+    def _lock(self) -> Any:
+        return self._link.lock
+
+    @property
+    def _client(self) -> Any:
+        return self._link.client
+
+    @_client.setter
+    def _client(self, client: Any) -> None:
+        self._link.client = client
+
+    @property
+    def _connected(self) -> bool:
+        return self._link.connected
+
+    @_connected.setter
+    def _connected(self, connected: bool) -> None:
+        self._link.connected = connected
 
     def _connect(self) -> bool:
         """Connect to RS485 device"""
         try:
-            self._client = ModbusSerialClient(
+            client_class: Any = ModbusSerialClient
+            if self._config.native_rtu:
+                if _probe_serial():
+                    client_class = ModbusRTUClient
+                else:
+                    logger.warning("pyserial not available - using pymodbus RTU client")
+
+            self._client = client_class(
                 port=self._config.port,
                 baudrate=self._config.baudrate,
                 bytesize=self._config.bytesize,
@@ -161,6 +478,7 @@ class RS485Driver:
 
             if self._client.connect():
                 self._connected = True
+                self._tune_serial()
                 logger.info(
                     f"RS485 connected: {self._config.port} @ "
                     f"{self._config.baudrate} baud, slave {self._slave_id}"
@@ -178,6 +496,68 @@ class RS485Driver:
             self._connected = False
             return False
 
+    def _tune_serial(self) -> None:
+        """Apply optional timing settings to the open serial port"""
+        port = getattr(self._client, 'socket', None)
+        if port is None:
+            return
+
+        if self._config.write_timeout is not None:
+            port.write_timeout = self._config.write_timeout
+        if self._config.inter_byte_timeout is not None:
+            port.inter_byte_timeout = self._config.inter_byte_timeout
+        if self._config.low_latency:
+            try:
+                port.set_low_latency_mode(True)
+            except (AttributeError, NotImplementedError, OSError, ValueError) as e:
+                logger.warning(f"Could not enable low latency mode on {self._config.port}: {e}")
+
+    def _reconnect(self) -> bool:
+        """Drop the current client and open a fresh connection"""
+        if self._client:
+            try:
+                self._client.close()
+            except Exception as e:
+                logger.debug(f"Ignoring error while closing RS485 client: {e}")
+        self._client = None
+        self._connected = False
+        return self._connect()
+
+    def _ensure_connected(self) -> bool:
+        """Reopen the link if an earlier error dropped it, unless closed"""
+        if self._released:
+            return False
+        if self._connected and self._client:
+            return True
+        return self._reconnect()
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Issue one Modbus request on the open client
+
+        A transport exception (e.g. USB serial adapter glitch) triggers a
+        single reconnect and retry; further errors, and any other exception
+        such as a bug in request handling, propagate to the caller.
+        Must be called with self._lock held.
+
+        Args:
+            method: Name of the ModbusSerialClient method
+            *args: Positional arguments for the request
+            **kwargs: Keyword arguments for the request
+
+        Returns:
+            pymodbus response object
+        """
+        try:
+            return getattr(self._client, method)(*args, slave=self._slave_id, **kwargs)
+        except TRANSPORT_ERRORS as e:
+            logger.warning(f"RS485 transport error, reconnecting: {e}")
+            self._stats['last_error'] = str(e)
+            self._stats['error_count'] += 1
+            if not self._reconnect():
+                raise
+            return getattr(self._client, method)(*args, slave=self._slave_id, **kwargs)
+
     def _read_registers(
         self,
         address: int,
@@ -193,25 +573,22 @@ class RS485Driver:
         Returns:
             List of register values or None on error
         """
-        if not self._connected or not self._client:
-            logger.warning("RS485 not connected")
-            return None
-
         try:
+            # Hold the bus only for the request/response exchange
             with self._lock:
-                result = self._client.read_holding_registers(
-                    address,
-                    count,
-                    slave=self._slave_id
-                )
-
-                if result.isError():
-                    logger.error(f"Error reading registers at {address}: {result}")
-                    self._stats['error_count'] += 1
+                if not self._ensure_connected():
+                    logger.warning("RS485 not connected")
                     return None
 
-                self._stats['read_count'] += 1
-                return result.registers
+                result = self._call('read_holding_registers', address, count)
+
+            if result.isError():
+                logger.error(f"Error reading registers at {address}: {result}")
+                self._stats['error_count'] += 1
+                return None
+
+            self._stats['read_count'] += 1
+            return result.registers
 
         except Exception as e:
             logger.error(f"Exception reading registers: {e}")
@@ -219,6 +596,44 @@ class RS485Driver:
             self._stats['error_count'] += 1
             return None
 
+    def _read_many(
+        self,
+        specs: List[Tuple[int, int]]
+    ) -> Optional[Dict[int, List[int]]]:
+        """
+        Read several register blocks with as few transactions as possible
+
+        Blocks whose gap is smaller than READ_MERGE_GAP are merged into a
+        single read and sliced afterwards. All reads run under one lock
+        acquisition so the result is a consistent snapshot.
+
+        Args:
+            specs: List of (start address, count) tuples
+
+        Returns:
+            Dictionary mapping start address to register values or None on error
+        """
+        groups: List[Tuple[int, int, List[Tuple[int, int]]]] = []
+        for address, count in sorted(specs):
+            if groups and address - groups[-1][1] < READ_MERGE_GAP:
+                start, end, members = groups[-1]
+                members.append((address, count))
+                groups[-1] = (start, max(end, address + count), members)
+            else:
+                groups.append((address, address + count, [(address, count)]))
+
+        results: Dict[int, List[int]] = {}
+        with self._lock:
+            for start, end, members in groups:
+                registers = self._read_registers(start, end - start)
+                if not registers or len(registers) < end - start:
+                    return None
+                for address, count in members:
+                    offset = address - start
+                    results[address] = registers[offset:offset + count]
+
+        return results
+
     def _write_register(self, address: int, value: int) -> bool:
         """
         Write single holding register
@@ -230,28 +645,58 @@ class RS485Driver:
         Returns:
             True if successful
         """
-        if not self._connected or not self._client:
-            logger.warning("RS485 not connected")
+        try:
+            # Hold the bus only for the request/response exchange
+            with self._lock:
+                if not self._ensure_connected():
+                    logger.warning("RS485 not connected")
+                    return False
+
+                result = self._call('write_register', address, value)
+
+            if result.isError():
+                logger.error(f"Error writing register at {address}: {result}")
+                self._stats['error_count'] += 1
+                return False
+
+            self._stats['write_count'] += 1
+            return True
+
+        except Exception as e:
+            logger.error(f"Exception writing register: {e}")
+            self._stats['last_error'] = str(e)
+            self._stats['error_count'] += 1
             return False
 
+    def _write_registers(self, address: int, values: List[int]) -> bool:
+        """
+        Write consecutive holding registers in one request
+
+        Args:
+            address: Starting register address
+            values: Values to write
+
+        Returns:
+            True if successful
+        """
         try:
             with self._lock:
-                result = self._client.write_register(
-                    address,
-                    value,
-                    slave=self._slave_id
-                )
-
-                if result.isError():
-                    logger.error(f"Error writing register at {address}: {result}")
-                    self._stats['error_count'] += 1
+                if not self._ensure_connected():
+                    logger.warning("RS485 not connected")
                     return False
 
-                self._stats['write_count'] += 1
-                return True
+                result = self._call('write_registers', address, values)
+
+            if result.isError():
+                logger.error(f"Error writing registers at {address}: {result}")
+                self._stats['error_count'] += 1
+                return False
+
+            self._stats['write_count'] += 1
+            return True
 
         except Exception as e:
-            logger.error(f"Exception writing register: {e}")
+            logger.error(f"Exception writing registers: {e}")
             self._stats['last_error'] = str(e)
             self._stats['error_count'] += 1
             return False
@@ -267,7 +712,7 @@ class RS485Driver:
             True if successful
         """
         command = VFDCommand.START_FORWARD if forward else VFDCommand.START_REVERSE
-        logger.info(f"Starting motor ({'forward' if forward else 'reverse'})")
+        logger.debug("Starting motor (%s)", 'forward' if forward else 'reverse')
         return self._write_register(
             self._register_map.CONTROL_WORD,
             command
@@ -280,7 +725,7 @@ class RS485Driver:
         Returns:
             True if successful
         """
-        logger.info("Stopping motor")
+        logger.debug("Stopping motor")
         return self._write_register(
             self._register_map.CONTROL_WORD,
             VFDCommand.STOP
@@ -298,12 +743,61 @@ class RS485Driver:
         """
         # Convert to register value (Hz * 100)
         value = int(frequency_hz * 100)
-        logger.info(f"Setting frequency to {frequency_hz} Hz")
+        logger.debug("Setting frequency to %s Hz", frequency_hz)
         return self._write_register(
             self._register_map.FREQUENCY_SETPOINT,
             value
         )
 
+    def set_frequency_and_read_status(self, frequency_hz: float) -> Optional[Dict[str, Any]]:
+        """
+        Set frequency setpoint and read status in one Modbus transaction
+
+        Uses function code 23 (read/write multiple registers), where the
+        device applies the write before the read, so the returned status
+        already reflects the new setpoint. Requires FC23 support on the VFD.
+
+        Args:
+            frequency_hz: Desired frequency in Hz (e.g., 50.0)
+
+        Returns:
+            Dictionary with status information or None on error
+        """
+        value = int(frequency_hz * 100)
+        logger.debug("Setting frequency to %s Hz (with status read)", frequency_hz)
+
+        try:
+            with self._lock:
+                if not self._ensure_connected():
+                    logger.warning("RS485 not connected")
+                    return None
+
+                result = self._call(
+                    'readwrite_registers',
+                    read_address=self._register_map.STATUS_WORD,
+                    read_count=7,
+                    write_address=self._register_map.FREQUENCY_SETPOINT,
+                    values=[value]
+                )
+
+            if result.isError():
+                logger.error(f"Error in read/write registers: {result}")
+                self._stats['error_count'] += 1
+                return None
+
+            self._stats['read_count'] += 1
+            self._stats['write_count'] += 1
+
+        except Exception as e:
+            logger.error(f"Exception in read/write registers: {e}")
+            self._stats['last_error'] = str(e)
+            self._stats['error_count'] += 1
+            return None
+
+        if len(result.registers) < 7:
+            return None
+        return self._decode_status(result.registers)
+
     def get_status(self) -> Optional[Dict[str, Any]]:
         """
         Get VFD status
@@ -319,22 +813,51 @@ class RS485Driver:
         if not registers or len(registers) < 7:
             return None
 
-        status_word = registers[0]
+        return self._decode_status(registers)
 
-        return {
-            'running': bool(status_word & VFDStatus.RUNNING),
-            'forward': bool(status_word & VFDStatus.FORWARD),
-            'reverse': bool(status_word & VFDStatus.REVERSE),
-            'fault': bool(status_word & VFDStatus.FAULT),
-            'at_speed': bool(status_word & VFDStatus.AT_SPEED),
-            'ready': bool(status_word & VFDStatus.READY),
+    def get_full_snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        Get VFD status and active fault code in one polling step
+
+        Both register blocks are read back-to-back without releasing the
+        bus lock, so polling loops get a consistent view.
+
+        Returns:
+            Status dictionary with an additional 'fault_code' key or None on error
+        """
+        status_address = self._register_map.STATUS_WORD
+        fault_address = self._register_map.FAULT_CODE
+        blocks = self._read_many([(status_address, 7), (fault_address, 1)])
+
+        if blocks is None:
+            return None
+
+        snapshot = self._decode_status(blocks[status_address])
+        snapshot['fault_code'] = blocks[fault_address][0]
+        return snapshot
+
+    @staticmethod
+    def _decode_status(registers: List[int]) -> Dict[str, Any]:
+        """
+        Decode the status block starting at STATUS_WORD
+
+        Args:
+            registers: Seven register values starting at STATUS_WORD
+
+        Returns:
+            Dictionary with status information
+        """
+        status_word = registers[0]
+        status = {name: bool(status_word & mask) for name, mask in STATUS_MASKS}
+        status.update({
             'frequency_ref': registers[1] / 100.0,  # Hz
             'output_frequency': registers[2] / 100.0,  # Hz
             'output_current': registers[3] / 10.0,  # A
             'output_voltage': registers[4],  # V
             'dc_bus_voltage': registers[5],  # V
             'output_power': registers[6] / 10.0  # kW
-        }
+        })
+        return status
 
     def get_fault_code(self) -> Optional[int]:
         """
@@ -353,7 +876,7 @@ class RS485Driver:
         Returns:
             True if successful
         """
-        logger.info("Resetting VFD fault")
+        logger.debug("Resetting VFD fault")
         return self._write_register(
             self._register_map.CONTROL_WORD,
             VFDCommand.RESET_FAULT
@@ -385,6 +908,38 @@ class RS485Driver:
         value = int(seconds * 10)
         return self._write_register(self._register_map.DECEL_TIME, value)
 
+    def apply_motion_profile(
+        self,
+        frequency_hz: float,
+        accel_seconds: float,
+        decel_seconds: float
+    ) -> bool:
+        """
+        Set frequency setpoint, acceleration and deceleration time together
+
+        With the default register map the three registers are contiguous and
+        are written in one request; otherwise they are written one by one.
+
+        Args:
+            frequency_hz: Desired frequency in Hz
+            accel_seconds: Acceleration time in seconds
+            decel_seconds: Deceleration time in seconds
+
+        Returns:
+            True if successful
+        """
+        regs = self._register_map
+        values = [int(frequency_hz * 100), int(accel_seconds * 10), int(decel_seconds * 10)]
+        logger.debug("Applying motion profile: %s Hz, accel %s s, decel %s s",
+                     frequency_hz, accel_seconds, decel_seconds)
+
+        start = regs.FREQUENCY_SETPOINT
+        if regs.ACCEL_TIME == start + 1 and regs.DECEL_TIME == start + 2:
+            return self._write_registers(start, values)
+
+        addresses = (regs.FREQUENCY_SETPOINT, regs.ACCEL_TIME, regs.DECEL_TIME)
+        return all([self._write_register(a, v) for a, v in zip(addresses, values)])
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get driver statistics
@@ -401,16 +956,28 @@ class RS485Driver:
         }
 
     def close(self) -> None:
-        """Close RS485 connection"""
-        if self._client:
-            try:
-                self._client.close()
-                logger.info("RS485 connection closed")
-            except Exception as e:
-                logger.error(f"Error closing RS485 connection: {e}")
-            finally:
-                self._client = None
-                self._connected = False
+        """Close RS485 connection (once the last driver on the link closes)"""
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+            self._link.users -= 1
+            if self._link.users > 0:
+                return
+
+            client = self._client
+            self._connected = False
+            self._client = None
+            if client:
+                try:
+                    client.close()
+                    logger.info("RS485 connection closed")
+                except Exception as e:
+                    logger.error(f"Error closing RS485 connection: {e}")
+
+        with _LINKS_LOCK:
+            if _LINKS.get(self._config.port) is self._link and self._link.users == 0:
+                del _LINKS[self._config.port]
 
     def __enter__(self):
         """Context manager entry"""
@@ -421,14 +988,336 @@ class RS485Driver:
         self.close()
 
 
+class AsyncRS485Driver:
+    """
+    asyncio variant of RS485Driver
+
+    Backed by pymodbus' AsyncModbusSerialClient, so coroutines waiting on
+    the serial line do not tie up a thread. Requests on the bus are
+    serialized with an asyncio.Lock.
+    """
+
+    def __init__(
+        self,
+        config: RS485Config,
+        slave_id: int = 1,
+        register_map: Optional[VFDRegisterMap] = None
+    ):
+        """
+        Initialize async RS485 driver (call connect() before use)
+
+        Args:
+            config: RS485 communication configuration
+            slave_id: Modbus slave ID (1-247)
+            register_map: Custom register map (None = use default)
+        """
+        if not _probe_modbus():
+            raise ImportError("pymodbus not installed. Install with: pip install pymodbus pyserial")
+
+        self._config = config
+        self._slave_id = slave_id
+        self._register_map = register_map or VFDRegisterMap()
+        self._client: Any = None
+        self._lock = asyncio.Lock()
+        self._connected = False
+        # Set by close(); requests then fail instead of reopening the port
+        self._closed = False
+
+        # Statistics
+        self._stats = {
+            'read_count': 0,
+            'write_count': 0,
+            'error_count': 0,
+            'last_error': None
+        }
+
+    async def connect(self) -> bool:
+        """Connect to RS485 device (also reopens a closed driver)"""
+        self._closed = False
+        try:
+            self._client = AsyncModbusSerialClient(
+                port=self._config.port,
+                baudrate=self._config.baudrate,
+                bytesize=self._config.bytesize,
+                parity=self._config.parity,
+                stopbits=self._config.stopbits,
+                timeout=self._config.timeout
+            )
+            await self._client.connect()
+            self._connected = bool(self._client.connected)
+
+            if self._connected:
+                logger.info(
+                    f"RS485 (async) connected: {self._config.port} @ "
+                    f"{self._config.baudrate} baud, slave {self._slave_id}"
+                )
+            else:
+                logger.error(f"Failed to connect to RS485 port {self._config.port}")
+            return self._connected
+
+        except Exception as e:
+            logger.error(f"RS485 connection error: {e}")
+            self._stats['last_error'] = str(e)
+            self._stats['error_count'] += 1
+            self._connected = False
+            return False
+
+    async def _reconnect(self) -> bool:
+        """Drop the current client and open a fresh connection"""
+        if self._client:
+            try:
+                self._client.close()
+            except Exception as e:
+                logger.debug(f"Ignoring error while closing RS485 client: {e}")
+        self._client = None
+        self._connected = False
+        return await self.connect()
+
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Issue one request under the bus lock, reconnecting once on transport errors"""
+        async with self._lock:
+            if self._closed:
+                raise ConnectionError("RS485 driver is closed")
+            if not self._connected and not await self._reconnect():
+                raise ConnectionError("RS485 not connected")
+            try:
+                return await getattr(self._client, method)(*args, slave=self._slave_id, **kwargs)
+            except TRANSPORT_ERRORS as e:
+                logger.warning(f"RS485 transport error, reconnecting: {e}")
+                self._stats['last_error'] = str(e)
+                self._stats['error_count'] += 1
+                if not await self._reconnect():
+                    raise
+                return await getattr(self._client, method)(*args, slave=self._slave_id, **kwargs)
+
+    async def _read_registers(self, address: int, count: int = 1) -> Optional[List[int]]:
+        """
+        Read holding registers
+
+        Args:
+            address: Starting register address
+            count: Number of registers to read
+
+        Returns:
+            List of register values or None on error
+        """
+        try:
+            result = await self._call('read_holding_registers', address, count)
+        except Exception as e:
+            logger.error(f"Exception reading registers: {e}")
+            self._stats['last_error'] = str(e)
+            self._stats['error_count'] += 1
+            return None
+
+        if result.isError():
+            logger.error(f"Error reading registers at {address}: {result}")
+            self._stats['error_count'] += 1
+            return None
+
+        self._stats['read_count'] += 1
+        return result.registers
+
+    async def _write_register(self, address: int, value: int) -> bool:
+        """
+        Write single holding register
+
+        Args:
+            address: Register address
+            value: Value to write
+
+        Returns:
+            True if successful
+        """
+        try:
+            result = await self._call('write_register', address, value)
+        except Exception as e:
+            logger.error(f"Exception writing register: {e}")
+            self._stats['last_error'] = str(e)
+            self._stats['error_count'] += 1
+            return False
+
+        if result.isError():
+            logger.error(f"Error writing register at {address}: {result}")
+            self._stats['error_count'] += 1
+            return False
+
+        self._stats['write_count'] += 1
+        return True
+
+    async def start_motor(self, forward: bool = True) -> bool:
+        """Start motor in forward or reverse direction"""
+        command = VFDCommand.START_FORWARD if forward else VFDCommand.START_REVERSE
+        logger.debug("Starting motor (%s)", 'forward' if forward else 'reverse')
+        return await self._write_register(self._register_map.CONTROL_WORD, command)
+
+    async def stop_motor(self) -> bool:
+        """Stop motor"""
+        logger.debug("Stopping motor")
+        return await self._write_register(self._register_map.CONTROL_WORD, VFDCommand.STOP)
+
+    async def set_frequency(self, frequency_hz: float) -> bool:
+        """Set motor frequency setpoint in Hz"""
+        logger.debug("Setting frequency to %s Hz", frequency_hz)
+        return await self._write_register(
+            self._register_map.FREQUENCY_SETPOINT,
+            int(frequency_hz * 100)
+        )
+
+    async def reset_fault(self) -> bool:
+        """Reset VFD fault"""
+        logger.debug("Resetting VFD fault")
+        return await self._write_register(self._register_map.CONTROL_WORD, VFDCommand.RESET_FAULT)
+
+    async def get_status(self) -> Optional[Dict[str, Any]]:
+        """Get VFD status (see RS485Driver.get_status)"""
+        registers = await self._read_registers(self._register_map.STATUS_WORD, 7)
+        if not registers or len(registers) < 7:
+            return None
+        return RS485Driver._decode_status(registers)
+
+    async def get_fault_code(self) -> Optional[int]:
+        """Get active fault code"""
+        registers = await self._read_registers(self._register_map.FAULT_CODE, 1)
+        return registers[0] if registers else None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get driver statistics"""
+        return {
+            'connected': self._connected,
+            'port': self._config.port,
+            'baudrate': self._config.baudrate,
+            'slave_id': self._slave_id,
+            **self._stats
+        }
+
+    async def close(self) -> None:
+        """Close RS485 connection"""
+        async with self._lock:
+            self._closed = True
+            if self._client:
+                try:
+                    self._client.close()
+                    logger.info("RS485 (async) connection closed")
+                except Exception as e:
+                    logger.error(f"Error closing RS485 connection: {e}")
+                finally:
+                    self._client = None
+                    self._connected = False
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+
+
+class VFDFleetStatus:
+    """
+    Status blocks of several VFDs stored as one (n_devices, 7) uint16 array
+
+    Each poll writes a device's STATUS_WORD block into its row; decoding then
+    runs as vectorized NumPy operations over the whole fleet instead of
+    building one dict per device field by field.
+    """
+
+    STATUS_BLOCK_SIZE = 7
+
+    def __init__(self, device_ids: List[str]):
+        """
+        Initialize fleet status table
+
+        Args:
+            device_ids: Device identifiers, one row each
+        """
+        import numpy as np  # Only needed for fleet polling
+
+        self._np = np
+        self.device_ids = list(device_ids)
+        self._rows = {device_id: row for row, device_id in enumerate(self.device_ids)}
+        self.registers = np.zeros((len(self.device_ids), self.STATUS_BLOCK_SIZE), dtype=np.uint16)
+        self.valid = np.zeros(len(self.device_ids), dtype=bool)
+
+    def update(self, device_id: str, registers: Optional[List[int]]) -> None:
+        """
+        Store a device's status block (None marks the device as unavailable)
+
+        Args:
+            device_id: Device identifier
+            registers: Seven register values starting at STATUS_WORD
+        """
+        row = self._rows[device_id]
+        if registers is None or len(registers) < self.STATUS_BLOCK_SIZE:
+            self.valid[row] = False
+            return
+        self.registers[row] = registers[:self.STATUS_BLOCK_SIZE]
+        self.valid[row] = True
+
+    def poll(self, drivers: Dict[str, 'RS485Driver']) -> None:
+        """
+        Read the status block of every device into the table
+
+        Args:
+            drivers: Mapping of device identifier to its driver
+        """
+        for device_id, driver in drivers.items():
+            self.update(
+                device_id,
+                driver._read_registers(driver._register_map.STATUS_WORD, self.STATUS_BLOCK_SIZE)
+            )
+
+    def decode_columns(self) -> Dict[str, Any]:
+        """
+        Decode all rows at once
+
+        Returns:
+            Dictionary of field name to NumPy array with one entry per device
+        """
+        regs = self.registers
+        status_words = regs[:, 0]
+        columns: Dict[str, Any] = {
+            name: (status_words & mask) != 0 for name, mask in STATUS_MASKS
+        }
+        columns.update({
+            'frequency_ref': regs[:, 1] / 100.0,  # Hz
+            'output_frequency': regs[:, 2] / 100.0,  # Hz
+            'output_current': regs[:, 3] / 10.0,  # A
+            'output_voltage': regs[:, 4],  # V
+            'dc_bus_voltage': regs[:, 5],  # V
+            'output_power': regs[:, 6] / 10.0  # kW
+        })
+        return columns
+
+    def decode(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Decode the fleet into per-device status dictionaries
+
+        Returns:
+            Mapping of device identifier to the same dictionary get_status()
+            returns; devices without a valid reading are omitted
+        """
+        columns = self.decode_columns()
+        names = list(columns)
+        rows = zip(*(column.tolist() for column in columns.values()))
+        return {
+            device_id: dict(zip(names, values))
+            for device_id, ok, values in zip(self.device_ids, self.valid.tolist(), rows)
+            if ok
+        }
+
+
 class RS485Stub:
     """Stub implementation when RS485/Modbus is not available"""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         logger.info("Using RS485 stub (Modbus not available)")
 
     def start_motor(self, forward: bool = True) -> bool:
-        logger.debug(f"RS485 stub: start_motor (forward={forward})")
+        logger.debug("RS485 stub: start_motor (forward=%s)", forward)
         return False
 
     def stop_motor(self) -> bool:
@@ -436,7 +1325,14 @@ class RS485Stub:
         return False
 
     def set_frequency(self, frequency_hz: float) -> bool:
-        logger.debug(f"RS485 stub: set_frequency ({frequency_hz} Hz)")
+        logger.debug("RS485 stub: set_frequency (%s Hz)", frequency_hz)
+        return False
+
+    def set_frequency_and_read_status(self, frequency_hz: float) -> Optional[Dict[str, Any]]:
+        return None
+
+    def apply_motion_profile(self, frequency_hz: float, accel_seconds: float,
+                             decel_seconds: float) -> bool:
         return False
 
     def get_status(self) -> Optional[Dict[str, Any]]:
@@ -445,6 +1341,9 @@ class RS485Stub:
     def get_fault_code(self) -> Optional[int]:
         return None
 
+    def get_full_snapshot(self) -> Optional[Dict[str, Any]]:
+        return None
+
     def reset_fault(self) -> bool:
         return False
 
@@ -466,9 +1365,24 @@ def create_rs485_driver(config: RS485Config, **kwargs) -> Any:
     """
     Create RS485 driver instance
 
-    Returns RS485Driver if Modbus is available, otherwise RS485Stub
+    Returns RS485Driver if Modbus is available, otherwise RS485Stub.
+    Drivers created for the same port share one serial link, so several
+    slave IDs on a multi-drop bus use a single connection.
+
+    Raises:
+        ValueError: If the port is already open with different serial settings
     """
-    if MODBUS_AVAILABLE:
-        return RS485Driver(config, **kwargs)
+    if _probe_modbus():
+        settings = config.settings()
+        with _LINKS_LOCK:
+            link = _LINKS.get(config.port)
+            if link is None:
+                link = _LINKS[config.port] = SerialLink(settings)
+            elif link.settings != settings:
+                raise ValueError(
+                    f"RS485 port {config.port} is already open with different "
+                    f"serial settings"
+                )
+            return RS485Driver(config, link=link, **kwargs)
     else:
         return RS485Stub(config, **kwargs)
@@ -1,11 +1,32 @@
 """Secrets management for MODAX Control Layer"""
 import os
+import time
 import logging
-from typing import Dict, Optional
+import functools
+from typing import Any, Callable, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+def _ttl_cache(seconds: float) -> Callable:
+    """
+    Cache a SecretsManager method result on the instance for a limited time
+
+    Callers get a copy of the cached dict so they cannot alter it.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self: 'SecretsManager') -> Dict[str, Optional[str]]:
+            now = time.monotonic()
+            cached = self._result_cache.get(func.__name__)
+            if cached is None or cached[0] <= now:
+                cached = (now + seconds, func(self))
+                self._result_cache[func.__name__] = cached
+            return dict(cached[1])
+        return wrapper
+    return decorator
+
+
 class SecretsManager:
     """Manages secrets with support for environment variables and Vault"""
 
@@ -19,6 +40,16 @@ class SecretsManager:
         self.use_vault = use_vault
         self.vault_client = None
 
+        # Snapshot of the environment; call refresh_env() to pick up changes
+        self._env: Dict[str, str] = dict(os.environ)
+
+        # Results of the credential helpers, see _ttl_cache
+        self._result_cache: Dict[str, Tuple[float, Dict[str, Optional[str]]]] = {}
+
+        # Whole 'modax/secrets' KV document with its fetch time (monotonic)
+        self._vault_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._vault_cache_ttl = float(os.getenv('VAULT_CACHE_TTL', '30'))
+
         if use_vault:
             self._initialize_vault()
 
@@ -75,23 +106,52 @@ class SecretsManager:
         else:
             return self._get_env_secret(key, default)
 
+    def refresh_env(self) -> None:
+        """Reload the environment snapshot used for secret lookups"""
+        self._env = dict(os.environ)
+        self._result_cache.clear()
+
+    def refresh(self) -> None:
+        """Drop all cached secrets so the next lookup re-reads every source"""
+        self.refresh_env()
+        self._vault_cache = None
+
     def _get_env_secret(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """Get secret from environment variable"""
-        value = os.getenv(key, default)
+        value = self._env.get(key, default)
         if value is None:
-            logger.warning(f"Secret '{key}' not found in environment variables")
+            logger.warning("Secret '%s' not found in environment variables", key)
         return value
 
-    def _get_vault_secret(self, key: str, default: Optional[str] = None) -> Optional[str]:
-        """Get secret from HashiCorp Vault"""
+    def _read_vault_secrets(self) -> Dict[str, Any]:
+        """
+        Get the KV v2 document at 'modax/secrets', cached for VAULT_CACHE_TTL seconds
+
+        If a refresh fails while an older copy is cached, the stale copy is
+        served rather than failing every secret lookup.
+        """
+        now = time.monotonic()
+        if self._vault_cache and now - self._vault_cache[0] < self._vault_cache_ttl:
+            return self._vault_cache[1]
+
         try:
-            # Secrets are stored in KV v2 secret engine at path 'modax/secrets'
-            secret_path = f"modax/secrets"
             secret = self.vault_client.secrets.kv.v2.read_secret_version(
-                path=secret_path
+                path="modax/secrets"
             )
+        except Exception:
+            if self._vault_cache:
+                logger.warning("Vault refresh failed, using cached secrets")
+                return self._vault_cache[1]
+            raise
 
-            value = secret['data']['data'].get(key)
+        data = secret['data']['data']
+        self._vault_cache = (now, data)
+        return data
+
+    def _get_vault_secret(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get secret from HashiCorp Vault"""
+        try:
+            value = self._read_vault_secrets().get(key)
             if value is None:
                 logger.warning(f"Secret '{key}' not found in Vault")
                 return default
@@ -102,6 +162,7 @@ class SecretsManager:
             logger.error(f"Failed to retrieve secret '{key}' from Vault: {e}")
             return default
 
+    @_ttl_cache(seconds=30)
     def get_mqtt_credentials(self) -> Dict[str, Optional[str]]:
         """Get MQTT credentials"""
         return {
@@ -109,6 +170,7 @@ class SecretsManager:
             'password': self.get_secret('MQTT_PASSWORD')
         }
 
+    @_ttl_cache(seconds=30)
     def get_mqtt_tls_config(self) -> Dict[str, Optional[str]]:
         """Get MQTT TLS configuration"""
         return {
@@ -117,6 +179,7 @@ class SecretsManager:
             'keyfile': self.get_secret('MQTT_KEYFILE')
         }
 
+    @_ttl_cache(seconds=30)
     def get_api_keys(self) -> Dict[str, Optional[str]]:
         """Get API keys for authentication"""
         return {
@@ -125,6 +188,7 @@ class SecretsManager:
             'admin': self.get_secret('ADMIN_API_KEY')
         }
 
+    @_ttl_cache(seconds=30)
     def get_database_credentials(self) -> Dict[str, Optional[str]]:
         """Get database credentials"""
         return {
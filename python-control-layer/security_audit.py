@@ -1,13 +1,170 @@
 """Security audit logging for MODAX Control Layer"""
-import json
+import atexit
 import logging
-from datetime import datetime
-from typing import Dict, Optional
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
 
+from json_utils import dumps
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(event: Dict[str, Any]) -> str:
+    """Serialize an audit event as one compact JSON line"""
+    return dumps(event).decode('utf-8')
+
+
+# (epoch second, formatted 'YYYY-MM-DDTHH:MM:SS', '+HH:MM' offset) of the last timestamp
+_timestamp_cache: Tuple[int, str, str] = (-1, '', '')
+
+
+def _local_timestamp() -> str:
+    """
+    Current local time in ISO-8601 with microseconds and UTC offset
+
+    Same output as datetime.now().astimezone().isoformat(), but the date,
+    time-of-day and offset are looked up and formatted only once per second.
+    """
+    global _timestamp_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix, offset = _timestamp_cache
+    if second != cached_second:
+        local = time.localtime(second)
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', local)
+        minutes = abs(local.tm_gmtoff) // 60
+        sign = '-' if local.tm_gmtoff < 0 else '+'
+        offset = f"{sign}{minutes // 60:02d}:{minutes % 60:02d}"
+        _timestamp_cache = (second, prefix, offset)
+    return f"{prefix}.{int((now - second) * 1e6):06d}{offset}"
+
+
+class AuditFileHandler(logging.Handler):
+    """
+    Append-only audit handler with a background writer thread
+
+    emit() only enqueues the pre-serialized JSON line. The writer thread
+    drains the queue in batches, writes each batch with one write() on an
+    O_APPEND descriptor and syncs the file to disk at most every
+    sync_interval seconds (and on flush/close).
+    """
+
+    MAX_BATCH = 256
+
+    def __init__(self, path: Path, mode: int = 0o640, sync_interval: float = 0.1):
+        super().__init__()
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_CLOEXEC', 0)
+        self._fd = os.open(path, flags, mode)
+        self._sync_interval = sync_interval
+        self._last_sync = time.monotonic()
+        self._dirty = False
+        self._closed = False
+
+        # Holds message strings, threading.Event flush markers and a None stop sentinel
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="audit-writer", daemon=True
+        )
+        self._writer.start()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._queue.put(record.getMessage())
+        except Exception:
+            self.handleError(record)
+
+    def _writer_loop(self):
+        """Drain the queue in batches until the stop sentinel arrives"""
+        while True:
+            try:
+                item = self._queue.get(timeout=self._sync_interval if self._dirty else None)
+            except queue.Empty:
+                self._sync()
+                continue
+
+            lines, markers, stop = self._collect_batch(item)
+
+            if lines:
+                lines.append('')
+                self._write('\n'.join(lines).encode('utf-8'))
+
+            if markers or stop or time.monotonic() - self._last_sync >= self._sync_interval:
+                self._sync()
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+
+    def _collect_batch(self, item):
+        """
+        Gather queued items into one batch without blocking
+
+        Args:
+            item: First item, already taken from the queue
+
+        Returns:
+            Tuple of (log lines, flush markers, whether the stop sentinel came)
+        """
+        lines = []
+        markers = []
+        while True:
+            if isinstance(item, str):
+                lines.append(item)
+            elif item is None:
+                return lines, markers, True
+            else:
+                markers.append(item)
+            if len(lines) >= self.MAX_BATCH:
+                return lines, markers, False
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return lines, markers, False
+
+    def _write(self, data: bytes):
+        """Write a batch, retrying on short writes"""
+        view = memoryview(data)
+        try:
+            while view:
+                view = view[os.write(self._fd, view):]
+            self._dirty = True
+        except OSError as e:
+            logger.error(f"Failed to write security audit log: {e}")
+
+    def _sync(self):
+        """Flush written data to stable storage"""
+        if self._dirty:
+            try:
+                getattr(os, 'fdatasync', os.fsync)(self._fd)
+            except OSError as e:
+                logger.error(f"Failed to sync security audit log: {e}")
+            self._dirty = False
+        self._last_sync = time.monotonic()
+
+    def flush(self):
+        """Block until all queued events are written and synced"""
+        if not self._closed and self._writer.is_alive():
+            marker = threading.Event()
+            self._queue.put(marker)
+            marker.wait()
+
+    def close(self):
+        self.acquire()
+        try:
+            if not self._closed:
+                self._closed = True
+                self._queue.put(None)
+                self._writer.join()
+                os.close(self._fd)
+        finally:
+            self.release()
+        super().close()
+
+
 class SecurityAuditLogger:
     """Handles security audit logging for authentication, authorization, and control events"""
 
@@ -23,28 +180,41 @@ class SecurityAuditLogger:
     SEVERITY_ERROR = "ERROR"
     SEVERITY_CRITICAL = "CRITICAL"
 
-    def __init__(self, audit_log_path: Optional[str] = None):
+    _RESERVED_KEYS = frozenset(("timestamp", "event_type", "severity"))
+
+    def __init__(self, audit_log_path: Optional[str] = None,
+                 handler: Optional[logging.Handler] = None):
         """
         Initialize security audit logger
 
         Args:
             audit_log_path: Path to audit log file. If None, uses default location.
+            handler: Handler to receive the JSON event lines instead of the
+                audit log file (e.g. a StreamHandler over io.StringIO).
+                audit_log_path is not opened when a handler is given.
         """
-        if audit_log_path is None:
-            audit_log_path = "/var/log/modax/security_audit.log"
+        # Pre-serialized '"event_type":...,"severity":...' fragments
+        self._event_heads: Dict[tuple, str] = {}
 
-        self.audit_log_path = Path(audit_log_path)
+        if handler is None:
+            if audit_log_path is None:
+                audit_log_path = "/var/log/modax/security_audit.log"
 
-        # Ensure audit log directory exists
-        self.audit_log_path.parent.mkdir(parents=True, exist_ok=True)
+            self.audit_log_path: Optional[Path] = Path(audit_log_path)
 
-        # Set up file handler for audit logs
-        self.audit_handler = logging.FileHandler(self.audit_log_path)
-        self.audit_handler.setLevel(logging.INFO)
+            # Ensure audit log directory exists
+            self.audit_log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Use JSON format for structured logging
-        formatter = logging.Formatter('%(message)s')
-        self.audit_handler.setFormatter(formatter)
+            # Set up file handler for audit logs; messages are already JSON and
+            # file writes happen on the handler's background thread, so callers
+            # on control paths only pay for a queue put
+            handler = AuditFileHandler(self.audit_log_path)
+        else:
+            self.audit_log_path = None
+
+        self.audit_handler = handler
+        self.audit_handler.setLevel(logging.INFO)
+        atexit.register(self.close)
 
         # Create separate logger for audit events
         self.audit_logger = logging.getLogger("modax.security.audit")
@@ -52,16 +222,41 @@ class SecurityAuditLogger:
         self.audit_logger.addHandler(self.audit_handler)
         self.audit_logger.propagate = False
 
+    def flush(self):
+        """Block until all queued audit events are written to disk"""
+        self.audit_handler.flush()
+
+    def close(self):
+        """Write pending audit events and release the log file"""
+        # Drop the exit hook so closed loggers are not kept alive until exit
+        atexit.unregister(self.close)
+        self.audit_logger.removeHandler(self.audit_handler)
+        self.audit_handler.close()
+
     def _log_event(self, event_type: str, severity: str, **kwargs):
         """Log a security audit event"""
-        event = {
-            "timestamp": datetime.now().astimezone().isoformat(),
-            "event_type": event_type,
-            "severity": severity,
-            **kwargs
-        }
+        timestamp = _local_timestamp()
+
+        if self._RESERVED_KEYS.intersection(kwargs):
+            # Caller overrides a base field, keep plain dict semantics
+            event = {"timestamp": timestamp, "event_type": event_type, "severity": severity}
+            event.update(kwargs)
+            self.audit_logger.info(_dumps(event))
+            return
+
+        # The event_type/severity part is serialized once per combination
+        head = self._event_heads.get((event_type, severity))
+        if head is None:
+            head = _dumps({"event_type": event_type, "severity": severity})[1:-1]
+            self._event_heads[(event_type, severity)] = head
+
+        message = f'{{"timestamp":"{timestamp}",{head}'
+        if kwargs:
+            message += ',' + _dumps(kwargs)[1:]
+        else:
+            message += '}'
 
-        self.audit_logger.info(json.dumps(event))
+        self.audit_logger.info(message)
 
     def log_authentication_success(
         self,
@@ -184,7 +379,6 @@ def get_security_audit_logger() -> SecurityAuditLogger:
     global _audit_logger
     if _audit_logger is None:
         # In development, use local directory
-        import os
         if os.getenv("ENVIRONMENT", "development") == "development":
             audit_path = "./logs/security_audit.log"
         else:
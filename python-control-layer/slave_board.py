@@ -24,11 +24,16 @@ Compatible Boards:
 """
 
 import logging
-from typing import Optional, Dict, Any, List
+import queue
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from enum import IntEnum
 from dataclasses import dataclass
+import struct
 import threading
 import time
+import numpy as np
 
 try:
     import smbus2
@@ -39,6 +44,26 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Addresses probed with a read instead of a quick write during discovery;
+# like i2cdetect, avoid quick writes to EEPROM ranges where they can latch
+# write-protect state
+I2C_READ_PROBE_ADDRESSES = frozenset(list(range(0x30, 0x38)) + list(range(0x50, 0x60)))
+
+# Maximum commands the I2C worker takes from its queue per batch
+I2C_WORKER_BATCH = 32
+
+# Minimum seconds between logged I/O errors for one slave
+I2C_ERROR_LOG_INTERVAL = 5.0
+
+# Big-endian reply layouts: 16-bit analog value; firmware major/minor/patch,
+# one pad byte and uptime in milliseconds
+_ANALOG_REPLY = struct.Struct('>H')
+_INFO_REPLY = struct.Struct('>3BxI')
+_INV_65535 = 1.0 / 65535.0
+
+# PWM write layout: command and channel byte, then a big-endian 16-bit value
+_PWM_WRITE = struct.Struct('>BBH')
+
 
 class SlaveType(IntEnum):
     """Slave board types"""
@@ -82,6 +107,16 @@ class SlaveStatus:
     uptime: Optional[float] = None
 
 
+class _IOCounters:
+    """Transaction counters owned by a single thread"""
+    __slots__ = ('reads', 'writes', 'errors')
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+        self.errors = 0
+
+
 # I2C Protocol Command Codes
 class I2CCommand:
     """I2C protocol command codes for slave board communication"""
@@ -92,6 +127,16 @@ class I2CCommand:
     CMD_GET_INFO = 0x10       # Get board information
 
 
+# Argument-less read commands as ready-made payloads
+_READ_DIGITAL = bytes((I2CCommand.CMD_READ_DIGITAL,))
+_GET_INFO = bytes((I2CCommand.CMD_GET_INFO,))
+
+# Per-slave I/O closures bound to the slave address at add_slave time
+_SlaveHandlers = namedtuple(
+    '_SlaveHandlers', ['read_digital', 'write_digital', 'read_analog', 'write_pwm']
+)
+
+
 class SlaveBoardI2C:
     """
     I2C-based slave board driver
@@ -103,7 +148,9 @@ class SlaveBoardI2C:
     def __init__(
         self,
         bus: int = 1,
-        auto_discover: bool = True
+        auto_discover: bool = True,
+        info_ttl: float = 5.0,
+        max_slaves: int = 128
     ):
         """
         Initialize I2C slave board manager
@@ -111,26 +158,58 @@ class SlaveBoardI2C:
         Args:
             bus: I2C bus number (typically 1 for Raspberry Pi)
             auto_discover: Auto-discover slave boards on startup
+            info_ttl: Seconds board info is served from cache while the
+                slave keeps responding
+            max_slaves: Capacity of the slave status table
+
+        Raises:
+            ImportError: smbus2 is not installed
+            ConnectionError: The I2C bus cannot be opened
         """
         if not I2C_AVAILABLE:
-            logger.warning("I2C not available - running in stub mode")
-            self._enabled = False
-            return
+            raise ImportError("smbus2 not installed. Install with: pip install smbus2")
 
         self._enabled = True
         self._bus_num = bus
+        self._info_ttl = info_ttl
         self._bus: Optional[smbus2.SMBus] = None
         self._slaves: Dict[int, SlaveConfig] = {}
-        self._status: Dict[int, SlaveStatus] = {}
+        self._handlers: Dict[int, _SlaveHandlers] = {}
+        self._addr_of: Dict[int, int] = {}  # slave_id -> I2C address
+        # slave_id -> (monotonic time of last logged error, errors suppressed since)
+        self._error_log: Dict[int, Tuple[float, int]] = {}
+
+        # Slave health as parallel columns indexed by slot, so fleet-wide
+        # scans are single vectorized reductions
+        self._slots: Dict[int, int] = {}  # slave_id -> slot
+        self._slot_ids: List[int] = []    # slot -> slave_id
+        self._online = np.zeros(max_slaves, dtype=bool)
+        self._last_seen = np.zeros(max_slaves, dtype=np.float64)
+        self._error_count = np.zeros(max_slaves, dtype=np.uint32)
+        self._info: Dict[int, Tuple[str, float]] = {}  # firmware, uptime
+        # Constant part of get_slave_info results, built in add_slave
+        self._info_static: Dict[int, Dict[str, Any]] = {}
+        # _lock guards the slave tables; _bus_lock serializes transactions
+        # on the shared I2C file descriptor
         self._lock = threading.Lock()
+        self._bus_lock = threading.Lock()
+        # Prebuilt (write, read) i2c_msg pairs keyed by address, command
+        # and reply length; reused under _bus_lock
+        self._msg_cache: Dict[tuple, tuple] = {}
+
+        # Queued commands as (method, args, future) plus a None stop
+        # sentinel; the worker thread is started on first use
+        self._cmd_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        # Set by close(); later async commands never start a worker
+        self._closed = False
 
         # Statistics
-        self._stats = {
-            'read_count': 0,
-            'write_count': 0,
-            'error_count': 0,
-            'slaves_discovered': 0
-        }
+        self._slaves_discovered = 0
+        # Read/write/error counts are kept per thread and summed in
+        # get_statistics, so hot paths never share a counter
+        self._tls = threading.local()
+        self._counters: List[_IOCounters] = []
 
         # Initialize I2C bus
         self._init_bus()
@@ -139,16 +218,81 @@ class SlaveBoardI2C:
         if auto_discover:
             self.discover_slaves()
 
-    def _init_bus(self) -> bool:
-        """Initialize I2C bus"""
+    def _init_bus(self) -> None:
+        """
+        Initialize I2C bus
+
+        The I/O methods do not re-check the bus on every call, so a bus that
+        cannot be opened fails construction instead of leaving a disabled
+        manager behind.
+        """
         try:
             self._bus = smbus2.SMBus(self._bus_num)
-            logger.info(f"I2C bus {self._bus_num} initialized")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to initialize I2C bus: {e}")
-            self._enabled = False
-            return False
+        except OSError as e:
+            raise ConnectionError(f"Failed to initialize I2C bus {self._bus_num}: {e}") from e
+        logger.info(f"I2C bus {self._bus_num} initialized")
+
+    def _cmd_read(self, address: int, command: bytes, length: int) -> bytes:
+        """
+        Send a command and read the reply in one combined I2C transaction
+
+        The write and read messages are joined with a repeated START, so the
+        slave keeps its command context and only one ioctl is issued. The
+        message structs are built once per command and reused, so steady
+        polling allocates no ctypes buffers.
+
+        Args:
+            address: Slave I2C address
+            command: Command byte followed by optional arguments
+            length: Number of bytes to read
+
+        Returns:
+            Reply bytes
+        """
+        key = (address, command, length)
+        messages = self._msg_cache.get(key)
+        if messages is None:
+            messages = (
+                smbus2.i2c_msg.write(address, command),
+                smbus2.i2c_msg.read(address, length)
+            )
+            self._msg_cache[key] = messages
+
+        with self._bus_lock:
+            self._bus.i2c_rdwr(*messages)
+            # Copy out before the shared read buffer can be reused
+            return bytes(messages[1])
+
+    def _cmd_write(self, address: int, payload: bytes) -> None:
+        """
+        Send a command with its arguments as one plain I2C write
+
+        The address travels in the message itself, so switching between
+        slaves needs no I2C_SLAVE ioctl. On the wire this is identical to
+        an SMBus I2C block write.
+
+        Args:
+            address: Slave I2C address
+            payload: Command byte followed by its arguments
+        """
+        message = smbus2.i2c_msg.write(address, payload)
+        with self._bus_lock:
+            self._bus.i2c_rdwr(message)
+
+    def _cmd_write_many(self, address: int, payloads: List[bytes]) -> None:
+        """
+        Send several commands to one slave in a single combined transaction
+
+        Each payload is its own write message, joined by repeated starts, so
+        the slave sees the same frames as from separate _cmd_write calls.
+
+        Args:
+            address: Slave I2C address
+            payloads: Command payloads, each a command byte and its arguments
+        """
+        messages = [smbus2.i2c_msg.write(address, payload) for payload in payloads]
+        with self._bus_lock:
+            self._bus.i2c_rdwr(*messages)
 
     def discover_slaves(self) -> List[int]:
         """
@@ -157,7 +301,7 @@ class SlaveBoardI2C:
         Returns:
             List of discovered slave addresses
         """
-        if not self._enabled or not self._bus:
+        if not self._bus:
             return []
 
         discovered = []
@@ -169,15 +313,20 @@ class SlaveBoardI2C:
         I2C_MAX_ADDR = 0x78  # Exclusive upper bound
         for addr in range(I2C_MIN_ADDR, I2C_MAX_ADDR):
             try:
-                # Try to read from device
-                self._bus.read_byte(addr)
+                with self._bus_lock:
+                    if addr in I2C_READ_PROBE_ADDRESSES:
+                        self._bus.read_byte(addr)
+                    else:
+                        # Zero-length quick write: address phase only, half
+                        # the bus time of a read probe
+                        self._bus.i2c_rdwr(smbus2.i2c_msg.write(addr, []))
                 discovered.append(addr)
                 logger.info(f"Discovered I2C slave at address 0x{addr:02X}")
             except Exception:
-                # Device not present
+                # Device not present (NACK)
                 pass
 
-        self._stats['slaves_discovered'] = len(discovered)
+        self._slaves_discovered = len(discovered)
         return discovered
 
     def add_slave(self, config: SlaveConfig) -> bool:
@@ -191,13 +340,31 @@ class SlaveBoardI2C:
             True if successful
         """
         with self._lock:
+            slot = self._slots.get(config.slave_id)
+            if slot is None:
+                slot = len(self._slot_ids)
+                if slot >= len(self._online):
+                    logger.error(
+                        f"Cannot add slave {config.slave_id}: "
+                        f"status table full ({len(self._online)} slaves)"
+                    )
+                    return False
+                self._slot_ids.append(config.slave_id)
+
             self._slaves[config.slave_id] = config
-            self._status[config.slave_id] = SlaveStatus(
-                slave_id=config.slave_id,
-                online=False,
-                last_seen=0,
-                error_count=0
-            )
+            self._handlers[config.slave_id] = self._make_handlers(config.address)
+            self._addr_of[config.slave_id] = config.address
+            self._slots[config.slave_id] = slot
+            self._online[slot] = False
+            self._last_seen[slot] = 0.0
+            self._error_count[slot] = 0
+            self._info.pop(config.slave_id, None)
+            self._info_static[config.slave_id] = {
+                'slave_id': config.slave_id,
+                'description': config.description,
+                'type': config.slave_type.name,
+                'address': f"0x{config.address:02X}"
+            }
 
         logger.info(
             f"Added slave {config.slave_id}: {config.description} "
@@ -205,6 +372,43 @@ class SlaveBoardI2C:
         )
         return True
 
+    def _make_handlers(self, address: int) -> _SlaveHandlers:
+        """
+        Build the I/O closures for one slave
+
+        The address and bus helpers are captured as closure cells, so a
+        call needs no config lookup or attribute access.
+
+        Args:
+            address: Slave I2C address
+
+        Returns:
+            Handlers for digital/analog reads and digital/PWM writes
+        """
+        cmd_read = self._cmd_read
+        cmd_write = self._cmd_write
+
+        def read_digital(pin: int) -> bool:
+            # Protocol: CMD_READ_DIGITAL (0x01) -> 1 byte of pin states
+            return bool(cmd_read(address, _READ_DIGITAL, 1)[0] & (1 << pin))
+
+        def write_digital(pin: int, value: bool) -> None:
+            # Protocol: CMD_WRITE_DIGITAL (0x02), PIN, VALUE
+            cmd_write(address, bytes((I2CCommand.CMD_WRITE_DIGITAL, pin, 1 if value else 0)))
+
+        def read_analog(channel: int) -> float:
+            # Protocol: CMD_READ_ANALOG (0x03), CHANNEL -> 16-bit value
+            data = cmd_read(address, bytes((I2CCommand.CMD_READ_ANALOG, channel)), 2)
+            return _ANALOG_REPLY.unpack_from(data)[0] * _INV_65535
+
+        def write_pwm(channel: int, duty_cycle: float) -> None:
+            # Protocol: CMD_WRITE_PWM (0x04), CHANNEL, VALUE_HIGH, VALUE_LOW
+            cmd_write(address, _PWM_WRITE.pack(
+                I2CCommand.CMD_WRITE_PWM, channel, int(duty_cycle * 65535)
+            ))
+
+        return _SlaveHandlers(read_digital, write_digital, read_analog, write_pwm)
+
     def read_digital_input(self, slave_id: int, pin: int) -> Optional[bool]:
         """
         Read digital input from slave
@@ -216,32 +420,22 @@ class SlaveBoardI2C:
         Returns:
             Pin state (True/False) or None on error
         """
-        if not self._enabled or not self._bus:
-            return None
-
-        config = self._slaves.get(slave_id)
-        if not config:
+        try:
+            handlers = self._handlers[slave_id]
+        except KeyError:
             logger.error(f"Slave {slave_id} not found")
             return None
 
         try:
-            # Read from slave using I2C protocol
-            # Protocol: CMD_READ_DIGITAL (0x01), PIN
-            data = self._bus.read_i2c_block_data(
-                config.address,
-                I2CCommand.CMD_READ_DIGITAL,
-                1
-            )
+            state = handlers.read_digital(pin)
 
-            self._stats['read_count'] += 1
+            self._io_counters().reads += 1
             self._update_slave_status(slave_id, True)
 
-            return bool(data[0] & (1 << pin))
+            return state
 
         except Exception as e:
-            logger.error(f"Error reading from slave {slave_id}: {e}")
-            self._stats['error_count'] += 1
-            self._update_slave_status(slave_id, False)
+            self._io_failed(slave_id, "reading from", e)
             return None
 
     def write_digital_output(
@@ -261,32 +455,22 @@ class SlaveBoardI2C:
         Returns:
             True if successful
         """
-        if not self._enabled or not self._bus:
-            return False
-
-        config = self._slaves.get(slave_id)
-        if not config:
+        try:
+            handlers = self._handlers[slave_id]
+        except KeyError:
             logger.error(f"Slave {slave_id} not found")
             return False
 
         try:
-            # Write to slave using I2C protocol
-            # Protocol: CMD_WRITE_DIGITAL (0x02), PIN, VALUE
-            self._bus.write_i2c_block_data(
-                config.address,
-                I2CCommand.CMD_WRITE_DIGITAL,
-                [pin, 1 if value else 0]
-            )
+            handlers.write_digital(pin, value)
 
-            self._stats['write_count'] += 1
+            self._io_counters().writes += 1
             self._update_slave_status(slave_id, True)
 
             return True
 
         except Exception as e:
-            logger.error(f"Error writing to slave {slave_id}: {e}")
-            self._stats['error_count'] += 1
-            self._update_slave_status(slave_id, False)
+            self._io_failed(slave_id, "writing to", e)
             return False
 
     def read_analog_input(self, slave_id: int, channel: int) -> Optional[float]:
@@ -300,36 +484,23 @@ class SlaveBoardI2C:
         Returns:
             Analog value (0.0-1.0) or None on error
         """
-        if not self._enabled or not self._bus:
-            return None
-
-        config = self._slaves.get(slave_id)
-        if not config:
+        try:
+            handlers = self._handlers[slave_id]
+        except KeyError:
             logger.error(f"Slave {slave_id} not found")
             return None
 
         try:
-            # Read analog value from slave
-            # Protocol: CMD_READ_ANALOG (0x03), CHANNEL
-            data = self._bus.read_i2c_block_data(
-                config.address,
-                I2CCommand.CMD_READ_ANALOG,
-                2  # 16-bit value
-            )
-
-            # Convert to 0.0-1.0 range
-            raw_value = (data[0] << 8) | data[1]
-            normalized_value = raw_value / 65535.0
+            # Value normalized to the 0.0-1.0 range
+            normalized_value = handlers.read_analog(channel)
 
-            self._stats['read_count'] += 1
+            self._io_counters().reads += 1
             self._update_slave_status(slave_id, True)
 
             return normalized_value
 
         except Exception as e:
-            logger.error(f"Error reading analog from slave {slave_id}: {e}")
-            self._stats['error_count'] += 1
-            self._update_slave_status(slave_id, False)
+            self._io_failed(slave_id, "reading analog from", e)
             return None
 
     def write_pwm_output(
@@ -349,11 +520,9 @@ class SlaveBoardI2C:
         Returns:
             True if successful
         """
-        if not self._enabled or not self._bus:
-            return False
-
-        config = self._slaves.get(slave_id)
-        if not config:
+        try:
+            handlers = self._handlers[slave_id]
+        except KeyError:
             logger.error(f"Slave {slave_id} not found")
             return False
 
@@ -361,91 +530,354 @@ class SlaveBoardI2C:
         duty_cycle = max(0.0, min(1.0, duty_cycle))
 
         try:
-            # Write PWM value to slave
-            # Protocol: CMD_WRITE_PWM (0x04), CHANNEL, VALUE_HIGH, VALUE_LOW
-            raw_value = int(duty_cycle * 65535)
-            value_high = (raw_value >> 8) & 0xFF
-            value_low = raw_value & 0xFF
-
-            self._bus.write_i2c_block_data(
-                config.address,
-                I2CCommand.CMD_WRITE_PWM,
-                [channel, value_high, value_low]
-            )
+            handlers.write_pwm(channel, duty_cycle)
 
-            self._stats['write_count'] += 1
+            self._io_counters().writes += 1
             self._update_slave_status(slave_id, True)
 
             return True
 
         except Exception as e:
-            logger.error(f"Error writing PWM to slave {slave_id}: {e}")
-            self._stats['error_count'] += 1
-            self._update_slave_status(slave_id, False)
+            self._io_failed(slave_id, "writing PWM to", e)
             return False
 
-    def get_slave_info(self, slave_id: int) -> Optional[Dict[str, Any]]:
+    def write_pwm_block(
+        self,
+        slave_id: int,
+        values: Dict[int, float]
+    ) -> bool:
+        """
+        Write several PWM outputs to slave in one transaction
+
+        Args:
+            slave_id: Slave board ID
+            values: Duty cycle (0.0-1.0) per PWM channel
+
+        Returns:
+            True if successful
+        """
+        try:
+            address = self._addr_of[slave_id]
+        except KeyError:
+            logger.error(f"Slave {slave_id} not found")
+            return False
+
+        if not values:
+            return True
+
+        # Protocol: one ordinary CMD_WRITE_PWM (0x04) frame per channel,
+        # all sent in one combined I2C transaction
+        try:
+            self._cmd_write_many(address, [
+                _PWM_WRITE.pack(
+                    I2CCommand.CMD_WRITE_PWM, channel,
+                    int(max(0.0, min(1.0, duty_cycle)) * 65535)
+                )
+                for channel, duty_cycle in values.items()
+            ])
+
+            self._io_counters().writes += 1
+            self._update_slave_status(slave_id, True)
+
+            return True
+
+        except Exception as e:
+            self._io_failed(slave_id, "writing PWM block to", e)
+            return False
+
+    def get_slave_info(
+        self,
+        slave_id: int,
+        force_refresh: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """
         Get slave board information
 
+        Firmware version and uptime are cached and only re-read from the
+        slave when the slave has not been seen within the info TTL.
+
         Args:
             slave_id: Slave board ID
+            force_refresh: Always re-read the info from the slave
 
         Returns:
             Slave information dictionary or None
         """
-        if not self._enabled or not self._bus:
+        address = self._addr_of.get(slave_id)
+        if address is None:
             return None
 
-        config = self._slaves.get(slave_id)
-        status = self._status.get(slave_id)
+        slot = self._slots[slave_id]
+        info = self._info.get(slave_id)
 
-        if not config:
-            return None
+        # A failed poll also bumps last_seen, so offline slaves are re-read
+        if (not force_refresh and info is not None and self._online[slot]
+                and time.time() - self._last_seen[slot] < self._info_ttl):
+            return {
+                **self._info_static[slave_id],
+                'online': bool(self._online[slot]),
+                'firmware_version': info[0],
+                'uptime': info[1]
+            }
 
         try:
             # Read firmware version and uptime
             # Protocol: CMD_GET_INFO (0x10)
-            data = self._bus.read_i2c_block_data(
-                config.address,
-                I2CCommand.CMD_GET_INFO,
+            data = self._cmd_read(
+                address,
+                _GET_INFO,
                 8
             )
 
-            version = f"{data[0]}.{data[1]}.{data[2]}"
-            uptime = (data[4] << 24) | (data[5] << 16) | (data[6] << 8) | data[7]
+            major, minor, patch, uptime = _INFO_REPLY.unpack_from(data)
+            version = f"{major}.{minor}.{patch}"
 
-            if status:
-                status.firmware_version = version
-                status.uptime = uptime / 1000.0  # Convert to seconds
+            self._info[slave_id] = (version, uptime / 1000.0)  # Seconds
+            self._update_slave_status(slave_id, True)
 
             return {
-                'slave_id': slave_id,
-                'description': config.description,
-                'type': config.slave_type.name,
-                'address': f"0x{config.address:02X}",
-                'online': status.online if status else False,
+                **self._info_static[slave_id],
+                'online': True,
                 'firmware_version': version,
                 'uptime': uptime / 1000.0
             }
 
         except Exception as e:
-            logger.error(f"Error getting info from slave {slave_id}: {e}")
+            logger.error("Error getting info from slave %s: %s", slave_id, e)
             return None
 
+    def _submit(self, method, *args) -> Future:
+        """Queue a bus command for the I2C worker thread"""
+        future: Future = Future()
+        with self._lock:
+            if not self._closed:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._worker_loop, name="i2c-worker", daemon=True
+                    )
+                    self._worker.start()
+                # Queued under the lock, so nothing lands behind close()'s sentinel
+                self._cmd_q.put((method, args, future))
+                return future
+
+        # Closed: run inline, so the command fails through the normal error path
+        try:
+            future.set_result(getattr(self, method)(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _worker_loop(self) -> None:
+        """Execute queued commands in batches until the stop sentinel arrives"""
+        while True:
+            batch = [self._cmd_q.get()]
+            while batch[-1] is not None and len(batch) < I2C_WORKER_BATCH:
+                try:
+                    batch.append(self._cmd_q.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is None
+            if stop:
+                batch.pop()
+
+            i = 0
+            while i < len(batch):
+                j = self._coalesced_end(batch, i)
+                self._run_queued(batch[i:j])
+                i = j
+
+            if stop:
+                return
+
+    @staticmethod
+    def _coalesced_end(batch: List[tuple], start: int) -> int:
+        """
+        Find the end of the run of commands that can share one transaction
+
+        Args:
+            batch: Queued (method, args, future) entries
+            start: Index of the first command of the run
+
+        Returns:
+            Index just past the run; only consecutive PWM writes to the same
+            slave are merged, any other command runs on its own
+        """
+        method, args, _ = batch[start]
+        end = start + 1
+        if method == 'write_pwm_output':
+            while (end < len(batch) and batch[end][0] == method
+                   and batch[end][1][0] == args[0]):
+                end += 1
+        return end
+
+    def _run_queued(self, run: List[tuple]) -> None:
+        """
+        Execute a run of queued commands and resolve their futures
+
+        Args:
+            run: Queued (method, args, future) entries from _coalesced_end
+        """
+        method, args, _ = run[0]
+        if len(run) > 1:
+            values = {cmd_args[1]: cmd_args[2] for _, cmd_args, _ in run}
+            method, args = 'write_pwm_block', (args[0], values)
+        try:
+            result = getattr(self, method)(*args)
+        except Exception as e:
+            for _, _, pending in run:
+                pending.set_exception(e)
+        else:
+            for _, _, pending in run:
+                pending.set_result(result)
+
+    def read_digital_input_async(self, slave_id: int, pin: int) -> Future:
+        """
+        Queue a digital input read on the I2C worker thread
+
+        Args:
+            slave_id: Slave board ID
+            pin: Pin number
+
+        Returns:
+            Future resolving to the pin state or None on error
+        """
+        return self._submit('read_digital_input', slave_id, pin)
+
+    def read_analog_input_async(self, slave_id: int, channel: int) -> Future:
+        """
+        Queue an analog input read on the I2C worker thread
+
+        Args:
+            slave_id: Slave board ID
+            channel: Analog channel
+
+        Returns:
+            Future resolving to the normalized value or None on error
+        """
+        return self._submit('read_analog_input', slave_id, channel)
+
+    def write_digital_output_async(self, slave_id: int, pin: int, value: bool) -> Future:
+        """
+        Queue a digital output write on the I2C worker thread
+
+        Args:
+            slave_id: Slave board ID
+            pin: Pin number
+            value: Output state
+
+        Returns:
+            Future resolving to True if successful
+        """
+        return self._submit('write_digital_output', slave_id, pin, value)
+
+    def write_pwm_output_async(self, slave_id: int, channel: int, duty_cycle: float) -> Future:
+        """
+        Queue a PWM output write on the I2C worker thread
+
+        Writes queued back to back for the same slave are sent in one
+        combined I2C transaction (see write_pwm_block).
+
+        Args:
+            slave_id: Slave board ID
+            channel: PWM channel
+            duty_cycle: Duty cycle (0.0-1.0)
+
+        Returns:
+            Future resolving to True if successful
+        """
+        return self._submit('write_pwm_output', slave_id, channel, duty_cycle)
+
+    def _io_counters(self) -> _IOCounters:
+        """Get the calling thread's transaction counters"""
+        try:
+            return self._tls.counters
+        except AttributeError:
+            counters = _IOCounters()
+            with self._lock:
+                self._counters.append(counters)
+            self._tls.counters = counters
+            return counters
+
+    def _io_failed(self, slave_id: int, action: str, error: Exception) -> None:
+        """
+        Record a failed slave transaction
+
+        Counts the error and marks the slave offline. Logging is limited to
+        one message per slave every I2C_ERROR_LOG_INTERVAL seconds, so an
+        unplugged board does not flood the log from a polling loop.
+
+        Args:
+            slave_id: Slave board ID
+            action: Failed operation, e.g. "reading from"
+            error: Exception raised by the transaction
+        """
+        self._io_counters().errors += 1
+        self._update_slave_status(slave_id, False)
+
+        if not logger.isEnabledFor(logging.ERROR):
+            return
+
+        now = time.monotonic()
+        last, suppressed = self._error_log.get(slave_id, (None, 0))
+        if last is not None and now - last < I2C_ERROR_LOG_INTERVAL:
+            self._error_log[slave_id] = (last, suppressed + 1)
+            return
+
+        self._error_log[slave_id] = (now, 0)
+        if suppressed:
+            logger.error(
+                "Error %s slave %s: %s (%d similar errors suppressed)",
+                action, slave_id, error, suppressed
+            )
+        else:
+            logger.error("Error %s slave %s: %s", action, slave_id, error)
+
     def _update_slave_status(self, slave_id: int, success: bool) -> None:
         """Update slave status after communication"""
-        status = self._status.get(slave_id)
-        if status:
-            status.online = success
-            status.last_seen = time.time()
+        slot = self._slots.get(slave_id)
+        if slot is not None:
+            self._online[slot] = success
+            self._last_seen[slot] = time.time()
             if not success:
-                status.error_count += 1
+                self._error_count[slot] += 1
+
+    def get_slave_status(self, slave_id: int) -> Optional[SlaveStatus]:
+        """
+        Get status snapshot of a slave
+
+        Args:
+            slave_id: Slave board ID
+
+        Returns:
+            SlaveStatus or None if the slave is unknown
+        """
+        slot = self._slots.get(slave_id)
+        if slot is None:
+            return None
+
+        version, uptime = self._info.get(slave_id, (None, None))
+        return SlaveStatus(
+            slave_id=slave_id,
+            online=bool(self._online[slot]),
+            last_seen=float(self._last_seen[slot]),
+            error_count=int(self._error_count[slot]),
+            firmware_version=version,
+            uptime=uptime
+        )
+
+    def get_offline_slaves(self) -> List[int]:
+        """Get IDs of slaves whose last transaction failed or never ran"""
+        count = len(self._slot_ids)
+        return [self._slot_ids[slot] for slot in np.flatnonzero(~self._online[:count])]
 
     def get_all_slaves(self) -> List[Dict[str, Any]]:
         """Get information for all slaves"""
+        with self._lock:
+            slave_ids = list(self._slaves)
+
         slaves = []
-        for slave_id in self._slaves:
+        for slave_id in slave_ids:
             info = self.get_slave_info(slave_id)
             if info:
                 slaves.append(info)
@@ -453,24 +885,45 @@ class SlaveBoardI2C:
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get communication statistics"""
+        count = len(self._slot_ids)
+        with self._lock:
+            counters = list(self._counters)
         return {
             'enabled': self._enabled,
             'bus': self._bus_num,
             'num_slaves': len(self._slaves),
-            **self._stats
+            'slaves_online': int(np.count_nonzero(self._online[:count])),
+            'read_count': sum(c.reads for c in counters),
+            'write_count': sum(c.writes for c in counters),
+            'error_count': sum(c.errors for c in counters),
+            'slaves_discovered': self._slaves_discovered
         }
 
     def close(self) -> None:
         """Close I2C bus"""
-        if self._bus:
-            try:
-                self._bus.close()
-                logger.info("I2C slave board manager closed")
-            except Exception as e:
-                logger.error(f"Error closing I2C bus: {e}")
-            finally:
-                self._bus = None
-                self._enabled = False
+        # Let the worker finish queued commands first; this also runs when
+        # the bus is already closed, so a worker can never outlive close()
+        with self._lock:
+            self._closed = True
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._cmd_q.put(None)
+            worker.join()
+
+        if not self._bus:
+            return
+
+        # Wait for an in-flight transaction before closing the descriptor
+        with self._bus_lock:
+            if self._bus:
+                try:
+                    self._bus.close()
+                    logger.info("I2C slave board manager closed")
+                except Exception as e:
+                    logger.error(f"Error closing I2C bus: {e}")
+                finally:
+                    self._bus = None
+                    self._enabled = False
 
     def __enter__(self):
         """Context manager entry"""
@@ -505,9 +958,40 @@ class SlaveBoardStub:
     def write_pwm_output(self, slave_id: int, channel: int, duty_cycle: float) -> bool:
         return False
 
-    def get_slave_info(self, slave_id: int) -> Optional[Dict[str, Any]]:
+    def write_pwm_block(self, slave_id: int, values: Dict[int, float]) -> bool:
+        return False
+
+    def read_digital_input_async(self, slave_id: int, pin: int) -> Future:
+        return self._done(None)
+
+    def read_analog_input_async(self, slave_id: int, channel: int) -> Future:
+        return self._done(None)
+
+    def write_digital_output_async(self, slave_id: int, pin: int, value: bool) -> Future:
+        return self._done(False)
+
+    def write_pwm_output_async(self, slave_id: int, channel: int, duty_cycle: float) -> Future:
+        return self._done(False)
+
+    @staticmethod
+    def _done(result: Any) -> Future:
+        future: Future = Future()
+        future.set_result(result)
+        return future
+
+    def get_slave_info(
+        self,
+        slave_id: int,
+        force_refresh: bool = False
+    ) -> Optional[Dict[str, Any]]:
         return None
 
+    def get_slave_status(self, slave_id: int) -> Optional[SlaveStatus]:
+        return None
+
+    def get_offline_slaves(self) -> List[int]:
+        return []
+
     def get_all_slaves(self) -> List[Dict[str, Any]]:
         return []
 
@@ -524,14 +1008,155 @@ class SlaveBoardStub:
         pass
 
 
+class MultiBusSlaveManager:
+    """
+    Slave boards spread over several I2C buses
+
+    Wraps one SlaveBoardI2C per bus and routes each slave ID to the bus it
+    was added on. Discovery runs on all buses concurrently; each bus is
+    still probed serially, but the kernel-side waits of different buses
+    overlap.
+    """
+
+    def __init__(self, buses: List[int], auto_discover: bool = True, **kwargs):
+        """
+        Initialize multi-bus slave board manager
+
+        Args:
+            buses: I2C bus numbers
+            auto_discover: Auto-discover slave boards on startup
+            **kwargs: Passed to each SlaveBoardI2C
+        """
+        self._managers: Dict[int, SlaveBoardI2C] = {
+            bus: SlaveBoardI2C(bus=bus, auto_discover=False, **kwargs)
+            for bus in buses
+        }
+        self._routes: Dict[int, SlaveBoardI2C] = {}
+
+        if auto_discover:
+            self.discover_slaves()
+
+    def discover_slaves(self) -> Dict[int, List[int]]:
+        """
+        Discover slave boards on all buses in parallel
+
+        Returns:
+            Discovered slave addresses per bus number
+        """
+        with ThreadPoolExecutor(max_workers=len(self._managers)) as executor:
+            results = executor.map(
+                lambda manager: manager.discover_slaves(),
+                self._managers.values()
+            )
+            return dict(zip(self._managers, results))
+
+    def add_slave(self, config: SlaveConfig, bus: int) -> bool:
+        """
+        Add slave board on a bus
+
+        Args:
+            config: Slave configuration
+            bus: I2C bus number the slave is attached to
+
+        Returns:
+            True if successful
+        """
+        manager = self._managers.get(bus)
+        if manager is None:
+            logger.error(f"I2C bus {bus} not managed")
+            return False
+        if not manager.add_slave(config):
+            return False
+        self._routes[config.slave_id] = manager
+        return True
+
+    def get_bus_manager(self, bus: int) -> Optional[SlaveBoardI2C]:
+        """Get the single-bus manager for a bus number"""
+        return self._managers.get(bus)
+
+    def _route(self, slave_id: int) -> Optional[SlaveBoardI2C]:
+        """Get the manager owning a slave"""
+        manager = self._routes.get(slave_id)
+        if manager is None:
+            logger.error(f"Slave {slave_id} not found")
+        return manager
+
+    def read_digital_input(self, slave_id: int, pin: int) -> Optional[bool]:
+        manager = self._route(slave_id)
+        return manager.read_digital_input(slave_id, pin) if manager else None
+
+    def write_digital_output(self, slave_id: int, pin: int, value: bool) -> bool:
+        manager = self._route(slave_id)
+        return manager.write_digital_output(slave_id, pin, value) if manager else False
+
+    def read_analog_input(self, slave_id: int, channel: int) -> Optional[float]:
+        manager = self._route(slave_id)
+        return manager.read_analog_input(slave_id, channel) if manager else None
+
+    def write_pwm_output(self, slave_id: int, channel: int, duty_cycle: float) -> bool:
+        manager = self._route(slave_id)
+        return manager.write_pwm_output(slave_id, channel, duty_cycle) if manager else False
+
+    def write_pwm_block(self, slave_id: int, values: Dict[int, float]) -> bool:
+        manager = self._route(slave_id)
+        return manager.write_pwm_block(slave_id, values) if manager else False
+
+    def get_slave_info(
+        self,
+        slave_id: int,
+        force_refresh: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        manager = self._route(slave_id)
+        return manager.get_slave_info(slave_id, force_refresh) if manager else None
+
+    def get_all_slaves(self) -> List[Dict[str, Any]]:
+        """Get information for all slaves on all buses"""
+        return [info for manager in self._managers.values()
+                for info in manager.get_all_slaves()]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get communication statistics per bus"""
+        return {
+            'buses': {bus: manager.get_statistics()
+                      for bus, manager in self._managers.items()},
+            'num_slaves': len(self._routes)
+        }
+
+    def close(self) -> None:
+        """Close all I2C buses"""
+        for manager in self._managers.values():
+            manager.close()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+
+
 # Factory function
-def create_slave_board_manager(**kwargs) -> Any:
+def create_slave_board_manager(buses: Optional[List[int]] = None, **kwargs) -> Any:
     """
     Create slave board manager instance
 
-    Returns SlaveBoardI2C if I2C is available, otherwise SlaveBoardStub
+    Returns MultiBusSlaveManager when several buses are given, SlaveBoardI2C
+    if I2C is available, otherwise SlaveBoardStub. The stub is also returned
+    when a bus cannot be opened.
+
+    Args:
+        buses: I2C bus numbers; a single entry is the same as bus=<n>
+        **kwargs: Manager options
     """
-    if I2C_AVAILABLE:
+    if not I2C_AVAILABLE:
+        return SlaveBoardStub(**kwargs)
+    try:
+        if buses and len(buses) > 1:
+            return MultiBusSlaveManager(buses, **kwargs)
+        if buses:
+            kwargs['bus'] = buses[0]
         return SlaveBoardI2C(**kwargs)
-    else:
+    except ConnectionError as e:
+        logger.error(f"{e} - using slave board stub")
         return SlaveBoardStub(**kwargs)
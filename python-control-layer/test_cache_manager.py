@@ -10,85 +10,54 @@ from cache_manager import CacheManager, get_cache_manager
 class TestCacheManager(unittest.TestCase):
     """Test suite for CacheManager"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one cache manager shared by all tests"""
+        cls.cache = CacheManager()
+
     def setUp(self):
-        """Create a fresh cache manager for each test"""
-        self.cache = CacheManager()
-    
-    def test_device_list_caching(self):
-        """Test device list caching"""
-        devices = ["device1", "device2", "device3"]
-        
-        # First access - cache miss
-        result = self.cache.get_device_list()
-        self.assertIsNone(result)
-        self.assertEqual(self.cache.misses, 1)
-        
-        # Set cache
-        self.cache.set_device_list(devices)
-        
-        # Second access - cache hit
-        result = self.cache.get_device_list()
-        self.assertEqual(result, devices)
-        self.assertEqual(self.cache.hits, 1)
+        """Empty the shared cache and reset its statistics"""
+        self.cache.clear_all()
+        self.cache.hits = 0
+        self.cache.misses = 0
     
-    def test_device_data_caching(self):
-        """Test device data caching"""
-        device_id = "device1"
-        data = {
+    # (getter, setter, key arguments, payload) for each cache
+    BASIC_CASES = [
+        ("get_device_list", "set_device_list", (),
+         ["device1", "device2", "device3"]),
+        ("get_device_data", "set_device_data", ("device1",), {
             "motor_currents": [1.5, 2.0, 1.8],
             "vibration": [0.1, 0.2, 0.15],
             "temperatures": [25.5, 26.0, 25.8]
-        }
-        
-        # First access - cache miss
-        result = self.cache.get_device_data(device_id)
-        self.assertIsNone(result)
-        
-        # Set cache
-        self.cache.set_device_data(device_id, data)
-        
-        # Second access - cache hit
-        result = self.cache.get_device_data(device_id)
-        self.assertEqual(result, data)
-    
-    def test_ai_analysis_caching(self):
-        """Test AI analysis caching"""
-        device_id = "device1"
-        analysis = {
+        }),
+        ("get_ai_analysis", "set_ai_analysis", ("device1",), {
             "anomalies_detected": True,
             "wear_estimate": 0.75,
             "recommendations": ["Reduce speed", "Check lubrication"]
-        }
-        
-        # First access - cache miss
-        result = self.cache.get_ai_analysis(device_id)
-        self.assertIsNone(result)
-        
-        # Set cache
-        self.cache.set_ai_analysis(device_id, analysis)
-        
-        # Second access - cache hit
-        result = self.cache.get_ai_analysis(device_id)
-        self.assertEqual(result, analysis)
-    
-    def test_system_status_caching(self):
-        """Test system status caching"""
-        status = {
+        }),
+        ("get_system_status", "set_system_status", (), {
             "is_safe": True,
             "devices_online": ["device1", "device2"],
             "ai_enabled": True
-        }
-        
-        # First access - cache miss
-        result = self.cache.get_system_status()
-        self.assertIsNone(result)
-        
-        # Set cache
-        self.cache.set_system_status(status)
-        
-        # Second access - cache hit
-        result = self.cache.get_system_status()
-        self.assertEqual(result, status)
+        }),
+    ]
+
+    def test_basic_caching(self):
+        """Test miss, set and hit for every cache"""
+        for getter, setter, args, payload in self.BASIC_CASES:
+            with self.subTest(getter=getter):
+                self.setUp()
+
+                # First access - cache miss
+                self.assertIsNone(getattr(self.cache, getter)(*args))
+                self.assertEqual(self.cache.misses, 1)
+
+                # Set cache
+                getattr(self.cache, setter)(*args, payload)
+
+                # Second access - cache hit
+                self.assertEqual(getattr(self.cache, getter)(*args), payload)
+                self.assertEqual(self.cache.hits, 1)
     
     def test_cache_invalidation(self):
         """Test device cache invalidation"""
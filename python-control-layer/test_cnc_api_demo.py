@@ -1,36 +1,8 @@
 """CNC API Demo - Demonstrates CNC functionality"""
 import sys
-from cnc_integration import get_cnc_integration
-from cnc_controller import CNCMode, SpindleState
 
-def print_separator():
-    print("=" * 60)
-
-def demo_cnc_functionality():
-    """Demonstrate CNC functionality"""
-    print_separator()
-    print("MODAX CNC Functionality Demo")
-    print_separator()
-
-    # Initialize CNC
-    print("\n1. Initializing CNC Integration...")
-    cnc = get_cnc_integration()
-    print("   ✅ CNC Integration initialized")
-    print(f"   - Demo tools loaded: {len(cnc.tools.tools)}")
-
-    # Get initial status
-    status = cnc.get_comprehensive_status()
-    print(f"   - Machine state: {status['controller']['state']}")
-    print(f"   - Mode: {status['controller']['mode']}")
-
-    # Set mode to AUTO
-    print("\n2. Setting CNC mode to AUTO...")
-    cnc.controller.set_mode(CNCMode.AUTO)
-    print("   ✅ Mode set to AUTO")
-
-    # Load G-code program
-    print("\n3. Loading G-code program...")
-    gcode_program = """
+# Demo program: drilling cycle, linear and circular moves
+_DEMO_GCODE = """
 (Test program - Simple drilling and milling)
 G90 G54 G17 G21  (Absolute, WCS1, XY plane, metric)
 G00 Z10.0        (Safe Z)
@@ -48,85 +20,133 @@ M05              (Spindle off)
 M30              (Program end)
 """
 
+
+SEPARATOR = "=" * 60
+
+
+def demo_cnc_functionality():
+    """Demonstrate CNC functionality
+
+    Output lines are collected and written to stdout in one call at the
+    end, also when the demo fails part way.
+    """
+    lines = []
+    try:
+        return _run_demo(lines.append)
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _run_demo(say):
+    """Run the demo steps, passing each output line to say()"""
+    # Imported here so test discovery, which picks up this file by name,
+    # does not load the CNC stack
+    from cnc_integration import get_cnc_integration
+    from cnc_controller import CNCMode, SpindleState
+
+    say(SEPARATOR)
+    say("MODAX CNC Functionality Demo")
+    say(SEPARATOR)
+
+    # Initialize CNC
+    say("\n1. Initializing CNC Integration...")
+    cnc = get_cnc_integration()
+    say("   ✅ CNC Integration initialized")
+    say(f"   - Demo tools loaded: {len(cnc.tools.tools)}")
+
+    # Get initial status
+    status = cnc.get_comprehensive_status()
+    say(f"   - Machine state: {status['controller']['state']}")
+    say(f"   - Mode: {status['controller']['mode']}")
+
+    # Set mode to AUTO
+    say("\n2. Setting CNC mode to AUTO...")
+    cnc.controller.set_mode(CNCMode.AUTO)
+    say("   ✅ Mode set to AUTO")
+
+    # Load G-code program
+    say("\n3. Loading G-code program...")
+    gcode_program = _DEMO_GCODE
+
     success = cnc.load_program(gcode_program, "Demo Drilling Program")
     if success:
-        print(f"   ✅ Program loaded: {len(cnc.current_program)} commands")
-        print(f"   - Program name: {cnc.controller.program_name}")
+        say(f"   ✅ Program loaded: {len(cnc.current_program)} commands")
+        say(f"   - Program name: {cnc.controller.program_name}")
     else:
-        print("   ❌ Failed to load program")
+        say("   ❌ Failed to load program")
         return False
 
     # Show parsed commands
-    print("\n4. Parsed G-code commands (first 5):")
+    say("\n4. Parsed G-code commands (first 5):")
     for i, cmd in enumerate(cnc.current_program[:5], 1):
-        print(f"   Line {i}: {cmd.raw_line}")
+        say(f"   Line {i}: {cmd.raw_line}")
         if cmd.g_codes:
             g_descriptions = [f"{g} ({cnc.parser.get_g_code_description(g)})"
                             for g in cmd.g_codes]
-            print(f"      G-codes: {', '.join(g_descriptions)}")
+            say(f"      G-codes: {', '.join(g_descriptions)}")
         if cmd.m_codes:
             m_descriptions = [f"{m} ({cnc.parser.get_m_code_description(m)})"
                             for m in cmd.m_codes]
-            print(f"      M-codes: {', '.join(m_descriptions)}")
+            say(f"      M-codes: {', '.join(m_descriptions)}")
         if cmd.parameters:
             params = ', '.join([f"{k}={v}" for k, v in cmd.parameters.items()])
-            print(f"      Parameters: {params}")
+            say(f"      Parameters: {params}")
 
     # Spindle control
-    print("\n5. Testing spindle control...")
+    say("\n5. Testing spindle control...")
     cnc.controller.set_spindle(SpindleState.CW, 1500)
-    print(f"   ✅ Spindle: {cnc.controller.spindle_state.value} at {cnc.controller.spindle_speed} RPM")
+    say(f"   ✅ Spindle: {cnc.controller.spindle_state.value} at {cnc.controller.spindle_speed} RPM")
 
     # Feed rate control
-    print("\n6. Testing feed rate control...")
+    say("\n6. Testing feed rate control...")
     cnc.controller.set_feed_rate(500.0)
-    print(f"   ✅ Feed rate: {cnc.controller.feed_rate} mm/min")
+    say(f"   ✅ Feed rate: {cnc.controller.feed_rate} mm/min")
     cnc.controller.set_feed_override(120)
-    print(f"   ✅ Feed override: {cnc.controller.feed_override}%")
+    say(f"   ✅ Feed override: {cnc.controller.feed_override}%")
 
     # Tool change
-    print("\n7. Testing tool change...")
+    say("\n7. Testing tool change...")
     tool_num = 2
     if cnc.tools.change_tool(tool_num):
         tool = cnc.tools.get_tool(tool_num)
-        print(f"   ✅ Tool change to T{tool_num}")
-        print(f"      - Tool name: {tool.name}")
-        print(f"      - Type: {tool.type}")
-        print(f"      - Diameter: {tool.diameter} mm")
-        print(f"      - Length: {tool.length} mm")
+        say(f"   ✅ Tool change to T{tool_num}")
+        say(f"      - Tool name: {tool.name}")
+        say(f"      - Type: {tool.type}")
+        say(f"      - Diameter: {tool.diameter} mm")
+        say(f"      - Length: {tool.length} mm")
 
     # Coordinate system
-    print("\n8. Testing coordinate system...")
+    say("\n8. Testing coordinate system...")
     cnc.coords.set_work_offsets("G54", {"X": 100.0, "Y": 50.0, "Z": 25.0})
     cnc.coords.set_active_coordinate_system("G54")
-    print(f"   ✅ Work coordinate system: G54")
-    print(f"      - Offsets: X=100, Y=50, Z=25")
+    say(f"   ✅ Work coordinate system: G54")
+    say(f"      - Offsets: X=100, Y=50, Z=25")
 
     # Get comprehensive status
-    print("\n9. Comprehensive status:")
+    say("\n9. Comprehensive status:")
     status = cnc.get_comprehensive_status()
-    print(f"   Controller:")
-    print(f"      - State: {status['controller']['state']}")
-    print(f"      - Mode: {status['controller']['mode']}")
-    print(f"      - Spindle: {status['controller']['spindle']['state']} @ {status['controller']['spindle']['speed']} RPM")
-    print(f"      - Feed: {status['controller']['feed']['rate']} mm/min ({status['controller']['feed']['override']}%)")
-    print(f"   Tools:")
-    print(f"      - In spindle: T{status['tools']['in_spindle']}")
-    print(f"      - Available tools: {len(status['tools']['tool_list'])}")
-    print(f"   Coordinates:")
-    print(f"      - Active system: {status['coordinates']['active_coord_system']}")
-    print(f"   Program:")
-    print(f"      - Loaded: {status['program']['loaded']}")
-    print(f"      - Total commands: {status['program']['total_commands']}")
+    say(f"   Controller:")
+    say(f"      - State: {status['controller']['state']}")
+    say(f"      - Mode: {status['controller']['mode']}")
+    say(f"      - Spindle: {status['controller']['spindle']['state']} @ {status['controller']['spindle']['speed']} RPM")
+    say(f"      - Feed: {status['controller']['feed']['rate']} mm/min ({status['controller']['feed']['override']}%)")
+    say(f"   Tools:")
+    say(f"      - In spindle: T{status['tools']['in_spindle']}")
+    say(f"      - Available tools: {len(status['tools']['tool_list'])}")
+    say(f"   Coordinates:")
+    say(f"      - Active system: {status['coordinates']['active_coord_system']}")
+    say(f"   Program:")
+    say(f"      - Loaded: {status['program']['loaded']}")
+    say(f"      - Total commands: {status['program']['total_commands']}")
 
     # Stop spindle
-    print("\n10. Stopping spindle...")
+    say("\n10. Stopping spindle...")
     cnc.controller.set_spindle(SpindleState.STOPPED)
-    print(f"   ✅ Spindle stopped")
+    say(f"   ✅ Spindle stopped")
 
-    print_separator()
-    print("✅ ALL TESTS PASSED - CNC functionality working correctly!")
-    print_separator()
+    say(SEPARATOR)
+    say("✅ ALL TESTS PASSED - CNC functionality working correctly!")
+    say(SEPARATOR)
 
     return True
 
@@ -6,11 +6,16 @@ from config import MQTTConfig, ControlConfig, Config
 class TestMQTTConfig(unittest.TestCase):
     """Tests for MQTT Configuration"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the config once; the tests only read it"""
+        cls.config = MQTTConfig()
+
     def test_mqtt_config_defaults(self):
         """Test MQTT config with default values (when env vars not set)"""
         # Note: We test the current configuration, which may have env vars set
         # So we just verify the config is properly initialized
-        config = MQTTConfig()
+        config = self.config
 
         # These should always have values (defaults or from environment)
         self.assertIsNotNone(config.broker_host)
@@ -24,7 +29,7 @@ class TestMQTTConfig(unittest.TestCase):
 
     def test_mqtt_config_fields_exist(self):
         """Test that all expected fields exist in MQTT config"""
-        config = MQTTConfig()
+        config = self.config
 
         # Verify all fields are accessible
         self.assertIsNotNone(config.broker_host)
@@ -42,9 +47,14 @@ class TestMQTTConfig(unittest.TestCase):
 class TestControlConfig(unittest.TestCase):
     """Tests for Control Layer Configuration"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the config once; the tests only read it"""
+        cls.config = ControlConfig()
+
     def test_control_config_fields_exist(self):
         """Test that all expected fields exist in Control config"""
-        config = ControlConfig()
+        config = self.config
 
         # Verify all fields are accessible
         self.assertIsNotNone(config.api_host)
@@ -61,7 +71,7 @@ class TestControlConfig(unittest.TestCase):
 
     def test_control_config_valid_values(self):
         """Test Control config has valid values"""
-        config = ControlConfig()
+        config = self.config
 
         # Check reasonable ranges
         self.assertGreater(config.aggregation_window_seconds, 0)
@@ -79,16 +89,21 @@ class TestControlConfig(unittest.TestCase):
 class TestConfig(unittest.TestCase):
     """Tests for Master Configuration"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the config once; the tests only read it"""
+        cls.config = Config()
+
     def test_config_initialization(self):
         """Test master config initialization"""
-        config = Config()
+        config = self.config
 
         self.assertIsInstance(config.mqtt, MQTTConfig)
         self.assertIsInstance(config.control, ControlConfig)
 
     def test_config_mqtt_access(self):
         """Test accessing MQTT config through master config"""
-        config = Config()
+        config = self.config
 
         # Verify we can access MQTT config fields
         self.assertIsNotNone(config.mqtt.broker_host)
@@ -97,7 +112,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_control_access(self):
         """Test accessing Control config through master config"""
-        config = Config()
+        config = self.config
 
         # Verify we can access Control config fields
         self.assertIsNotNone(config.control.api_host)
@@ -106,7 +121,7 @@ class TestConfig(unittest.TestCase):
 
     def test_config_structure(self):
         """Test config has expected structure"""
-        config = Config()
+        config = self.config
 
         # Verify nested structure
         self.assertTrue(hasattr(config, 'mqtt'))
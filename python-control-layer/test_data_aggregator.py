@@ -1,8 +1,12 @@
 """Unit tests for Data Aggregator module"""
+import json
 import unittest
 import time
+import numpy as np
 from data_aggregator import (
-    DataAggregator, SensorReading, SafetyStatus
+    DataAggregator, SensorReading, SafetyStatus,
+    SAFETY_DOOR_CLOSED, SAFETY_OVERLOAD,
+    _window_stats_loop, _window_stats_numpy
 )
 
 
@@ -27,6 +31,36 @@ class TestSensorReading(unittest.TestCase):
         self.assertEqual(reading.vibration['magnitude'], 2.1)
         self.assertEqual(len(reading.temperatures), 3)
 
+    def test_from_json_vibration_mapping(self):
+        """Test the parsed vibration still behaves like the payload dict"""
+        reading = SensorReading.from_json(
+            '{"timestamp": 1, "device_id": "device_001", "motor_currents": [5.0], '
+            '"vibration": {"x": 3.0, "y": 4.0, "z": 0.0}, "temperatures": [45.0]}'
+        )
+
+        self.assertEqual(reading.vibration.magnitude, 5.0)
+        self.assertEqual(reading.vibration, {"x": 3.0, "y": 4.0, "z": 0.0, "magnitude": 5.0})
+        self.assertEqual(reading.vibration.get('rms', 0), 0)
+        self.assertIn('x', reading.vibration)
+        self.assertFalse(hasattr(reading.vibration, '__dict__'))
+
+    def test_from_json_bytes_and_nan(self):
+        """Test raw payload bytes and NaN literals are accepted"""
+        payload = (b'{"timestamp": 1, "device_id": "device_001", '
+                   b'"motor_currents": [NaN, 5.3], '
+                   b'"vibration": {"x": 0, "y": 0, "z": 0, "magnitude": 0}, '
+                   b'"temperatures": [45.0]}')
+
+        reading = SensorReading.from_json(payload)
+
+        self.assertTrue(np.isnan(reading.motor_currents[0]))
+        self.assertEqual(reading.motor_currents[1], 5.3)
+
+    def test_from_json_invalid(self):
+        """Test malformed payloads raise JSONDecodeError"""
+        with self.assertRaises(json.JSONDecodeError):
+            SensorReading.from_json('{"timestamp": ')
+
 
 class TestSafetyStatus(unittest.TestCase):
     """Tests for SafetyStatus dataclass"""
@@ -74,6 +108,24 @@ class TestSafetyStatus(unittest.TestCase):
 
         self.assertFalse(status.is_safe())
 
+    def test_flags_round_trip(self):
+        """Test each condition maps to its own bit"""
+        status = SafetyStatus(
+            timestamp=0,
+            device_id="device_001",
+            emergency_stop=False,
+            door_closed=True,
+            overload_detected=True,
+            temperature_ok=False
+        )
+
+        self.assertEqual(status.flags, SAFETY_DOOR_CLOSED | SAFETY_OVERLOAD)
+        self.assertFalse(status.emergency_stop)
+        self.assertTrue(status.door_closed)
+        self.assertTrue(status.overload_detected)
+        self.assertFalse(status.temperature_ok)
+        self.assertFalse(status.is_safe())
+
 
 class TestDataAggregator(unittest.TestCase):
     """Tests for DataAggregator class"""
@@ -86,7 +138,7 @@ class TestDataAggregator(unittest.TestCase):
     def _create_test_reading(self, timestamp_ms=None):
         """Helper to create a test sensor reading"""
         if timestamp_ms is None:
-            timestamp_ms = int(time.time() * 1000)
+            timestamp_ms = time.time_ns() // 1_000_000
 
         return SensorReading(
             timestamp=timestamp_ms,
@@ -139,10 +191,34 @@ class TestDataAggregator(unittest.TestCase):
 
         self.assertTrue(self.aggregator.is_system_safe())
 
+    def test_is_system_safe_one_unsafe_device(self):
+        """Test a single unsafe device makes the system unsafe"""
+        for device_id, door_closed in (("device_001", True), ("device_002", False)):
+            self.aggregator.update_safety_status(SafetyStatus(
+                timestamp=time.time() * 1000,
+                device_id=device_id,
+                emergency_stop=False,
+                door_closed=door_closed,
+                overload_detected=False,
+                temperature_ok=True
+            ))
+
+        self.assertFalse(self.aggregator.is_system_safe())
+
+        self.aggregator.update_safety_status(SafetyStatus(
+            timestamp=time.time() * 1000,
+            device_id="device_002",
+            emergency_stop=False,
+            door_closed=True,
+            overload_detected=False,
+            temperature_ok=True
+        ))
+        self.assertTrue(self.aggregator.is_system_safe())
+
     def test_aggregate_for_ai(self):
         """Test aggregating data for AI analysis"""
         # Add multiple readings
-        current_time_ms = int(time.time() * 1000)
+        current_time_ms = time.time_ns() // 1_000_000
         for i in range(5):
             reading = SensorReading(
                 timestamp=current_time_ms - (i * 1000),
@@ -162,6 +238,125 @@ class TestDataAggregator(unittest.TestCase):
         self.assertEqual(len(aggregated.current_mean), 3)
         self.assertIn('magnitude', aggregated.vibration_mean)
 
+    def test_aggregate_for_ai_statistics(self):
+        """Test window statistics after the ring buffer has wrapped"""
+        aggregator = DataAggregator(window_size_seconds=10, max_points=4)
+        now_ms = time.time_ns() // 1_000_000
+        for i in range(6):
+            aggregator.add_sensor_reading(SensorReading(
+                timestamp=now_ms + i,
+                device_id=self.device_id,
+                motor_currents=[float(i), 1.0],
+                vibration={"x": i, "y": 0.0, "z": 0.0, "magnitude": 2.0 * i},
+                temperatures=[40.0 + i]
+            ))
+
+        aggregated = aggregator.aggregate_for_ai(self.device_id)
+
+        # Only the last four readings (i = 2..5) are kept
+        self.assertEqual(aggregated.sample_count, 4)
+        self.assertEqual(aggregated.time_window_start, (now_ms + 2) / 1000.0)
+        self.assertEqual(aggregated.time_window_end, (now_ms + 5) / 1000.0)
+        self.assertEqual(aggregated.current_mean, [3.5, 1.0])
+        self.assertEqual(aggregated.current_max, [5.0, 1.0])
+        self.assertAlmostEqual(aggregated.current_std[0], 1.118034, places=5)
+        self.assertEqual(aggregated.vibration_max['magnitude'], 10.0)
+        self.assertEqual(aggregated.temperature_mean, [43.5])
+
+    def test_aggregate_buckets(self):
+        """Test per-bucket statistics match each bucket's readings"""
+        now_ms = time.time_ns() // 1_000_000
+        offsets = [-5000, -4800, -3900, -3100, -1000]
+        for i, offset in enumerate(offsets):
+            self.aggregator.add_sensor_reading(SensorReading(
+                timestamp=now_ms + offset,
+                device_id=self.device_id,
+                motor_currents=[float(i), 2.0],
+                vibration={"x": 0.0, "y": 0.0, "z": 0.0, "magnitude": float(i)},
+                temperatures=[40.0]
+            ))
+
+        buckets = self.aggregator.aggregate_buckets(self.device_id, bucket_seconds=1.0)
+
+        # Buckets from the oldest reading: [0, 1s) [1s, 2s) ... [4s, 5s); 2s-4s empty
+        self.assertEqual([b.sample_count for b in buckets], [2, 2, 1])
+        self.assertEqual(buckets[0].current_mean, [0.5, 2.0])
+        self.assertAlmostEqual(buckets[1].current_std[0], 0.5)
+        self.assertEqual(buckets[1].vibration_max['magnitude'], 3.0)
+        self.assertEqual(buckets[2].time_window_start, (now_ms - 1000) / 1000.0)
+        self.assertEqual(self.aggregator.aggregate_buckets("nonexistent_device"), [])
+
+    def test_aggregate_for_ai_excludes_old_readings(self):
+        """Test readings older than the window are not aggregated"""
+        now_ms = time.time_ns() // 1_000_000
+        self.aggregator.add_sensor_reading(self._create_test_reading(now_ms - 30000))
+        self.aggregator.add_sensor_reading(self._create_test_reading(now_ms))
+
+        aggregated = self.aggregator.aggregate_for_ai(self.device_id)
+
+        self.assertEqual(aggregated.sample_count, 1)
+
+    def test_running_window_matches_full_scan(self):
+        """Test running-sum statistics agree with a rescan of the window"""
+        aggregator = DataAggregator(window_size_seconds=10, max_points=16)
+        rng = np.random.default_rng(0)
+        now_ms = time.time() * 1000
+        for i in range(40):
+            aggregator.add_sensor_reading(SensorReading(
+                timestamp=now_ms - 20000 + i * 500,
+                device_id=self.device_id,
+                motor_currents=rng.uniform(4.0, 6.0, 3).tolist(),
+                vibration=dict(zip("xyz", rng.normal(1.0, 0.2, 3).tolist()), magnitude=1.8),
+                temperatures=rng.uniform(40.0, 50.0, 2).tolist()
+            ))
+
+        running = aggregator.aggregate_for_ai(self.device_id)
+        # A different window length takes the full-scan path
+        scanned = aggregator.aggregate_for_ai(self.device_id, window_seconds=11)
+
+        self.assertEqual(running.sample_count, 16)
+        self.assertEqual(scanned.sample_count, 16)
+        np.testing.assert_allclose(running.current_mean, scanned.current_mean, rtol=1e-9)
+        np.testing.assert_allclose(running.current_std, scanned.current_std, rtol=1e-6)
+        np.testing.assert_allclose(running.temperature_mean, scanned.temperature_mean, rtol=1e-9)
+        for key in ('x', 'y', 'z'):
+            self.assertAlmostEqual(running.vibration_std[key], scanned.vibration_std[key], places=6)
+        self.assertEqual(running.current_max, scanned.current_max)
+
+    def test_running_window_recovers_after_nan(self):
+        """Test a NaN reading stops affecting the window once it is evicted"""
+        aggregator = DataAggregator(window_size_seconds=10, max_points=5)
+        now_ms = time.time_ns() // 1_000_000
+        for i in range(11):
+            value = float('nan') if i == 0 else 1.0
+            aggregator.add_sensor_reading(SensorReading(
+                timestamp=now_ms + i,
+                device_id=self.device_id,
+                motor_currents=[value],
+                vibration={"x": value, "y": 1.0, "z": 1.0, "magnitude": 1.0},
+                temperatures=[value]
+            ))
+            if i == 2:
+                # While the NaN is in the window only its columns are NaN
+                aggregated = aggregator.aggregate_for_ai(self.device_id)
+                self.assertTrue(np.isnan(aggregated.current_mean[0]))
+                self.assertEqual(aggregated.vibration_mean['y'], 1.0)
+
+        aggregated = aggregator.aggregate_for_ai(self.device_id)
+
+        self.assertEqual(aggregated.current_mean, [1.0])
+        self.assertEqual(aggregated.current_std, [0.0])
+        self.assertEqual(aggregated.vibration_mean['x'], 1.0)
+        self.assertEqual(aggregated.temperature_mean, [1.0])
+
+    def test_window_stats_kernel_matches_numpy(self):
+        """Test the loop kernel (numba source) against the numpy reductions"""
+        rows = np.random.default_rng(1).uniform(0.0, 10.0, (50, 9)).astype(np.float32)
+        rows[7, 3] = np.nan
+
+        for actual, expected in zip(_window_stats_loop(rows), _window_stats_numpy(rows)):
+            np.testing.assert_allclose(actual, expected, rtol=1e-6)
+
     def test_aggregate_for_ai_no_data(self):
         """Test aggregating when no data available"""
         aggregated = self.aggregator.aggregate_for_ai("nonexistent_device")
@@ -177,6 +372,9 @@ class TestDataAggregator(unittest.TestCase):
         recent = self.aggregator.get_recent_readings(self.device_id, count=5)
 
         self.assertEqual(len(recent), 5)
+        # Newest five, oldest first
+        self.assertEqual(recent, list(self.aggregator.sensor_data[self.device_id])[-5:])
+        self.assertEqual(len(self.aggregator.get_recent_readings(self.device_id, count=50)), 10)
 
     def test_get_device_ids(self):
         """Test getting all device IDs"""
@@ -184,7 +382,7 @@ class TestDataAggregator(unittest.TestCase):
 
         for device_id in devices:
             reading = SensorReading(
-                timestamp=int(time.time() * 1000),
+                timestamp=time.time_ns() // 1_000_000,
                 device_id=device_id,
                 motor_currents=[5.0, 5.1, 4.9],
                 vibration={"x": 1.0, "y": 1.1, "z": 0.9, "magnitude": 1.8},
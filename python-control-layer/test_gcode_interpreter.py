@@ -1,6 +1,6 @@
 """Unit tests for G-code Interpreter"""
 import unittest
-from gcode_interpreter import GCodeInterpreter, InterpreterState
+from gcode_interpreter import EXECUTION_LOG_SIZE, GCodeInterpreter, InterpreterState
 
 
 class TestGCodeInterpreter(unittest.TestCase):
@@ -167,6 +167,28 @@ class TestGCodeInterpreter(unittest.TestCase):
         # Should stop at M30
         self.assertEqual(len(executed), 2)
 
+    def test_compile_once_run_many(self):
+        """Test that a compiled program can be executed repeatedly"""
+        program = """
+        G00 X0
+        GOSUB SUB
+        M30
+        :SUB
+        G01 X5 F100
+        M99
+        """
+
+        compiled = self.interpreter.compile(program)
+        first = self.interpreter.execute(compiled)
+        second = self.interpreter.execute(compiled)
+
+        self.assertEqual([c.raw_line for c in first], [c.raw_line for c in second])
+        self.assertEqual(len(first), 6)
+        self.assertEqual(self.interpreter.state.labels["SUB"], 3)
+        self.assertFalse(compiled.ops.flags.writeable)
+        with self.assertRaises(TypeError):
+            compiled.labels["SUB"] = 0
+
     def test_execution_log(self):
         """Test execution logging"""
         program = """
@@ -184,6 +206,21 @@ class TestGCodeInterpreter(unittest.TestCase):
         # Check log contains line information
         self.assertTrue(any("Line" in entry for entry in log))
 
+    def test_execution_log_is_bounded(self):
+        """Test that the execution log keeps only the most recent lines"""
+        program = """
+        :LOOP
+        G00 X0
+        GOTO LOOP
+        """
+
+        self.interpreter.load_program(program)
+        self.interpreter.execute_program(max_commands=EXECUTION_LOG_SIZE + 50)
+
+        log = self.interpreter.get_execution_log()
+        self.assertEqual(len(log), EXECUTION_LOG_SIZE)
+        self.assertEqual(log[-1], "Line 2: GOTO LOOP")
+
     def test_infinite_loop_prevention(self):
         """Test infinite loop prevention"""
         program = """
@@ -311,6 +348,24 @@ class TestInterpreterState(unittest.TestCase):
         self.assertEqual(len(state.labels), 0)
         self.assertEqual(state.execution_count, 0)
 
+    def test_numeric_and_named_variables(self):
+        """Test numeric and named macro variables share one mapping"""
+        state = InterpreterState()
+        state.variables['#1'] = 0.0
+        state.variables['#500'] = 7.25
+        state.variables['#A'] = 3.0
+        state.variables['#12345'] = 1.0  # outside the numeric slots
+
+        self.assertEqual(len(state.variables), 4)
+        self.assertEqual(state.variables['#1'], 0.0)
+        self.assertEqual(state.variables.get('#500'), 7.25)
+        self.assertIsNone(state.variables.get('#2'))
+        self.assertEqual(set(state.variables), {'#1', '#500', '#A', '#12345'})
+
+        del state.variables['#500']
+        self.assertNotIn('#500', state.variables)
+        self.assertEqual(len(state.variables), 3)
+
 
 if __name__ == '__main__':
     unittest.main()
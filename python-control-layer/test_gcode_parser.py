@@ -1,14 +1,18 @@
 """Unit tests for G-code Parser"""
+import re
 import unittest
+from unittest.mock import Mock, patch
+import numpy as np
 from gcode_parser import GCodeParser
 
 
 class TestGCodeParser(unittest.TestCase):
     """Test G-code Parser"""
 
-    def setUp(self):
-        """Set up test parser"""
-        self.parser = GCodeParser()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test parser (parsing keeps no per-program state)"""
+        cls.parser = GCodeParser()
 
     def test_parse_simple_line(self):
         """Test parsing simple G-code line"""
@@ -99,6 +103,26 @@ class TestGCodeParser(unittest.TestCase):
         self.assertIn("G01", commands[2].g_codes)
         self.assertIn("M03", commands[3].m_codes)
 
+    def test_parse_program_columns(self):
+        """Test column-wise program view"""
+        program = self.parser.parse_program_columns("""
+        G90 G54
+        G00 X10 Y20
+        G01 Z-5 F500
+        G02 X30 Y0 I10 J0
+        M03 S1000
+        """)
+
+        self.assertEqual(len(program), 5)
+        self.assertEqual(program.motion.tolist(), [-1, 0, 1, 2, -1])
+        self.assertEqual(program.line_numbers.tolist(), [2, 3, 4, 5, 6])
+        self.assertEqual(program.f[2], 500.0)
+        self.assertTrue(np.isnan(program.x[2]))
+        self.assertEqual(program.columns['S'][4], 1000.0)
+        self.assertEqual(program.bounding_box(),
+                         {'X': (10.0, 30.0), 'Y': (0.0, 20.0), 'Z': (-5.0, -5.0)})
+        self.assertIn("M03", program[4].m_codes)
+
     def test_validate_command(self):
         """Test command validation"""
         # Valid command
@@ -112,6 +136,26 @@ class TestGCodeParser(unittest.TestCase):
         self.assertFalse(valid)
         self.assertTrue(any("I/J/K or R" in err for err in errors))
 
+    def test_validate_program(self):
+        """Test whole-program validation matches per-command validation"""
+        program = self.parser.parse_program_columns("""
+        G00 X10 Y20
+        G02 X10 Y20
+        G01
+        G00 G01 X5
+        G03 X1 Y1 R5
+        G999 X1
+        M03 S1000
+        """)
+
+        results = self.parser.validate_program(program)
+
+        expected = [(i, self.parser.validate_command(cmd)[1])
+                    for i, cmd in enumerate(program.commands)
+                    if not self.parser.validate_command(cmd)[0]]
+        self.assertEqual(results, expected)
+        self.assertEqual([i for i, _ in results], [1, 2, 3, 5])
+
     def test_get_target_position(self):
         """Test getting target position from command"""
         cmd = self.parser.parse_line("G01 X10 Y20 Z-5", 1)
@@ -148,6 +192,40 @@ class TestGCodeParser(unittest.TestCase):
         desc = self.parser.get_m_code_description("M03")
         self.assertIn("Spindle", desc)
 
+        self.assertEqual(self.parser.get_g_code_description("G999"), "Unknown G-code")
+        self.assertEqual(self.parser.get_m_code_description("M150"), "User macro 150")
+        for code, (description, _) in self.parser.G_CODE_DEFS.items():
+            self.assertEqual(self.parser.get_g_code_description(code), description)
+
+    def test_repeated_lines_are_independent(self):
+        """Test that cached lines still yield separate commands"""
+        first = self.parser.parse_line("G81 X1 Y2 Z-3 R1 F100", 4)
+        second = self.parser.parse_line("  G81 X1 Y2 Z-3 R1 F100  ", 9)
+
+        self.assertEqual(first.line_number, 4)
+        self.assertEqual(second.line_number, 9)
+        self.assertEqual(first.parameters, second.parameters)
+
+        first.parameters['X'] = 50.0
+        first.g_codes.append('G90')
+        self.assertEqual(second.parameters['X'], 1.0)
+        self.assertEqual(second.g_codes, ['G81'])
+
+    def test_parse_uses_precompiled_patterns(self):
+        """Test that parsing never goes through the re module functions"""
+        forbidden = AssertionError("pattern compiled on the parse path")
+        with patch.multiple(re, compile=Mock(side_effect=forbidden),
+                            search=Mock(side_effect=forbidden),
+                            match=Mock(side_effect=forbidden),
+                            sub=Mock(side_effect=forbidden),
+                            finditer=Mock(side_effect=forbidden)):
+            # Unique text so the line cache cannot answer
+            cmd = self.parser.parse_line("N7 G65 P9123 A1.25 T3 M3 GOTO L7 (precompiled)", 1)
+
+        self.assertEqual(cmd.n_number, 7)
+        self.assertEqual(cmd.macro_call, "O9123")
+        self.assertEqual(cmd.goto_target, "L7")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,12 +8,24 @@ from mqtt_handler import MQTTHandler
 from data_aggregator import SensorReading, SafetyStatus
 
 
+class Capture(list):
+    """Callback sink recording each delivered object, cheaper than Mock for replayed messages"""
+
+    def __call__(self, obj):
+        self.append(obj)
+
+    def __bool__(self):
+        # Handlers test "if callback:", which must hold before anything is captured
+        return True
+
+
 class TestMQTTIntegration(unittest.TestCase):
     """Integration tests for MQTT communication flow"""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.config = MQTTConfig(
+        cls.config = MQTTConfig(
             broker_host="localhost",
             broker_port=1883,
             topic_sensor_data="modax/sensor_data",
@@ -24,21 +36,31 @@ class TestMQTTIntegration(unittest.TestCase):
             password=None
         )
 
-        with patch('mqtt_handler.mqtt.Client'):
-            self.handler = MQTTHandler(self.config)
-            self.handler.client = Mock()
+        # Mock paho mqtt client for every handler built in this class
+        cls._client_patch = patch('mqtt_handler.mqtt.Client')
+        cls._client_patch.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the paho mqtt client patch"""
+        cls._client_patch.stop()
+
+    def setUp(self):
+        """Create a fresh handler per test"""
+        self.handler = MQTTHandler(self.config)
+        self.handler.client = Mock()
 
     def test_sensor_data_flow(self):
         """Test sensor data flow from MQTT to callback"""
-        # Create mock callback
-        callback_mock = Mock()
-        self.handler.on_sensor_data = callback_mock
+        # Create capturing callback
+        received = Capture()
+        self.handler.on_sensor_data = received
 
         # Simulate MQTT message
         msg = Mock()
         msg.topic = "modax/sensor_data"
         msg.payload = json.dumps({
-            "timestamp": int(time.time() * 1000),
+            "timestamp": time.time_ns() // 1_000_000,
             "device_id": "device_001",
             "motor_currents": [5.5, 5.3, 5.4],
             "vibration": {"x": 1.2, "y": 1.3, "z": 1.1, "magnitude": 2.1},
@@ -49,23 +71,23 @@ class TestMQTTIntegration(unittest.TestCase):
         self.handler._on_message(self.handler.client, None, msg)
 
         # Verify callback was called with correct data
-        callback_mock.assert_called_once()
-        reading = callback_mock.call_args[0][0]
+        self.assertEqual(len(received), 1)
+        reading = received[0]
         self.assertIsInstance(reading, SensorReading)
         self.assertEqual(reading.device_id, "device_001")
         self.assertEqual(len(reading.motor_currents), 3)
 
     def test_safety_status_flow(self):
         """Test safety status flow from MQTT to callback"""
-        # Create mock callback
-        callback_mock = Mock()
-        self.handler.on_safety_status = callback_mock
+        # Create capturing callback
+        received = Capture()
+        self.handler.on_safety_status = received
 
         # Simulate MQTT message with unsafe condition
         msg = Mock()
         msg.topic = "modax/safety"
         msg.payload = json.dumps({
-            "timestamp": int(time.time() * 1000),
+            "timestamp": time.time_ns() // 1_000_000,
             "device_id": "device_001",
             "emergency_stop": True,  # Unsafe!
             "door_closed": True,
@@ -77,8 +99,8 @@ class TestMQTTIntegration(unittest.TestCase):
         self.handler._on_message(self.handler.client, None, msg)
 
         # Verify callback was called
-        callback_mock.assert_called_once()
-        status = callback_mock.call_args[0][0]
+        self.assertEqual(len(received), 1)
+        status = received[0]
         self.assertIsInstance(status, SafetyStatus)
         self.assertFalse(status.is_safe())
         self.assertTrue(status.emergency_stop)
@@ -86,7 +108,7 @@ class TestMQTTIntegration(unittest.TestCase):
     def test_ai_analysis_publishing(self):
         """Test publishing AI analysis results"""
         analysis = {
-            "timestamp": int(time.time() * 1000),
+            "timestamp": time.time_ns() // 1_000_000,
             "device_id": "device_001",
             "anomaly_detected": True,
             "anomaly_score": 0.85,
@@ -105,13 +127,13 @@ class TestMQTTIntegration(unittest.TestCase):
 
         # Check payload contains analysis data
         payload = call_args[0][1]
-        self.assertIn("device_001", payload)
-        self.assertIn("anomaly_detected", payload)
+        self.assertIn(b"device_001", payload)
+        self.assertIn(b"anomaly_detected", payload)
 
     def test_control_command_publishing(self):
         """Test publishing control commands"""
         command = {
-            "timestamp": int(time.time() * 1000),
+            "timestamp": time.time_ns() // 1_000_000,
             "command_type": "set_speed",
             "parameters": {"speed": 1500, "ramp_time": 5}
         }
@@ -127,13 +149,13 @@ class TestMQTTIntegration(unittest.TestCase):
 
         # Check payload contains command data
         payload = call_args[0][1]
-        self.assertIn("set_speed", payload)
+        self.assertIn(b"set_speed", payload)
 
     def test_multiple_messages_sequence(self):
         """Test handling sequence of multiple messages"""
-        sensor_callback = Mock()
-        safety_callback = Mock()
-        ai_callback = Mock()
+        sensor_callback = Capture()
+        safety_callback = Capture()
+        ai_callback = Capture()
 
         self.handler.on_sensor_data = sensor_callback
         self.handler.on_safety_status = safety_callback
@@ -142,14 +164,14 @@ class TestMQTTIntegration(unittest.TestCase):
         # Simulate sequence of messages
         messages = [
             ("modax/sensor_data", {
-                "timestamp": int(time.time() * 1000),
+                "timestamp": time.time_ns() // 1_000_000,
                 "device_id": "device_001",
                 "motor_currents": [5.5, 5.3, 5.4],
                 "vibration": {"x": 1.2, "y": 1.3, "z": 1.1, "magnitude": 2.1},
                 "temperatures": [45.0, 46.5, 44.8]
             }),
             ("modax/safety", {
-                "timestamp": int(time.time() * 1000),
+                "timestamp": time.time_ns() // 1_000_000,
                 "device_id": "device_001",
                 "emergency_stop": False,
                 "door_closed": True,
@@ -170,14 +192,15 @@ class TestMQTTIntegration(unittest.TestCase):
             self.handler._on_message(self.handler.client, None, msg)
 
         # Verify all callbacks were called
-        sensor_callback.assert_called_once()
-        safety_callback.assert_called_once()
-        ai_callback.assert_called_once()
+        self.assertEqual(len(sensor_callback), 1)
+        self.assertEqual(len(safety_callback), 1)
+        self.assertEqual(len(ai_callback), 1)
+        self.assertEqual(ai_callback[0]["wear_level"], 0.25)
 
     def test_malformed_message_handling(self):
         """Test handling of malformed JSON messages"""
-        callback_mock = Mock()
-        self.handler.on_sensor_data = callback_mock
+        received = Capture()
+        self.handler.on_sensor_data = received
 
         # Simulate message with invalid JSON
         msg = Mock()
@@ -188,7 +211,7 @@ class TestMQTTIntegration(unittest.TestCase):
         self.handler._on_message(self.handler.client, None, msg)
 
         # Callback should not have been called due to parse error
-        callback_mock.assert_not_called()
+        self.assertEqual(received, [])
 
     def test_reconnection_state_tracking(self):
         """Test that reconnection state is properly tracked"""
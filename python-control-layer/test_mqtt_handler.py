@@ -3,16 +3,17 @@ import unittest
 from unittest.mock import Mock, patch
 import json
 from config import MQTTConfig
-from mqtt_handler import MQTTHandler
+from mqtt_handler import MQTTHandler, PublishBatcher
 from data_aggregator import SensorReading, SafetyStatus
 
 
 class TestMQTTHandler(unittest.TestCase):
     """Tests for MQTTHandler class"""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures"""
-        self.config = MQTTConfig(
+        cls.config = MQTTConfig(
             broker_host="localhost",
             broker_port=1883,
             topic_sensor_data="modax/sensor_data",
@@ -23,10 +24,19 @@ class TestMQTTHandler(unittest.TestCase):
             password=None
         )
 
-        # Mock paho mqtt client
-        with patch('mqtt_handler.mqtt.Client'):
-            self.handler = MQTTHandler(self.config)
-            self.handler.client = Mock()
+        # Mock paho mqtt client for every handler built in this class
+        cls._client_patch = patch('mqtt_handler.mqtt.Client')
+        cls._client_patch.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the paho mqtt client patch"""
+        cls._client_patch.stop()
+
+    def setUp(self):
+        """Create a fresh handler per test"""
+        self.handler = MQTTHandler(self.config)
+        self.handler.client = Mock()
 
     def test_initialization(self):
         """Test MQTT handler initialization"""
@@ -47,7 +57,7 @@ class TestMQTTHandler(unittest.TestCase):
         self.handler.client.publish.assert_called_once()
         call_args = self.handler.client.publish.call_args
         self.assertEqual(call_args[0][0], self.config.topic_ai_analysis)
-        self.assertIn("device_001", call_args[0][1])
+        self.assertIn(b"device_001", call_args[0][1])
 
     def test_publish_control_command(self):
         """Test publishing control command"""
@@ -90,7 +100,7 @@ class TestMQTTHandler(unittest.TestCase):
             "motor_currents": [5.5, 5.3, 5.4],
             "vibration": {"x": 1.2, "y": 1.3, "z": 1.1, "magnitude": 2.1},
             "temperatures": [45.0, 46.5, 44.8]
-        })
+        }).encode('utf-8')
 
         callback_mock = Mock()
         self.handler.on_sensor_data = callback_mock
@@ -111,7 +121,7 @@ class TestMQTTHandler(unittest.TestCase):
             "door_closed": True,
             "overload_detected": False,
             "temperature_ok": True
-        })
+        }).encode('utf-8')
 
         callback_mock = Mock()
         self.handler.on_safety_status = callback_mock
@@ -129,7 +139,7 @@ class TestMQTTHandler(unittest.TestCase):
             "device_id": "device_001",
             "anomaly_detected": True,
             "wear_level": 0.45
-        })
+        }).encode('utf-8')
 
         callback_mock = Mock()
         self.handler.on_ai_analysis = callback_mock
@@ -141,6 +151,100 @@ class TestMQTTHandler(unittest.TestCase):
         self.assertEqual(analysis['device_id'], "device_001")
         self.assertTrue(analysis['anomaly_detected'])
 
+    def test_handle_ai_analysis_batch(self):
+        """Test that a batched AI analysis payload is delivered per analysis"""
+        callback_mock = Mock()
+        self.handler.on_ai_analysis = callback_mock
+
+        self.handler._handle_ai_analysis(
+            b'[{"device_id": "device_001"}, {"device_id": "device_002"}]'
+        )
+
+        self.assertEqual([c[0][0]['device_id'] for c in callback_mock.call_args_list],
+                         ["device_001", "device_002"])
+
+    def test_on_message_unknown_topic(self):
+        """Test that messages on unsubscribed topics reach no callback"""
+        self.handler.on_sensor_data = Mock()
+        self.handler.on_safety_status = Mock()
+        self.handler.on_ai_analysis = Mock()
+
+        msg = Mock()
+        msg.topic = "modax/unknown"
+        msg.payload = b'{"device_id": "device_001"}'
+
+        with self.assertLogs('mqtt_handler', level='WARNING'):
+            self.handler._on_message(self.handler.client, None, msg)
+
+        self.handler.on_sensor_data.assert_not_called()
+        self.handler.on_safety_status.assert_not_called()
+        self.handler.on_ai_analysis.assert_not_called()
+
+
+class TestPublishBatching(unittest.TestCase):
+    """Tests for batched AI analysis publishing"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a handler that batches three messages"""
+        cls.config = MQTTConfig(
+            topic_ai_analysis="modax/ai_analysis",
+            topic_control_commands="modax/control",
+            publish_batch_size=3,
+            publish_flush_ms=60000
+        )
+
+        # Mock paho mqtt client for every handler built in this class
+        cls._client_patch = patch('mqtt_handler.mqtt.Client')
+        cls._client_patch.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the paho mqtt client patch"""
+        cls._client_patch.stop()
+
+    def setUp(self):
+        """Create a fresh handler per test"""
+        self.handler = MQTTHandler(self.config)
+        self.handler.client = Mock()
+
+    def test_batch_published_when_full(self):
+        """Test that a full batch goes out as one JSON array"""
+        for i in range(3):
+            self.handler.publish_ai_analysis({"device_id": f"device_{i}"})
+
+        self.handler.client.publish.assert_called_once()
+        topic, payload = self.handler.client.publish.call_args[0]
+        self.assertEqual(topic, self.config.topic_ai_analysis)
+        self.assertEqual([a["device_id"] for a in json.loads(payload)],
+                         ["device_0", "device_1", "device_2"])
+
+    def test_flush_publishes_partial_batch(self):
+        """Test that flush sends buffered messages and disconnect flushes"""
+        self.handler.publish_ai_analysis({"device_id": "device_0"})
+        self.handler.client.publish.assert_not_called()
+
+        self.handler.disconnect()
+
+        self.handler.client.publish.assert_called_once()
+        self.assertEqual(len(json.loads(self.handler.client.publish.call_args[0][1])), 1)
+
+    def test_control_commands_not_batched(self):
+        """Test that control commands are always published immediately"""
+        self.handler.publish_control_command({"command_type": "stop"})
+        self.handler.client.publish.assert_called_once()
+
+    def test_flush_interval(self):
+        """Test that the timer flushes a partial batch"""
+        published = []
+        batcher = PublishBatcher(lambda topic, payload: published.append(payload), 10, 0.01)
+        batcher.add("topic", b'{"a":1}')
+
+        timer = batcher._timer
+        timer.join(1.0)
+
+        self.assertEqual(published, [b'[{"a":1}]'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,7 +3,9 @@ Unit tests for Network Scanner module
 """
 import unittest
 import asyncio
+import socket
 from unittest.mock import patch, MagicMock
+import network_scanner
 from network_scanner import NetworkScanner, PortScanner, NetworkDevice
 
 
@@ -33,7 +35,7 @@ class TestNetworkDevice(unittest.TestCase):
         self.assertIn("discovered_at", device_dict)
 
 
-class TestNetworkScanner(unittest.TestCase):
+class TestNetworkScanner(unittest.IsolatedAsyncioTestCase):
     """Test NetworkScanner class"""
     
     def setUp(self):
@@ -88,6 +90,20 @@ class TestNetworkScanner(unittest.TestCase):
         hostname = await self.scanner.resolve_hostname("192.168.1.1")
         self.assertIsNone(hostname)
     
+    @patch('socket.gethostbyaddr')
+    async def test_resolve_many(self, mock_gethostbyaddr):
+        """Test resolving several hosts keeps order and tolerates failures"""
+        def fake_gethostbyaddr(ip):
+            if ip.endswith(".2"):
+                raise socket.herror("not found")
+            return (f"host-{ip.rsplit('.', 1)[1]}", [], [ip])
+
+        mock_gethostbyaddr.side_effect = fake_gethostbyaddr
+
+        hostnames = await self.scanner.resolve_many(["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+        self.assertEqual(hostnames, ["host-1", None, "host-3"])
+        self.assertEqual(mock_gethostbyaddr.call_count, 3)
+
     def test_get_discovered_devices(self):
         """Test getting discovered devices as dictionaries"""
         device1 = NetworkDevice(ip="192.168.1.1", hostname="device1")
@@ -100,7 +116,7 @@ class TestNetworkScanner(unittest.TestCase):
         self.assertEqual(devices[1]["ip"], "192.168.1.2")
 
 
-class TestPortScanner(unittest.TestCase):
+class TestPortScanner(unittest.IsolatedAsyncioTestCase):
     """Test PortScanner class"""
     
     def setUp(self):
@@ -111,26 +127,54 @@ class TestPortScanner(unittest.TestCase):
         """Test scanner initialization"""
         self.assertEqual(self.scanner.timeout, 0.1)
     
-    @patch('socket.socket')
-    async def test_scan_port_open(self, mock_socket):
+    @patch('network_scanner.asyncio.open_connection')
+    async def test_scan_port_open(self, mock_open_connection):
         """Test scanning an open port"""
-        mock_sock = MagicMock()
-        mock_sock.connect_ex.return_value = 0  # Port is open
-        mock_socket.return_value = mock_sock
+        writer = MagicMock()
+        mock_open_connection.return_value = (MagicMock(), writer)  # Port is open
         
         is_open = await self.scanner.scan_port("192.168.1.1", 80)
         self.assertTrue(is_open)
+        writer.close.assert_called_once()
     
-    @patch('socket.socket')
-    async def test_scan_port_closed(self, mock_socket):
+    @patch('network_scanner.asyncio.open_connection')
+    async def test_scan_port_closed(self, mock_open_connection):
         """Test scanning a closed port"""
-        mock_sock = MagicMock()
-        mock_sock.connect_ex.return_value = 1  # Port is closed
-        mock_socket.return_value = mock_sock
+        mock_open_connection.side_effect = ConnectionRefusedError()  # Port is closed
         
         is_open = await self.scanner.scan_port("192.168.1.1", 80)
         self.assertFalse(is_open)
+
+    async def test_scan_ports_out_of_range(self):
+        """Test ports outside 0-65535 are reported closed instead of raising"""
+        status = await self.scanner.scan_ports("127.0.0.1", [70000, -1])
+
+        self.assertEqual(status, {70000: False, -1: False})
     
+    @patch('network_scanner.asyncio.open_connection')
+    async def test_scan_ports_concurrent(self, mock_open_connection):
+        """Test that port probes overlap instead of running one by one"""
+        active = 0
+        peak = 0
+
+        async def fake_open_connection(host, port):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if port % 2:
+                raise ConnectionRefusedError()
+            return MagicMock(), MagicMock()
+
+        mock_open_connection.side_effect = fake_open_connection
+        self.scanner.max_concurrency = 4
+
+        status = await self.scanner.scan_ports("192.168.1.1", list(range(10)))
+
+        self.assertEqual([p for p, is_open in status.items() if is_open], [0, 2, 4, 6, 8])
+        self.assertEqual(peak, 4)
+
     def test_get_service_info(self):
         """Test getting service info for known ports"""
         # Test some well-known ports
@@ -144,22 +188,22 @@ class TestPortScanner(unittest.TestCase):
         service = self.scanner.get_service_info(99999)
         self.assertIn("99999", service)
 
+    @patch('network_scanner.socket.getservbyport')
+    def test_get_service_info_cached(self, mock_getservbyport):
+        """Test that probed ports skip the services database and others hit it once"""
+        mock_getservbyport.return_value = "custom"
 
-def async_test(coro):
-    """Decorator to run async tests"""
-    def wrapper(*args, **kwargs):
-        return asyncio.run(coro(*args, **kwargs))
-    return wrapper
-
-
-# Run async tests
-for name in dir(TestNetworkScanner):
-    if name.startswith('test_') and asyncio.iscoroutinefunction(getattr(TestNetworkScanner, name)):
-        setattr(TestNetworkScanner, name, async_test(getattr(TestNetworkScanner, name)))
+        # Probed ports were resolved at import, still to services database names
+        self.assertEqual(self.scanner.get_service_info(80), network_scanner._PORT_SERVICES[80])
+        self.assertNotEqual(self.scanner.get_service_info(80), network_scanner.COMMON_PORTS[80])
+        mock_getservbyport.assert_not_called()
 
-for name in dir(TestPortScanner):
-    if name.startswith('test_') and asyncio.iscoroutinefunction(getattr(TestPortScanner, name)):
-        setattr(TestPortScanner, name, async_test(getattr(TestPortScanner, name)))
+        # The lookup cache is module state; leave it empty for other tests
+        network_scanner._lookup_service.cache_clear()
+        self.addCleanup(network_scanner._lookup_service.cache_clear)
+        self.assertEqual(self.scanner.get_service_info(40123), "custom")
+        self.assertEqual(self.scanner.get_service_info(40123), "custom")
+        mock_getservbyport.assert_called_once_with(40123)
 
 
 if __name__ == '__main__':
@@ -1,11 +1,67 @@
 """Unit tests for RS485 Driver"""
+import asyncio
+import importlib.util
 import unittest
+from unittest.mock import patch
+import rs485_driver
 from rs485_driver import (
     RS485Config, VFDCommand, VFDStatus,
-    VFDRegisterMap, RS485Stub, create_rs485_driver
+    VFDRegisterMap, RS485Driver, AsyncRS485Driver, RS485Stub, create_rs485_driver,
+    VFDFleetStatus,
+    ModbusRTUClient, crc16_modbus
 )
 
 
+class FakeResponse:
+    """Minimal pymodbus response"""
+
+    def __init__(self, registers=None, error=False):
+        self.registers = registers or []
+        self._error = error
+
+    def isError(self):
+        return self._error
+
+
+class FakeModbusClient:
+    """In-memory Modbus client backed by a register dict"""
+
+    def __init__(self, *args, **kwargs):
+        self.registers = {}
+        self.reads = []
+        self.writes = []
+        self.socket = FakeSerial()
+
+    def connect(self):
+        return True
+
+    def close(self):
+        pass
+
+    def read_holding_registers(self, address, count, slave=1):
+        self.reads.append((address, count))
+        return FakeResponse(
+            [self.registers.get(address + i, 0) for i in range(count)]
+        )
+
+    def write_register(self, address, value, slave=1):
+        self.writes.append((address, value))
+        self.registers[address] = value
+        return FakeResponse()
+
+    def write_registers(self, address, values, slave=1):
+        self.writes.append((address, list(values)))
+        for offset, value in enumerate(values):
+            self.registers[address + offset] = value
+        return FakeResponse()
+
+    def readwrite_registers(self, read_address=0, read_count=0,
+                            write_address=0, values=None, slave=1):
+        for offset, value in enumerate(values or []):
+            self.write_register(write_address + offset, value)
+        return self.read_holding_registers(read_address, read_count)
+
+
 class TestRS485Config(unittest.TestCase):
     """Test RS485 configuration"""
 
@@ -22,6 +78,8 @@ class TestRS485Config(unittest.TestCase):
 
         self.assertEqual(config.port, '/dev/ttyUSB0')
         self.assertEqual(config.baudrate, 9600)
+        self.assertIsNone(config.inter_byte_timeout)
+        self.assertFalse(config.low_latency)
         self.assertEqual(config.bytesize, 8)
         self.assertEqual(config.parity, 'N')
         self.assertEqual(config.stopbits, 1)
@@ -33,6 +91,8 @@ class TestRS485Config(unittest.TestCase):
 
         self.assertEqual(config.port, '/dev/ttyUSB0')
         self.assertEqual(config.baudrate, 9600)
+        self.assertIsNone(config.inter_byte_timeout)
+        self.assertFalse(config.low_latency)
 
 
 class TestVFDEnums(unittest.TestCase):
@@ -54,49 +114,36 @@ class TestVFDEnums(unittest.TestCase):
 class TestRS485Stub(unittest.TestCase):
     """Test RS485 stub implementation (no hardware required)"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.config = RS485Config(
+    # (method, args, expected result); the stub never talks to hardware
+    STUB_CALLS = [
+        ('start_motor', (), False),
+        ('start_motor', (False,), False),
+        ('stop_motor', (), False),
+        ('set_frequency', (50.0,), False),
+        ('set_frequency', (100.0,), False),
+        ('get_status', (), None),
+        ('get_fault_code', (), None),
+        ('reset_fault', (), False),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up one stub for the class; it keeps no state between calls"""
+        cls.config = RS485Config(
             port='/dev/ttyUSB0',
             baudrate=9600
         )
+        cls.stub = RS485Stub(cls.config)
 
-    def test_stub_start_motor(self):
-        """Test stub start motor (always returns False)"""
-        stub = RS485Stub(self.config)
-        self.assertFalse(stub.start_motor())
-        self.assertFalse(stub.start_motor(forward=False))
-
-    def test_stub_stop_motor(self):
-        """Test stub stop motor"""
-        stub = RS485Stub(self.config)
-        self.assertFalse(stub.stop_motor())
-
-    def test_stub_set_frequency(self):
-        """Test stub set frequency"""
-        stub = RS485Stub(self.config)
-        self.assertFalse(stub.set_frequency(50.0))
-        self.assertFalse(stub.set_frequency(100.0))
-
-    def test_stub_get_status(self):
-        """Test stub get status (returns None)"""
-        stub = RS485Stub(self.config)
-        self.assertIsNone(stub.get_status())
-
-    def test_stub_get_fault_code(self):
-        """Test stub get fault code"""
-        stub = RS485Stub(self.config)
-        self.assertIsNone(stub.get_fault_code())
-
-    def test_stub_reset_fault(self):
-        """Test stub reset fault"""
-        stub = RS485Stub(self.config)
-        self.assertFalse(stub.reset_fault())
+    def test_stub_commands(self):
+        """Test stub commands (writes return False, reads return None)"""
+        for method, args, expected in self.STUB_CALLS:
+            with self.subTest(method=method, args=args):
+                self.assertIs(getattr(self.stub, method)(*args), expected)
 
     def test_stub_statistics(self):
         """Test stub get statistics"""
-        stub = RS485Stub(self.config)
-        stats = stub.get_statistics()
+        stats = self.stub.get_statistics()
 
         self.assertFalse(stats['connected'])
         self.assertTrue(stats['stub'])
@@ -108,5 +155,402 @@ class TestRS485Stub(unittest.TestCase):
         # Should not raise any exceptions
 
 
+class FakeAsyncModbusClient(FakeModbusClient):
+    """Async wrapper around FakeModbusClient"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connected = False
+
+    async def connect(self):
+        self.connected = True
+        return True
+
+    async def read_holding_registers(self, address, count, slave=1):
+        return super().read_holding_registers(address, count, slave)
+
+    async def write_register(self, address, value, slave=1):
+        return super().write_register(address, value, slave)
+
+
+class FakeSerial:
+    """Serial port replaying a canned response"""
+
+    def __init__(self, response=b''):
+        self.response = response
+        self.written = b''
+        self.flushed = False
+
+    def write(self, data):
+        self.written += data
+
+    def read(self, size):
+        chunk, self.response = self.response[:size], self.response[size:]
+        return chunk
+
+    def reset_input_buffer(self):
+        self.flushed = True
+
+    def set_low_latency_mode(self, enabled):
+        self.low_latency = enabled
+
+
+def with_crc(frame):
+    """Append Modbus CRC to a frame"""
+    crc = crc16_modbus(frame)
+    return frame + bytes((crc & 0xFF, crc >> 8))
+
+
+class TestModbusRTUClient(unittest.TestCase):
+    """Test native Modbus RTU framing"""
+
+    def setUp(self):
+        """Create client with fake serial port"""
+        self.client = ModbusRTUClient('/dev/ttyUSB0')
+        self.port = FakeSerial()
+        self.client._serial = self.port
+
+    def test_crc16_known_vector(self):
+        """Test CRC against a reference Modbus frame"""
+        self.assertEqual(crc16_modbus(bytes.fromhex('010300000001')), 0x0A84)
+
+    def test_read_holding_registers(self):
+        """Test FC3 request and response parsing"""
+        self.port.response = with_crc(bytes.fromhex('010304138800c8'))
+
+        result = self.client.read_holding_registers(0x2001, 2, slave=1)
+
+        self.assertFalse(result.isError())
+        self.assertEqual(result.registers, [5000, 200])
+        self.assertEqual(self.port.written, with_crc(bytes.fromhex('010320010002')))
+
+    def test_write_register(self):
+        """Test FC6 request echo"""
+        frame = with_crc(bytes.fromhex('010630011388'))
+        self.port.response = frame
+
+        result = self.client.write_register(0x3001, 5000, slave=1)
+
+        self.assertFalse(result.isError())
+        self.assertEqual(self.port.written, frame)
+
+    def test_readwrite_registers(self):
+        """Test FC23 request layout and response parsing"""
+        self.port.response = with_crc(bytes.fromhex('011704000100c8'))
+
+        result = self.client.readwrite_registers(
+            read_address=0x2000, read_count=2,
+            write_address=0x3001, values=[5000], slave=1
+        )
+
+        self.assertEqual(result.registers, [1, 200])
+        self.assertEqual(
+            self.port.written,
+            with_crc(bytes.fromhex('0117200000023001000102' + '1388'))
+        )
+
+    def test_write_registers(self):
+        """Test FC16 request layout"""
+        self.port.response = with_crc(bytes.fromhex('011030010003'))
+
+        result = self.client.write_registers(0x3001, [5000, 20, 30], slave=1)
+
+        self.assertFalse(result.isError())
+        self.assertEqual(
+            self.port.written,
+            with_crc(bytes.fromhex('01103001000306' + '1388' + '0014' + '001e'))
+        )
+
+    def test_exception_response(self):
+        """Test Modbus exception responses are reported as errors"""
+        self.port.response = with_crc(bytes.fromhex('018302'))
+
+        result = self.client.read_holding_registers(0x2000, 7)
+
+        self.assertTrue(result.isError())
+        self.assertIn('exception code 2', str(result))
+
+    def test_timeout_flushes_next_request(self):
+        """Test a short response marks the input buffer for flushing"""
+        self.assertTrue(self.client.read_holding_registers(0x2000, 7).isError())
+        self.assertFalse(self.port.flushed)
+
+        self.client.read_holding_registers(0x2000, 7)
+        self.assertTrue(self.port.flushed)
+
+    def test_crc_mismatch(self):
+        """Test corrupted frames are rejected"""
+        self.port.response = bytes.fromhex('010302138800')
+
+        self.assertTrue(self.client.read_holding_registers(0x2000, 1).isError())
+
+
+class FakeDriverMixin:
+    """Creates an RS485Driver backed by FakeModbusClient"""
+
+    def setUp(self):
+        """Create driver with patched Modbus client"""
+        patches = [
+            patch.object(rs485_driver, 'MODBUS_AVAILABLE', True),
+            patch.object(rs485_driver, 'ModbusSerialClient',
+                         FakeModbusClient, create=True),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+        self.driver = RS485Driver(RS485Config())
+        self.client = self.driver._client
+        self.client.registers.update({
+            0x2000: VFDStatus.RUNNING | VFDStatus.FORWARD | VFDStatus.READY,
+            0x2001: 5000,
+            0x2002: 4990,
+            0x2003: 123,
+            0x2004: 400,
+            0x2005: 560,
+            0x2006: 55,
+            0x2100: 7,
+        })
+
+
+class TestRS485Driver(FakeDriverMixin, unittest.TestCase):
+    """Test RS485 driver against a fake Modbus client"""
+
+    def test_get_status(self):
+        """Test status decoding from a single block read"""
+        status = self.driver.get_status()
+
+        self.assertTrue(status['running'])
+        self.assertFalse(status['fault'])
+        self.assertEqual(status['frequency_ref'], 50.0)
+        self.assertEqual(status['output_current'], 12.3)
+        self.assertEqual(self.client.reads, [(0x2000, 7)])
+
+    def test_get_full_snapshot(self):
+        """Test snapshot includes status and fault code"""
+        snapshot = self.driver.get_full_snapshot()
+
+        self.assertTrue(snapshot['ready'])
+        self.assertEqual(snapshot['output_power'], 5.5)
+        self.assertEqual(snapshot['fault_code'], 7)
+
+    def test_set_frequency_and_read_status(self):
+        """Test combined setpoint write and status read"""
+        status = self.driver.set_frequency_and_read_status(42.5)
+
+        self.assertEqual(self.client.writes, [(0x3001, 4250)])
+        self.assertTrue(status['running'])
+        self.assertEqual(status['frequency_ref'], 50.0)
+        stats = self.driver.get_statistics()
+        self.assertEqual((stats['read_count'], stats['write_count']), (1, 1))
+
+    def test_apply_motion_profile_single_write(self):
+        """Test contiguous setpoints are written in one request"""
+        self.assertTrue(self.driver.apply_motion_profile(50.0, 2.5, 3.0))
+
+        self.assertEqual(self.client.writes, [(0x3001, [5000, 25, 30])])
+
+    def test_apply_motion_profile_non_contiguous_map(self):
+        """Test custom register maps fall back to single writes"""
+        register_map = VFDRegisterMap()
+        register_map.ACCEL_TIME = 0x3010
+        self.driver._register_map = register_map
+
+        self.assertTrue(self.driver.apply_motion_profile(50.0, 2.5, 3.0))
+
+        self.assertEqual(
+            self.client.writes,
+            [(0x3001, 5000), (0x3010, 25), (0x3003, 30)]
+        )
+
+    def test_read_many_merges_adjacent_blocks(self):
+        """Test nearby register blocks are fetched in one transaction"""
+        blocks = self.driver._read_many([(0x2003, 2), (0x2000, 2)])
+
+        self.assertEqual(self.client.reads, [(0x2000, 5)])
+        self.assertEqual(blocks[0x2000], [0x23, 5000])
+        self.assertEqual(blocks[0x2003], [123, 400])
+
+    def test_serial_tuning_applied_on_connect(self):
+        """Test timing options are applied to the serial port"""
+        driver = RS485Driver(RS485Config(
+            write_timeout=0.1, inter_byte_timeout=0.01, low_latency=True
+        ))
+        port = driver._client.socket
+
+        self.assertEqual(port.write_timeout, 0.1)
+        self.assertEqual(port.inter_byte_timeout, 0.01)
+        self.assertTrue(port.low_latency)
+
+    def test_factory_shares_link_per_port(self):
+        """Test drivers on one port share the client until the last close"""
+        config = RS485Config(port='/dev/ttyRS485')
+        vfd1 = create_rs485_driver(config, slave_id=1)
+        vfd2 = create_rs485_driver(config, slave_id=2)
+
+        self.assertIs(vfd1._client, vfd2._client)
+
+        vfd1.close()
+        vfd1.close()
+        self.assertTrue(vfd2.get_statistics()['connected'])
+        self.assertIn('/dev/ttyRS485', rs485_driver._LINKS)
+
+        vfd2.close()
+        self.assertFalse(vfd2.get_statistics()['connected'])
+        self.assertNotIn('/dev/ttyRS485', rs485_driver._LINKS)
+
+    def test_factory_rejects_conflicting_port_settings(self):
+        """Test a second config for an open port must match its settings"""
+        vfd = create_rs485_driver(RS485Config(port='/dev/ttyRS485', baudrate=9600))
+        self.addCleanup(vfd.close)
+
+        with self.assertRaises(ValueError):
+            create_rs485_driver(RS485Config(port='/dev/ttyRS485', baudrate=19200))
+
+        same = create_rs485_driver(RS485Config(port='/dev/ttyRS485', baudrate=9600), slave_id=2)
+        self.addCleanup(same.close)
+        self.assertIs(same._client, vfd._client)
+
+    def test_reconnect_after_transport_error(self):
+        """Test a dropped link is reopened and the request retried"""
+        def broken_read(*args, **kwargs):
+            raise OSError("device reports readiness to read but returned no data")
+
+        self.client.read_holding_registers = broken_read
+
+        registers = self.driver._read_registers(0x2000, 2)
+
+        self.assertEqual(registers, [0, 0])
+        self.assertIsNot(self.driver._client, self.client)
+        self.assertEqual(self.driver.get_statistics()['error_count'], 1)
+
+    def test_no_reconnect_on_non_transport_error(self):
+        """Test errors other than transport failures do not reopen the link"""
+        def buggy_read(*args, **kwargs):
+            raise ValueError("bad register count")
+
+        self.client.read_holding_registers = buggy_read
+
+        self.assertIsNone(self.driver._read_registers(0x2000, 2))
+        self.assertIs(self.driver._client, self.client)
+
+    def test_no_reconnect_after_close(self):
+        """Test a closed driver does not reopen the link"""
+        self.driver.close()
+
+        self.assertIsNone(self.driver._read_registers(0x2000, 2))
+        self.assertFalse(self.driver.get_statistics()['connected'])
+
+    def test_write_reopens_disconnected_link(self):
+        """Test writes reconnect when the link was marked down"""
+        self.driver._connected = False
+
+        self.assertTrue(self.driver.set_frequency(25.0))
+        self.assertTrue(self.driver.get_statistics()['connected'])
+
+
+@unittest.skipUnless(importlib.util.find_spec('numpy'), "numpy not installed")
+class TestVFDFleetStatus(FakeDriverMixin, unittest.TestCase):
+    """Test vectorized fleet status decoding"""
+
+    def test_fleet_decode_matches_get_status(self):
+        """Test fleet rows decode to the same dicts as get_status()"""
+        fleet = VFDFleetStatus(['vfd1', 'vfd2'])
+
+        fleet.poll({'vfd1': self.driver})
+        fleet.update('vfd2', None)
+        decoded = fleet.decode()
+
+        self.assertEqual(list(decoded), ['vfd1'])
+        self.assertEqual(decoded['vfd1'], self.driver.get_status())
+
+    def test_fault_column(self):
+        """Test fault flags as a boolean column"""
+        fleet = VFDFleetStatus(['a', 'b'])
+        fleet.update('a', [VFDStatus.FAULT, 0, 0, 0, 0, 0, 0])
+        fleet.update('b', [VFDStatus.RUNNING, 0, 0, 0, 0, 0, 0])
+
+        self.assertEqual(fleet.decode_columns()['fault'].tolist(), [True, False])
+
+
+class TestAsyncRS485Driver(unittest.TestCase):
+    """Test asyncio RS485 driver against a fake client"""
+
+    def setUp(self):
+        """Patch pymodbus async client"""
+        patches = [
+            patch.object(rs485_driver, 'MODBUS_AVAILABLE', True),
+            patch.object(rs485_driver, 'AsyncModbusSerialClient',
+                         FakeAsyncModbusClient, create=True),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_write_and_read(self):
+        """Test writes and status reads through the async client"""
+        async def scenario():
+            async with AsyncRS485Driver(RS485Config()) as driver:
+                driver._client.registers[0x2000] = VFDStatus.FAULT
+                self.assertTrue(await driver.set_frequency(30.0))
+                status = await driver.get_status()
+                return driver._client.writes, status
+
+        writes, status = asyncio.run(scenario())
+
+        self.assertEqual(writes, [(0x3001, 3000)])
+        self.assertTrue(status['fault'])
+        self.assertFalse(status['running'])
+
+    def test_concurrent_requests_are_serialized(self):
+        """Test gather() over several requests completes without errors"""
+        async def scenario():
+            async with AsyncRS485Driver(RS485Config()) as driver:
+                await asyncio.gather(
+                    driver.start_motor(),
+                    driver.set_frequency(10.0),
+                    driver.get_fault_code()
+                )
+                return driver.get_statistics()
+
+        stats = asyncio.run(scenario())
+
+        self.assertEqual((stats['read_count'], stats['write_count']), (1, 2))
+        self.assertEqual(stats['error_count'], 0)
+
+    def test_no_reconnect_on_non_transport_error(self):
+        """Test errors other than transport failures do not reopen the link"""
+        async def scenario():
+            async with AsyncRS485Driver(RS485Config()) as driver:
+                client = driver._client
+
+                async def buggy_read(*args, **kwargs):
+                    raise ValueError("bad register count")
+
+                client.read_holding_registers = buggy_read
+                return await driver.get_fault_code(), driver._client is client
+
+        fault, same_client = asyncio.run(scenario())
+
+        self.assertIsNone(fault)
+        self.assertTrue(same_client)
+
+    def test_no_reconnect_after_close(self):
+        """Test a closed driver does not reopen the client"""
+        async def scenario():
+            driver = AsyncRS485Driver(RS485Config())
+            await driver.connect()
+            await driver.close()
+            with self.assertRaises(ConnectionError):
+                await driver._call('read_holding_registers', 0x2000, 1)
+            return await driver.get_fault_code(), driver._client, driver.get_statistics()
+
+        fault, client, stats = asyncio.run(scenario())
+
+        self.assertIsNone(fault)
+        self.assertIsNone(client)
+        self.assertFalse(stats['connected'])
+
+
 if __name__ == '__main__':
     unittest.main()
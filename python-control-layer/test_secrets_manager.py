@@ -1,37 +1,20 @@
 """Tests for secrets manager"""
-import os
 import pytest
+from unittest.mock import MagicMock
 from secrets_manager import SecretsManager
 
 
 class TestSecretsManager:
     """Tests for SecretsManager"""
 
-    def setup_method(self):
-        """Set up test environment"""
-        # Save original environment
-        self.original_env = {
-            'MQTT_USERNAME': os.getenv('MQTT_USERNAME'),
-            'MQTT_PASSWORD': os.getenv('MQTT_PASSWORD'),
-            'DB_PASSWORD': os.getenv('DB_PASSWORD'),
-            'HMI_API_KEY': os.getenv('HMI_API_KEY'),
-            'USE_VAULT': os.getenv('USE_VAULT')
-        }
-
-        # Set test values
-        os.environ['MQTT_USERNAME'] = 'test_mqtt_user'
-        os.environ['MQTT_PASSWORD'] = 'test_mqtt_pass'
-        os.environ['DB_PASSWORD'] = 'test_db_pass'
-        os.environ['HMI_API_KEY'] = 'test_hmi_key'
-        os.environ['USE_VAULT'] = 'false'
-
-    def teardown_method(self):
-        """Restore original environment"""
-        for key, value in self.original_env.items():
-            if value is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = value
+    @pytest.fixture(autouse=True)
+    def env(self, monkeypatch):
+        """Set test environment; monkeypatch restores it after each test"""
+        monkeypatch.setenv('MQTT_USERNAME', 'test_mqtt_user')
+        monkeypatch.setenv('MQTT_PASSWORD', 'test_mqtt_pass')
+        monkeypatch.setenv('DB_PASSWORD', 'test_db_pass')
+        monkeypatch.setenv('HMI_API_KEY', 'test_hmi_key')
+        monkeypatch.setenv('USE_VAULT', 'false')
 
     def test_initialization_without_vault(self):
         """Test initialization without Vault"""
@@ -60,6 +43,29 @@ class TestSecretsManager:
         value = manager.get_secret('NON_EXISTENT_KEY')
         assert value is None
 
+    def test_refresh_env(self, monkeypatch):
+        """Test environment changes are picked up after refresh_env()"""
+        manager = SecretsManager(use_vault=False)
+        monkeypatch.setenv('MQTT_USERNAME', 'rotated_user')
+
+        assert manager.get_secret('MQTT_USERNAME') == 'test_mqtt_user'
+
+        manager.refresh_env()
+        assert manager.get_secret('MQTT_USERNAME') == 'rotated_user'
+
+    def test_credentials_cached_until_refresh(self, monkeypatch):
+        """Test credential helpers are memoized until refresh()"""
+        manager = SecretsManager(use_vault=False)
+        creds = manager.get_mqtt_credentials()
+        creds['username'] = 'mutated'
+        monkeypatch.setenv('MQTT_USERNAME', 'rotated_user')
+        manager._env['MQTT_USERNAME'] = 'rotated_user'
+
+        assert manager.get_mqtt_credentials()['username'] == 'test_mqtt_user'
+
+        manager.refresh()
+        assert manager.get_mqtt_credentials()['username'] == 'rotated_user'
+
     def test_get_mqtt_credentials(self):
         """Test getting MQTT credentials"""
         manager = SecretsManager(use_vault=False)
@@ -68,11 +74,11 @@ class TestSecretsManager:
         assert creds['username'] == 'test_mqtt_user'
         assert creds['password'] == 'test_mqtt_pass'
 
-    def test_get_mqtt_tls_config(self):
+    def test_get_mqtt_tls_config(self, monkeypatch):
         """Test getting MQTT TLS configuration"""
-        os.environ['MQTT_CA_CERTS'] = '/path/to/ca.crt'
-        os.environ['MQTT_CERTFILE'] = '/path/to/cert.crt'
-        os.environ['MQTT_KEYFILE'] = '/path/to/key.key'
+        monkeypatch.setenv('MQTT_CA_CERTS', '/path/to/ca.crt')
+        monkeypatch.setenv('MQTT_CERTFILE', '/path/to/cert.crt')
+        monkeypatch.setenv('MQTT_KEYFILE', '/path/to/key.key')
 
         manager = SecretsManager(use_vault=False)
 
@@ -81,15 +87,10 @@ class TestSecretsManager:
         assert tls_config['certfile'] == '/path/to/cert.crt'
         assert tls_config['keyfile'] == '/path/to/key.key'
 
-        # Clean up
-        del os.environ['MQTT_CA_CERTS']
-        del os.environ['MQTT_CERTFILE']
-        del os.environ['MQTT_KEYFILE']
-
-    def test_get_api_keys(self):
+    def test_get_api_keys(self, monkeypatch):
         """Test getting API keys"""
-        os.environ['MONITORING_API_KEY'] = 'test_monitoring_key'
-        os.environ['ADMIN_API_KEY'] = 'test_admin_key'
+        monkeypatch.setenv('MONITORING_API_KEY', 'test_monitoring_key')
+        monkeypatch.setenv('ADMIN_API_KEY', 'test_admin_key')
 
         manager = SecretsManager(use_vault=False)
 
@@ -98,16 +99,12 @@ class TestSecretsManager:
         assert api_keys['monitoring'] == 'test_monitoring_key'
         assert api_keys['admin'] == 'test_admin_key'
 
-        # Clean up
-        del os.environ['MONITORING_API_KEY']
-        del os.environ['ADMIN_API_KEY']
-
-    def test_get_database_credentials(self):
+    def test_get_database_credentials(self, monkeypatch):
         """Test getting database credentials"""
-        os.environ['DB_HOST'] = 'test_host'
-        os.environ['DB_PORT'] = '5433'
-        os.environ['DB_NAME'] = 'test_db'
-        os.environ['DB_USER'] = 'test_user'
+        monkeypatch.setenv('DB_HOST', 'test_host')
+        monkeypatch.setenv('DB_PORT', '5433')
+        monkeypatch.setenv('DB_NAME', 'test_db')
+        monkeypatch.setenv('DB_USER', 'test_user')
 
         manager = SecretsManager(use_vault=False)
 
@@ -118,17 +115,11 @@ class TestSecretsManager:
         assert db_creds['user'] == 'test_user'
         assert db_creds['password'] == 'test_db_pass'
 
-        # Clean up
-        del os.environ['DB_HOST']
-        del os.environ['DB_PORT']
-        del os.environ['DB_NAME']
-        del os.environ['DB_USER']
-
-    def test_get_database_credentials_defaults(self):
+    def test_get_database_credentials_defaults(self, monkeypatch):
         """Test getting database credentials with defaults"""
         # Remove optional environment variables
         for key in ['DB_HOST', 'DB_PORT', 'DB_NAME', 'DB_USER']:
-            os.environ.pop(key, None)
+            monkeypatch.delenv(key, raising=False)
 
         manager = SecretsManager(use_vault=False)
 
@@ -139,5 +130,45 @@ class TestSecretsManager:
         assert db_creds['user'] == 'modax_user'
 
 
+class TestVaultSecretCache:
+    """Tests for caching of the Vault KV document"""
+
+    def setup_method(self):
+        """Create a manager wired to a fake Vault client"""
+        self.manager = SecretsManager(use_vault=False)
+        self.manager.use_vault = True
+        self.manager.vault_client = MagicMock()
+        self.read = self.manager.vault_client.secrets.kv.v2.read_secret_version
+        self.read.return_value = {
+            'data': {'data': {'DB_PASSWORD': 'vault_db_pass', 'DB_HOST': 'db'}}
+        }
+
+    def test_secrets_fetched_once_per_ttl(self):
+        """Test several lookups share one Vault read"""
+        creds = self.manager.get_database_credentials()
+
+        assert creds['password'] == 'vault_db_pass'
+        assert creds['host'] == 'db'
+        assert creds['port'] == '5432'
+        assert self.read.call_count == 1
+
+    def test_expired_cache_is_refreshed(self):
+        """Test the document is re-read after the TTL"""
+        self.manager._vault_cache_ttl = 0
+
+        self.manager.get_secret('DB_PASSWORD')
+        self.manager.get_secret('DB_PASSWORD')
+
+        assert self.read.call_count == 2
+
+    def test_stale_cache_used_when_refresh_fails(self):
+        """Test a failed refresh falls back to cached secrets"""
+        self.manager._vault_cache_ttl = 0
+        self.manager.get_secret('DB_PASSWORD')
+        self.read.side_effect = ConnectionError("vault unreachable")
+
+        assert self.manager.get_secret('DB_PASSWORD') == 'vault_db_pass'
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -1,8 +1,10 @@
 """Tests for security audit logging"""
-import os
+import io
 import json
+import logging
 import pytest
-import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import patch
 from security_audit import SecurityAuditLogger
 
 
@@ -11,32 +13,18 @@ class TestSecurityAuditLogger:
 
     def setup_method(self):
         """Set up test environment"""
-        # Create temporary log file
-        self.temp_dir = tempfile.mkdtemp()
-        self.log_path = os.path.join(self.temp_dir, 'test_audit.log')
-        self.logger = SecurityAuditLogger(self.log_path)
+        # Events go to an in-memory stream instead of a log file
+        self.stream = io.StringIO()
+        self.logger = SecurityAuditLogger(handler=logging.StreamHandler(self.stream))
 
     def teardown_method(self):
         """Clean up test environment"""
-        # Clean up temp files
-        if os.path.exists(self.log_path):
-            os.remove(self.log_path)
-        if os.path.exists(self.temp_dir):
-            os.rmdir(self.temp_dir)
+        self.logger.close()
 
     def read_log_entries(self):
         """Read and parse log entries"""
-        if not os.path.exists(self.log_path):
-            return []
-
-        with open(self.log_path, 'r') as f:
-            lines = f.readlines()
-
-        entries = []
-        for line in lines:
-            if line.strip():
-                entries.append(json.loads(line))
-        return entries
+        self.logger.flush()
+        return [json.loads(line) for line in self.stream.getvalue().splitlines() if line]
 
     def test_log_authentication_success(self):
         """Test logging successful authentication"""
@@ -177,6 +165,30 @@ class TestSecurityAuditLogger:
         assert entries[1]['action'] == 'login_failed'
         assert entries[2]['event_type'] == 'control_command'
 
+    def test_log_security_event(self):
+        """Test custom events with and without extra fields"""
+        self.logger.log_security_event(
+            event_type="rate_limit",
+            severity="WARNING",
+            description="Too many requests",
+            source_ip="10.0.0.5"
+        )
+        self.logger.log_security_event(
+            event_type="rate_limit",
+            severity="WARNING",
+            description="Override",
+            severity_detail="minor",
+            timestamp="caller-supplied"
+        )
+
+        entries = self.read_log_entries()
+        assert len(entries) == 2
+        assert list(entries[0])[:3] == ['timestamp', 'event_type', 'severity']
+        assert entries[0]['event_type'] == 'rate_limit'
+        assert entries[0]['source_ip'] == '10.0.0.5'
+        assert entries[1]['timestamp'] == 'caller-supplied'
+        assert entries[1]['severity_detail'] == 'minor'
+
     def test_timestamp_format(self):
         """Test that timestamps are in ISO format"""
         self.logger.log_authentication_success(user="test_user")
@@ -187,8 +199,42 @@ class TestSecurityAuditLogger:
         timestamp = entries[0]['timestamp']
         # Should be in ISO format with timezone info
         assert 'T' in timestamp
-        # Should have timezone info (either Z or +00:00 or similar)
-        assert (timestamp.endswith('Z') or '+' in timestamp or timestamp.endswith('+00:00'))
+
+        # Local time with its UTC offset, as datetime.now().astimezone() gives
+        parsed = datetime.fromisoformat(timestamp)
+        now = datetime.now().astimezone()
+        assert parsed.utcoffset() == now.utcoffset()
+        assert abs(now - parsed) < timedelta(seconds=5)
+
+
+class TestAuditLogFile:
+    """Tests for the default file-backed audit log"""
+
+    def test_events_written_to_file(self, tmp_path):
+        """Test events reach the audit log file as JSON lines, in order"""
+        log_path = tmp_path / 'audit' / 'test_audit.log'
+        audit = SecurityAuditLogger(str(log_path))
+        try:
+            audit.log_authentication_success(user="first")
+            audit.log_authentication_failure(attempted_user="second")
+            audit.flush()
+
+            with open(log_path, 'rb') as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+        finally:
+            audit.close()
+
+        assert audit.audit_log_path == log_path
+        assert [e['action'] for e in entries] == ['login_success', 'login_failed']
+
+    def test_close_drops_exit_hook(self, tmp_path):
+        """Test closing a logger unregisters its atexit hook"""
+        audit = SecurityAuditLogger(str(tmp_path / 'audit.log'))
+
+        with patch('security_audit.atexit.unregister') as unregister:
+            audit.close()
+
+        unregister.assert_called_once_with(audit.close)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,429 @@
+"""Unit tests for Slave Board communication"""
+import ctypes
+import threading
+import time
+import unittest
+from unittest.mock import patch
+import slave_board
+from slave_board import (
+    SlaveBoardI2C, SlaveBoardStub, SlaveConfig, SlaveType, I2CCommand,
+    MultiBusSlaveManager, create_slave_board_manager
+)
+
+I2C_M_RD = 0x0001  # Read flag of struct i2c_msg
+
+
+class FakeSMBus:
+    """In-memory I2C bus with scripted slave responses"""
+
+    def __init__(self, bus=1):
+        self.present = set()
+        self.responses = {}  # (address, command) -> list of bytes
+        self.transactions = []
+
+    def close(self):
+        pass
+
+    def read_byte(self, address):
+        self.transactions.append(('read_byte', address))
+        if address not in self.present:
+            raise OSError(121, "Remote I/O error")
+        return 0
+
+    def i2c_rdwr(self, *messages):
+        self.transactions.append(('rdwr', [(m.addr, m.flags, bytes(m)) for m in messages]))
+        command = None
+        for message in messages:
+            if message.addr not in self.present:
+                raise OSError(121, "Remote I/O error")
+            if message.flags & I2C_M_RD:
+                data = bytes(self.responses.get((message.addr, command), b''))
+                data = data[:message.len].ljust(message.len, b'\x00')
+                ctypes.memmove(message.buf, data, message.len)
+            elif message.len:
+                command = bytes(message)[0]
+
+
+class SlaveBoardTestCase(unittest.TestCase):
+    """Creates a SlaveBoardI2C on a FakeSMBus"""
+
+    def setUp(self):
+        """Create manager with one analog slave"""
+        patcher = patch.object(slave_board.smbus2, 'SMBus', FakeSMBus)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.manager = SlaveBoardI2C(bus=1, auto_discover=False)
+        self.bus = self.manager._bus
+        self.bus.present.update({0x20, 0x50})
+        self.manager.add_slave(SlaveConfig(
+            slave_id=1,
+            slave_type=SlaveType.ANALOG_INPUT,
+            address=0x20,
+            description="Analog board",
+            num_analog_inputs=4
+        ))
+
+
+class TestSlaveDiscovery(SlaveBoardTestCase):
+    """Test I2C bus discovery"""
+
+    def test_discover_slaves(self):
+        """Test present addresses are reported"""
+        self.assertEqual(self.manager.discover_slaves(), [0x20, 0x50])
+        self.assertEqual(self.manager.get_statistics()['slaves_discovered'], 2)
+
+    def test_eeprom_range_probed_with_read(self):
+        """Test EEPROM addresses are never quick-written"""
+        self.manager.discover_slaves()
+
+        self.assertIn(('read_byte', 0x50), self.bus.transactions)
+        quick_writes = [t[1][0][0] for t in self.bus.transactions if t[0] == 'rdwr']
+        self.assertIn(0x20, quick_writes)
+        self.assertNotIn(0x50, quick_writes)
+
+
+class TestSlaveIO(SlaveBoardTestCase):
+    """Test reads and writes on a registered slave"""
+
+    def test_read_analog_input_combined_transaction(self):
+        """Test command and reply share one i2c_rdwr call"""
+        self.bus.responses[(0x20, I2CCommand.CMD_READ_ANALOG)] = [0x80, 0x00]
+
+        value = self.manager.read_analog_input(1, channel=2)
+
+        self.assertAlmostEqual(value, 0x8000 / 65535.0)
+        self.assertEqual(self.bus.transactions, [
+            ('rdwr', [(0x20, 0, bytes([I2CCommand.CMD_READ_ANALOG, 2])),
+                      (0x20, I2C_M_RD, b'\x00\x00')])
+        ])
+
+    def test_read_reuses_message_buffers(self):
+        """Test repeated reads reuse the prebuilt i2c messages"""
+        messages = []
+        i2c_rdwr = self.bus.i2c_rdwr
+
+        def recording_rdwr(*msgs):
+            messages.append(msgs)
+            i2c_rdwr(*msgs)
+
+        self.bus.i2c_rdwr = recording_rdwr
+        self.bus.responses[(0x20, I2CCommand.CMD_READ_ANALOG)] = [0xFF, 0xFF]
+        self.assertEqual(self.manager.read_analog_input(1, 0), 1.0)
+        self.bus.responses[(0x20, I2CCommand.CMD_READ_ANALOG)] = [0x00, 0x00]
+        self.assertEqual(self.manager.read_analog_input(1, 0), 0.0)
+
+        self.assertIs(messages[0][1], messages[1][1])
+
+    def test_read_digital_input(self):
+        """Test pin state is taken from the input bitmask"""
+        self.bus.responses[(0x20, I2CCommand.CMD_READ_DIGITAL)] = [0b0100]
+
+        self.assertTrue(self.manager.read_digital_input(1, pin=2))
+        self.assertFalse(self.manager.read_digital_input(1, pin=0))
+
+    def test_get_slave_info(self):
+        """Test firmware version and uptime decoding"""
+        self.bus.responses[(0x20, I2CCommand.CMD_GET_INFO)] = [1, 2, 3, 0, 0, 0, 0x27, 0x10]
+
+        info = self.manager.get_slave_info(1)
+
+        self.assertEqual(info['address'], '0x20')
+        self.assertEqual(info['type'], 'ANALOG_INPUT')
+        self.assertEqual(info['firmware_version'], '1.2.3')
+        self.assertEqual(info['uptime'], 10.0)
+
+    def test_get_slave_info_cached(self):
+        """Test repeated info requests are served without bus traffic"""
+        self.bus.responses[(0x20, I2CCommand.CMD_GET_INFO)] = [1, 2, 3, 0, 0, 0, 0x27, 0x10]
+
+        first = self.manager.get_slave_info(1)
+        self.bus.responses[(0x20, I2CCommand.CMD_GET_INFO)] = [2, 0, 0, 0, 0, 0, 0, 0]
+        cached = self.manager.get_all_slaves()
+
+        self.assertEqual(len(self.bus.transactions), 1)
+        self.assertEqual(cached, [first])
+        self.assertTrue(first['online'])
+
+        refreshed = self.manager.get_slave_info(1, force_refresh=True)
+        self.assertEqual(refreshed['firmware_version'], '2.0.0')
+        self.assertEqual(len(self.bus.transactions), 2)
+
+    def test_get_slave_info_expired(self):
+        """Test info is re-read once the TTL has passed"""
+        self.manager._info_ttl = 0.0
+        self.manager.get_slave_info(1)
+        self.manager.get_slave_info(1)
+
+        self.assertEqual(len(self.bus.transactions), 2)
+
+    def test_get_slave_info_not_cached_while_offline(self):
+        """Test a failed poll makes the next info request hit the bus"""
+        self.bus.responses[(0x20, I2CCommand.CMD_GET_INFO)] = [1, 2, 3, 0, 0, 0, 0x27, 0x10]
+        self.manager.get_slave_info(1)
+
+        self.bus.present.discard(0x20)
+        self.manager.read_analog_input(1, 0)
+        transactions = len(self.bus.transactions)
+
+        self.assertIsNone(self.manager.get_slave_info(1))
+        self.assertEqual(len(self.bus.transactions), transactions + 1)
+
+    def test_writes_use_i2c_rdwr(self):
+        """Test single writes carry the address in the message"""
+        self.assertTrue(self.manager.write_digital_output(1, 3, True))
+        self.assertTrue(self.manager.write_pwm_output(1, 1, 0.5))
+
+        self.assertEqual(self.bus.transactions, [
+            ('rdwr', [(0x20, 0, bytes([I2CCommand.CMD_WRITE_DIGITAL, 3, 1]))]),
+            ('rdwr', [(0x20, 0, bytes([I2CCommand.CMD_WRITE_PWM, 1, 0x7F, 0xFF]))])
+        ])
+
+    def test_write_pwm_block_single_transaction(self):
+        """Test all PWM channels are sent as plain PWM writes in one transaction"""
+        result = self.manager.write_pwm_block(1, {0: 1.0, 3: 0.0, 5: 2.0})
+
+        self.assertTrue(result)
+        self.assertEqual(self.bus.transactions, [
+            ('rdwr', [(0x20, 0, bytes([I2CCommand.CMD_WRITE_PWM, 0, 0xFF, 0xFF])),
+                      (0x20, 0, bytes([I2CCommand.CMD_WRITE_PWM, 3, 0x00, 0x00])),
+                      (0x20, 0, bytes([I2CCommand.CMD_WRITE_PWM, 5, 0xFF, 0xFF]))])
+        ])
+        self.assertEqual(self.manager.get_statistics()['write_count'], 1)
+
+    def test_concurrent_reads_do_not_interleave(self):
+        """Test bus transactions from several threads are serialized"""
+        active = []
+        overlaps = []
+        i2c_rdwr = self.bus.i2c_rdwr
+
+        def slow_rdwr(*messages):
+            if active:
+                overlaps.append(messages)
+            active.append(1)
+            time.sleep(0.001)
+            i2c_rdwr(*messages)
+            active.pop()
+
+        self.bus.i2c_rdwr = slow_rdwr
+
+        def worker():
+            for _ in range(10):
+                self.manager.read_analog_input(1, 0)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(overlaps, [])
+        self.assertEqual(self.manager.get_statistics()['read_count'], 40)
+
+    def test_read_from_missing_slave_marks_offline(self):
+        """Test NACK from the slave is reported as an error"""
+        self.bus.present.discard(0x20)
+
+        self.assertIsNone(self.manager.read_analog_input(1, 0))
+        self.assertEqual(self.manager.get_statistics()['error_count'], 1)
+        status = self.manager.get_slave_status(1)
+        self.assertFalse(status.online)
+        self.assertEqual(status.error_count, 1)
+
+
+class TestI2CWorker(SlaveBoardTestCase):
+    """Test the queued command worker"""
+
+    def test_async_read(self):
+        """Test futures resolve with the read result"""
+        self.bus.responses[(0x20, I2CCommand.CMD_READ_DIGITAL)] = [0b1]
+
+        future = self.manager.read_digital_input_async(1, 0)
+
+        self.assertTrue(future.result(timeout=1))
+        self.manager.close()
+        self.assertIsNone(self.manager._worker)
+
+    def test_consecutive_pwm_writes_coalesced(self):
+        """Test back-to-back PWM writes to one slave share one transaction"""
+        self.manager._worker = object()  # Keep _submit from starting a thread
+        futures = [
+            self.manager.write_pwm_output_async(1, 0, 1.0),
+            self.manager.write_pwm_output_async(1, 1, 0.0),
+            self.manager.read_digital_input_async(1, 0),
+            self.manager.write_pwm_output_async(1, 2, 1.0),
+        ]
+        self.manager._cmd_q.put(None)
+
+        self.manager._worker_loop()
+
+        self.assertEqual([f.result(timeout=0) for f in futures], [True, True, False, True])
+        self.assertEqual(self.bus.transactions, [
+            ('rdwr', [(0x20, 0, bytes([I2CCommand.CMD_WRITE_PWM, 0, 0xFF, 0xFF])),
+                      (0x20, 0, bytes([I2CCommand.CMD_WRITE_PWM, 1, 0x00, 0x00]))]),
+            ('rdwr', [(0x20, 0, bytes([I2CCommand.CMD_READ_DIGITAL])),
+                      (0x20, I2C_M_RD, b'\x00')]),
+            ('rdwr', [(0x20, 0, bytes([I2CCommand.CMD_WRITE_PWM, 2, 0xFF, 0xFF]))]),
+        ])
+        self.manager._worker = None
+
+
+class TestErrorLogging(SlaveBoardTestCase):
+    """Test rate limiting of slave I/O error logs"""
+
+    def test_repeated_errors_logged_once_per_interval(self):
+        """Test an offline slave logs once, then reports suppressed errors"""
+        self.bus.present.discard(0x20)
+
+        with self.assertLogs('slave_board', level='ERROR') as logs:
+            for _ in range(5):
+                self.manager.read_analog_input(1, 0)
+            with patch.object(slave_board, 'I2C_ERROR_LOG_INTERVAL', 0.0):
+                self.manager.read_analog_input(1, 0)
+
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn("4 similar errors suppressed", logs.output[1])
+        self.assertEqual(self.manager.get_statistics()['error_count'], 6)
+
+
+class TestSlaveStatusTable(SlaveBoardTestCase):
+    """Test the vectorized slave status table"""
+
+    def test_offline_slaves_and_statistics(self):
+        """Test online/offline scans across several slaves"""
+        for slave_id, address in ((2, 0x21), (3, 0x22)):
+            self.manager.add_slave(SlaveConfig(
+                slave_id=slave_id,
+                slave_type=SlaveType.DIGITAL_IO,
+                address=address
+            ))
+        self.bus.present.add(0x22)
+
+        self.manager.read_digital_input(1, 0)
+        self.manager.read_digital_input(2, 0)
+        self.manager.read_digital_input(3, 0)
+
+        self.assertEqual(self.manager.get_offline_slaves(), [2])
+        self.assertEqual(self.manager.get_statistics()['slaves_online'], 2)
+        self.assertEqual(self.manager.get_slave_status(2).error_count, 1)
+
+    def test_re_adding_slave_resets_status(self):
+        """Test re-adding a slave reuses its slot with fresh counters"""
+        self.bus.present.discard(0x20)
+        self.manager.read_digital_input(1, 0)
+
+        self.manager.add_slave(SlaveConfig(
+            slave_id=1,
+            slave_type=SlaveType.ANALOG_INPUT,
+            address=0x20
+        ))
+
+        self.assertEqual(self.manager._slot_ids, [1])
+        self.assertEqual(self.manager.get_slave_status(1).error_count, 0)
+
+    def test_status_table_full(self):
+        """Test add_slave fails once the table capacity is reached"""
+        manager = SlaveBoardI2C(bus=1, auto_discover=False, max_slaves=1)
+        config = SlaveConfig(slave_id=1, slave_type=SlaveType.CUSTOM, address=0x20)
+
+        self.assertTrue(manager.add_slave(config))
+        self.assertFalse(manager.add_slave(SlaveConfig(
+            slave_id=2, slave_type=SlaveType.CUSTOM, address=0x21
+        )))
+
+
+class TestMultiBusSlaveManager(unittest.TestCase):
+    """Test routing and discovery across several I2C buses"""
+
+    def setUp(self):
+        """Create manager on buses 1 and 3"""
+        buses = {}
+
+        def make_bus(bus=1):
+            buses[bus] = FakeSMBus(bus)
+            buses[bus].present.add(0x20 + bus)
+            return buses[bus]
+
+        patcher = patch.object(slave_board.smbus2, 'SMBus', make_bus)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.buses = buses
+        self.manager = create_slave_board_manager(buses=[1, 3], auto_discover=False)
+
+    def test_factory_returns_multi_bus_manager(self):
+        """Test factory picks the multi-bus manager for several buses"""
+        self.assertIsInstance(self.manager, MultiBusSlaveManager)
+
+    def test_discover_slaves_per_bus(self):
+        """Test discovery result is keyed by bus"""
+        self.assertEqual(self.manager.discover_slaves(), {1: [0x21], 3: [0x23]})
+
+    def test_slave_routed_to_its_bus(self):
+        """Test operations go to the bus the slave was added on"""
+        self.assertTrue(self.manager.add_slave(SlaveConfig(
+            slave_id=7, slave_type=SlaveType.PWM_OUTPUT, address=0x23
+        ), bus=3))
+
+        self.assertTrue(self.manager.write_pwm_output(7, 0, 1.0))
+        self.assertFalse(self.manager.write_pwm_output(8, 0, 1.0))
+
+        self.assertEqual(self.buses[1].transactions, [])
+        self.assertEqual(len(self.buses[3].transactions), 1)
+        self.assertEqual(self.manager.get_statistics()['buses'][3]['write_count'], 1)
+
+
+class TestSlaveBoardFactory(unittest.TestCase):
+    """Test manager selection in create_slave_board_manager"""
+
+    def test_unopenable_bus_falls_back_to_stub(self):
+        """Test a bus that fails to open yields the stub"""
+        missing = FileNotFoundError(2, "No such device")
+        with patch.object(slave_board.smbus2, 'SMBus', side_effect=missing):
+            with self.assertRaises(ConnectionError):
+                SlaveBoardI2C(bus=7, auto_discover=False)
+            manager = create_slave_board_manager(bus=7, auto_discover=False)
+
+        self.assertIsInstance(manager, SlaveBoardStub)
+
+    def test_closed_manager_reports_errors(self):
+        """Test I/O after close fails through the normal error path"""
+        with patch.object(slave_board.smbus2, 'SMBus', FakeSMBus):
+            manager = create_slave_board_manager(bus=1, auto_discover=False)
+        manager.add_slave(SlaveConfig(slave_id=1, slave_type=SlaveType.DIGITAL_IO, address=0x20))
+        manager.close()
+
+        self.assertIsNone(manager.read_digital_input(1, 0))
+        self.assertEqual(manager.discover_slaves(), [])
+        self.assertEqual(manager.get_statistics()['error_count'], 1)
+
+    def test_async_after_close_starts_no_worker(self):
+        """Test async commands after close resolve at once without a worker"""
+        with patch.object(slave_board.smbus2, 'SMBus', FakeSMBus):
+            manager = create_slave_board_manager(bus=1, auto_discover=False)
+        manager.add_slave(SlaveConfig(slave_id=1, slave_type=SlaveType.DIGITAL_IO, address=0x20))
+        manager.close()
+
+        future = manager.read_digital_input_async(1, 0)
+
+        self.assertTrue(future.done())
+        self.assertIsNone(future.result())
+        self.assertIsNone(manager._worker)
+        self.assertNotIn('i2c-worker', [t.name for t in threading.enumerate()])
+
+
+class TestSlaveBoardStub(unittest.TestCase):
+    """Test stub implementation (no hardware required)"""
+
+    def test_stub_operations(self):
+        """Test stub returns neutral values"""
+        stub = SlaveBoardStub()
+
+        self.assertEqual(stub.discover_slaves(), [])
+        self.assertIsNone(stub.read_analog_input(1, 0))
+        self.assertFalse(stub.write_pwm_output(1, 0, 0.5))
+        self.assertTrue(stub.get_statistics()['stub'])
+
+
+if __name__ == '__main__':
+    unittest.main()
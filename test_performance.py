@@ -11,6 +11,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python-control-layer
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python-ai-layer'))
 
 from data_aggregator import DataAggregator, SensorReading
+import gcode_parser
+from gcode_parser import GCodeParser
 from anomaly_detector import StatisticalAnomalyDetector
 from wear_predictor import SimpleWearPredictor
 from optimizer import OptimizationRecommender
@@ -378,6 +380,71 @@ class TestDataAggregationScalability(unittest.TestCase):
         self.assertGreater(num_readings/insertion_time, 1000, "Should handle > 1000 readings/second")
 
 
+
+class TestGCodeParserPerformance(unittest.TestCase):
+    """Throughput of the G-code parser hot loop across program sizes"""
+
+    PROGRAM_SIZES = (100, 10000)
+
+    @staticmethod
+    def _build_program(num_lines: int) -> str:
+        """Build a realistic milling program with distinct coordinates on every line"""
+        lines = ["G90 G54 G17 (setup)", "T01 M06", "M03 S12000"]
+        for i in range(num_lines - len(lines)):
+            if i % 10 == 9:
+                lines.append(f"N{i} G02 X{i * 0.1:.3f} Y{i * 0.05:.3f} I2.5 J0 F800")
+            elif i % 25 == 24:
+                lines.append(f"N{i} G00 Z5.0 (retract)")
+            else:
+                lines.append(f"N{i} G01 X{i * 0.1:.3f} Y{-i * 0.05:.3f} Z-1.5 F{500 + i % 7 * 50}")
+        return "\n".join(lines)
+
+    def setUp(self):
+        """Set up parser with an empty line cache"""
+        self.parser = GCodeParser()
+        gcode_parser._parse_line_cached.cache_clear()
+
+    def test_parse_program_throughput(self):
+        """Test parse_program throughput for cold (uncached) programs"""
+        print(f"\nG-code Parser Throughput:")
+        for num_lines in self.PROGRAM_SIZES:
+            program = self._build_program(num_lines)
+            iterations = max(1, 20000 // num_lines)
+            times = []
+
+            for _ in range(iterations):
+                gcode_parser._parse_line_cached.cache_clear()
+                start_time = time.perf_counter()
+                commands = self.parser.parse_program(program)
+                times.append(time.perf_counter() - start_time)
+
+            self.assertEqual(len(commands), num_lines)
+            best_time = min(times)
+            lines_per_second = num_lines / best_time
+            print(f"  {num_lines} lines: {best_time * 1000:.2f}ms "
+                  f"({lines_per_second:.0f} lines/second)")
+
+            self.assertGreater(lines_per_second, 5000, "Should parse > 5000 lines/second")
+
+    def test_parse_program_repeated_throughput(self):
+        """Test that re-parsing the same program is served from the line cache"""
+        program = self._build_program(1000)
+
+        start_time = time.perf_counter()
+        self.parser.parse_program(program)
+        cold_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        self.parser.parse_program(program)
+        warm_time = time.perf_counter() - start_time
+
+        print(f"\nG-code Parser Repeated Program:")
+        print(f"  Cold: {cold_time * 1000:.2f}ms")
+        print(f"  Warm: {warm_time * 1000:.2f}ms")
+
+        self.assertLess(warm_time, cold_time, "Cached re-parse should beat the first parse")
+
+
 if __name__ == '__main__':
     # Run tests with verbose output
     unittest.main(verbosity=2)